@@ -2,8 +2,10 @@ from functools import partial
 
 from fastapi import FastAPI
 
+from planify import jobs
 from planify.api import dependencies
 from planify.api.main_factory import create_app
+from planify.api.utils.hashing import PasswordHasher
 from planify.common.config_loader import ConfigLoader
 from planify.infrastructure.di.db import DbProvider
 
@@ -16,7 +18,9 @@ def main() -> FastAPI:
     config_loader = ConfigLoader()
     app = create_app()
     db_provider = DbProvider(config_loader.db_config)
-    dependencies.setup(app, db_provider, config_loader.api_config)
+    password_hasher = PasswordHasher(config_loader.api_config.hashing)
+    dependencies.setup(app, db_provider, config_loader.api_config, password_hasher)
+    jobs.setup(app, db_provider, config_loader.jobs_config, password_hasher)
 
     app.add_event_handler("shutdown", partial(on_shutdown, db_provider))
     return app
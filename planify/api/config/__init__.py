@@ -1 +1 @@
-from .main import ApiConfig, AuthConfig
+from .main import ApiConfig, AuthConfig, HashingConfig
@@ -9,3 +9,4 @@ class AuthConfig:
     access_token_expiration: timedelta
     refresh_token_expiration: timedelta
     max_refresh_sessions_count: int
+    token_cache_size: int
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class HashingExecutorType(Enum):
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+@dataclass(frozen=True)
+class HashingConfig:
+    executor_type: HashingExecutorType
+    max_workers: int
+    max_in_flight: int
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 
 from .auth import AuthConfig
+from .hashing import HashingConfig
 
 
 @dataclass(frozen=True)
 class ApiConfig:
     auth: AuthConfig
+    hashing: HashingConfig
     enable_logging: bool = False
@@ -2,12 +2,19 @@ from fastapi import FastAPI
 
 from planify.api.config import ApiConfig
 from planify.api.dependencies.auth import AuthProvider, current_user, get_auth_provider
-from planify.infrastructure.di.db import DbProvider, dao_provider
+from planify.api.dependencies.workspace import workspace_context
+from planify.api.utils.hashing import PasswordHasher
+from planify.infrastructure.di.db import DbProvider, dao_provider, dao_factory
 
 
-def setup(app: FastAPI, db_provider: DbProvider, config: ApiConfig):
-    auth_provider = AuthProvider(config.auth)
+def setup(app: FastAPI, db_provider: DbProvider, config: ApiConfig, password_hasher: PasswordHasher | None = None):
+    password_hasher = password_hasher or PasswordHasher(config.hashing)
+    auth_provider = AuthProvider(config.auth, password_hasher)
 
     app.dependency_overrides[dao_provider] = db_provider.get_dao
+    app.dependency_overrides[dao_factory] = lambda: db_provider.dao
     app.dependency_overrides[current_user] = auth_provider.get_current_user
+    app.dependency_overrides[workspace_context] = auth_provider.get_workspace_context
     app.dependency_overrides[get_auth_provider] = lambda: auth_provider
+
+    app.add_event_handler("shutdown", password_hasher.shutdown)
@@ -1,9 +1,11 @@
+import hashlib
 import logging
+import time
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import Annotated
 from uuid import UUID, uuid4
 
-import bcrypt
 from fastapi import HTTPException, Depends
 from jose import jwt, JWTError
 from starlette import status
@@ -11,12 +13,14 @@ from starlette import status
 from planify.api.config import AuthConfig
 from planify.api.models.auth import JwtToken, Tokens, RefreshTokenCreate
 from planify.api.utils.auth import CustomAuthHeader
+from planify.api.utils.hashing import PasswordHasher
 from planify.common import dt_utils
+from planify.common.cache import TTLCache, CacheStats
 from planify.core.models import dto
-from planify.core.services.refresh_session import add_refresh_session, verify_refresh_session
-from planify.core.utils.exceptions import NoUsernameFound, InvalidRefreshSession
+from planify.core.services.refresh_session import add_refresh_session, rotate_refresh_session
+from planify.core.utils.exceptions import NoUsernameFound, InvalidRefreshSession, NoUserFound
 from planify.infrastructure.db.dao.holder import HolderDAO
-from planify.infrastructure.db.dao.rdb import UserDAO
+from planify.infrastructure.db.dao.rdb import UserDAO, WorkspaceMemberDAO
 from planify.infrastructure.di.db import dao_provider
 
 logger = logging.getLogger(__name__)
@@ -32,22 +36,30 @@ def current_user(token: JwtToken = Depends(auth_header)):
     raise NotImplementedError
 
 
+@dataclass(frozen=True)
+class VerifiedToken:
+    sub: str
+    expires_at: float
+
+
 class AuthProperties:
-    def __init__(self, config: AuthConfig) -> None:
+    def __init__(self, config: AuthConfig, password_hasher: PasswordHasher) -> None:
         super().__init__()
         self._config = config
+        self._password_hasher = password_hasher
         self._secret_key = config.secret_key
         self._algorythm = "HS256"
+        self._token_cache: TTLCache[bytes, VerifiedToken] = TTLCache(max_size=config.token_cache_size)
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(
-            password=plain_password.encode("utf-8"),
-            hashed_password=hashed_password.encode("utf-8"),
-        )
+    @property
+    def token_cache_stats(self) -> CacheStats:
+        return self._token_cache.stats
 
-    def get_password_hash(self, password: str) -> str:
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password=password.encode("utf-8"), salt=salt).decode("utf-8")
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._password_hasher.verify(plain_password, hashed_password)
+
+    async def get_password_hash(self, password: str) -> str:
+        return await self._password_hasher.hash(password)
 
     async def authenticate_user(self, username: str, password: str, dao: UserDAO) -> dto.User:
         http_status_401 = HTTPException(
@@ -59,7 +71,7 @@ class AuthProperties:
             user = await dao.get_by_username_with_password(username)
         except NoUsernameFound as e:
             raise http_status_401 from e
-        if not self.verify_password(password, user.hashed_password or ""):
+        if not await self.verify_password(password, user.hashed_password or ""):
             raise http_status_401
         return user.without_password()
 
@@ -69,6 +81,11 @@ class AuthProperties:
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+        token_digest = hashlib.sha256(token.encode("utf-8")).digest()
+        verified_token = self._token_cache.get(token_digest)
+        if verified_token is not None and verified_token.expires_at > time.time():
+            return verified_token.sub
+
         try:
             payload = jwt.decode(
                 token,
@@ -79,6 +96,12 @@ class AuthProperties:
                 logger.warning("valid jwt contains no user id")
                 raise credentials_exception
 
+            if isinstance(payload.get("exp"), (int, float)):
+                self._token_cache.set(
+                    token_digest,
+                    VerifiedToken(sub=payload["sub"], expires_at=payload["exp"]),
+                    ttl=payload["exp"] - time.time(),
+                )
             return payload["sub"]
         except JWTError as e:
             logger.info("invalid jwt", exc_info=e)
@@ -101,31 +124,14 @@ class AuthProperties:
             logger.warning("Cannot get refresh session id from token", exc_info=e)
             raise InvalidRefreshSession
 
-    async def _create_tokens(
-        self,
-        user_id: UUID,
-        refresh_model: RefreshTokenCreate,
-        dao: HolderDAO,
-    ) -> Tokens:
-        new_refresh_session = await add_refresh_session(
-            refresh_session=dto.RefreshSession(
-                id=uuid4(),
-                user_id=user_id,
-                device=refresh_model.device,
-                fingerprint=refresh_model.fingerprint,
-                ip=refresh_model.ip,
-                expires_in=dt_utils.now() + self._config.refresh_token_expiration,
-            ),
-            dao=dao.refresh_session,
-            max_refresh_sessions_count=self._config.max_refresh_sessions_count,
-        )
+    def _create_tokens(self, refresh_session: dto.RefreshSession) -> Tokens:
         return Tokens(
             access=self._create_jwt_token(
-                data={"sub": str(new_refresh_session.user_id)},
+                data={"sub": str(refresh_session.user_id)},
                 expires_delta=self._config.access_token_expiration,
             ),
             refresh=self._create_jwt_token(
-                data={"sub": str(new_refresh_session.id)},
+                data={"sub": str(refresh_session.id)},
                 expires_delta=self._config.refresh_token_expiration,
             ),
         )
@@ -136,34 +142,56 @@ class AuthProperties:
         refresh_model: RefreshTokenCreate,
         dao: HolderDAO,
     ) -> Tokens:
-        old_refresh_session = await verify_refresh_session(
+        new_refresh_session = await rotate_refresh_session(
             refresh_session_id=self.get_refresh_session_id_by_token(refresh_token.token),
-            new_fingerprint=refresh_model.fingerprint,
+            new_refresh_session_id=uuid4(),
+            fingerprint=refresh_model.fingerprint,
+            device=refresh_model.device,
+            ip=refresh_model.ip,
+            expires_in=dt_utils.now() + self._config.refresh_token_expiration,
             dao=dao.refresh_session,
+            max_refresh_sessions_count=self._config.max_refresh_sessions_count,
         )
-        tokens = await self._create_tokens(user_id=old_refresh_session.user_id, refresh_model=refresh_model, dao=dao)
-        return tokens
+        return self._create_tokens(new_refresh_session)
 
     async def create_user_tokens(self, user: dto.User, refresh_model: RefreshTokenCreate, dao: HolderDAO) -> Tokens:
-        tokens = await self._create_tokens(user_id=user.id, refresh_model=refresh_model, dao=dao)
-        return tokens
+        new_refresh_session = await add_refresh_session(
+            refresh_session=dto.RefreshSession(
+                id=uuid4(),
+                user_id=user.id,
+                device=refresh_model.device,
+                fingerprint=refresh_model.fingerprint,
+                ip=refresh_model.ip,
+                expires_in=dt_utils.now() + self._config.refresh_token_expiration,
+            ),
+            dao=dao.refresh_session,
+            max_refresh_sessions_count=self._config.max_refresh_sessions_count,
+        )
+        return self._create_tokens(new_refresh_session)
 
-    async def get_current_user(
-        self,
-        access_token: JwtToken,
-        dao: UserDAO,
-    ) -> dto.User:
+    def _get_user_id(self, access_token: JwtToken) -> UUID:
         credentials_exception = HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
         try:
-            user_id = UUID(self._get_jwt_token_sub(access_token.token))
+            return UUID(self._get_jwt_token_sub(access_token.token))
         except (ValueError, TypeError, AttributeError) as e:
             logger.warning("Cannot get user id from token", exc_info=e)
             raise credentials_exception
 
+    async def get_current_user(
+        self,
+        access_token: JwtToken,
+        dao: UserDAO,
+    ) -> dto.User:
+        credentials_exception = HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+        user_id = self._get_user_id(access_token)
         try:
             user = await dao.get_by_id(user_id)
         except Exception as e:
@@ -171,11 +199,30 @@ class AuthProperties:
             raise credentials_exception from e
         return user
 
+    async def get_workspace_context(
+        self,
+        access_token: JwtToken,
+        workspace_id: int,
+        dao: WorkspaceMemberDAO,
+    ) -> dto.WorkspaceContext:
+        credentials_exception = HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+        user_id = self._get_user_id(access_token)
+        try:
+            context = await dao.get_context(user_id, workspace_id)
+        except NoUserFound as e:
+            logger.info(f"user by id {user_id} not found")
+            raise credentials_exception from e
+        return context
+
 
 class AuthProvider:
-    def __init__(self, config: AuthConfig):
+    def __init__(self, config: AuthConfig, password_hasher: PasswordHasher):
         self._config = config
-        self._properties = AuthProperties(config)
+        self._properties = AuthProperties(config, password_hasher)
 
     @property
     def properties(self) -> AuthProperties:
@@ -187,3 +234,11 @@ class AuthProvider:
         dao: Annotated[HolderDAO, Depends(dao_provider)],
     ) -> dto.User:
         return await self._properties.get_current_user(token, dao.user)
+
+    async def get_workspace_context(
+        self,
+        workspace_id: int,
+        token: Annotated[JwtToken, Depends(auth_header)],
+        dao: Annotated[HolderDAO, Depends(dao_provider)],
+    ) -> dto.WorkspaceContext:
+        return await self._properties.get_workspace_context(token, workspace_id, dao.workspace_member)
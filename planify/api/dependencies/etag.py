@@ -0,0 +1,46 @@
+import re
+from typing import Annotated
+
+from fastapi import Depends, Header, HTTPException, Response, status
+
+from planify.api.dependencies.workspace import check_workspace
+from planify.core.utils.exceptions import StaleVersion
+from planify.infrastructure.db.dao.holder import HolderDAO
+from planify.infrastructure.di.db import dao_provider
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+async def workspace_etag(
+    workspace_id: Annotated[int, Depends(check_workspace())],
+    response: Response,
+    dao: Annotated[HolderDAO, Depends(dao_provider)],
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> str:
+    # answers 304 before the list query runs when nothing in the workspace has changed
+    etag = f'W/"{workspace_id}.{await dao.workspace.get_generation(workspace_id)}"'
+    if if_none_match is not None and _matches(if_none_match, etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return etag
+
+
+def version_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+async def if_match_versions(if_match: Annotated[str | None, Header()] = None) -> tuple[int, ...] | None:
+    # single tasks, projects and members are tagged with their row version, a weak or foreign tag never matches
+    if if_match is None:
+        return None
+    tags = [tag.strip() for tag in if_match.split(",")]
+    if "*" in tags:
+        return None
+    versions = tuple(int(match[1]) for tag in tags if (match := re.fullmatch(r'"([0-9]+)"', tag)))
+    if not versions:
+        raise StaleVersion
+    return versions
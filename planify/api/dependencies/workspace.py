@@ -1,23 +1,46 @@
+from functools import cache
 from typing import Annotated
 
 from fastapi import Depends
 
-from planify.api.dependencies.auth import current_user
+from planify.api.dependencies.auth import auth_header
+from planify.api.models.auth import JwtToken
 from planify.core.models import dto
 from planify.core.models.enums.workspace import WorkspaceMemberRole
 from planify.core.utils.exceptions import NoWorkspaceFound
-from planify.infrastructure.db.dao.holder import HolderDAO
-from planify.infrastructure.di.db import dao_provider
 
 
-def check_workspace(roles: list[WorkspaceMemberRole] | None = None):
+def workspace_context(workspace_id: int, token: JwtToken = Depends(auth_header)) -> dto.WorkspaceContext:
+    raise NotImplementedError
+
+
+# FastAPI caches a dependency per request by the callable, so every role set gets one shared instance
+# and a check declared by both a route and its dependencies runs once
+@cache
+def _check_workspace_context(roles: tuple[WorkspaceMemberRole, ...]):
     async def wrapper(
-        workspace_id: int,
-        user: Annotated[dto.User, Depends(current_user)],
-        dao: Annotated[HolderDAO, Depends(dao_provider)],
-    ) -> int:
-        if not await dao.workspace_member.is_member(user_id=user.id, workspace_id=workspace_id, roles=roles):
+        context: Annotated[dto.WorkspaceContext, Depends(workspace_context)],
+    ) -> dto.WorkspaceContext:
+        if not context.has_role(list(roles)):
             raise NoWorkspaceFound
-        return workspace_id
+        return context
 
     return wrapper
+
+
+@cache
+def _check_workspace(roles: tuple[WorkspaceMemberRole, ...]):
+    async def wrapper(
+        context: Annotated[dto.WorkspaceContext, Depends(_check_workspace_context(roles))],
+    ) -> int:
+        return context.workspace_id
+
+    return wrapper
+
+
+def check_workspace_context(roles: list[WorkspaceMemberRole] | None = None):
+    return _check_workspace_context(tuple(roles or ()))
+
+
+def check_workspace(roles: list[WorkspaceMemberRole] | None = None):
+    return _check_workspace(tuple(roles or ()))
@@ -0,0 +1,100 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+import bcrypt
+
+from planify.api.config import HashingConfig
+from planify.api.config.hashing import HashingExecutorType
+
+T = TypeVar("T")
+
+
+def hash_password(password: str) -> str:
+    salt = bcrypt.gensalt()
+    return bcrypt.hashpw(password=password.encode("utf-8"), salt=salt).decode("utf-8")
+
+
+def check_password(plain_password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(
+        password=plain_password.encode("utf-8"),
+        hashed_password=hashed_password.encode("utf-8"),
+    )
+
+
+@dataclass(frozen=True)
+class HashingStats:
+    max_workers: int
+    max_in_flight: int
+    in_flight: int
+    waiting: int
+    peak_waiting: int
+    completed: int
+
+    @property
+    def queue_depth(self) -> int:
+        # calls waiting for an in-flight slot plus calls queued inside the executor
+        return self.waiting + max(0, self.in_flight - self.max_workers)
+
+
+class PasswordHasher:
+    def __init__(self, config: HashingConfig):
+        self._config = config
+        self._executor = self._create_executor(config)
+        self._semaphore = asyncio.Semaphore(config.max_in_flight)
+        self._in_flight = 0
+        self._waiting = 0
+        self._peak_waiting = 0
+        self._completed = 0
+
+    @staticmethod
+    def _create_executor(config: HashingConfig) -> Executor:
+        if config.executor_type == HashingExecutorType.PROCESS:
+            return ProcessPoolExecutor(max_workers=config.max_workers)
+        return ThreadPoolExecutor(max_workers=config.max_workers, thread_name_prefix="password-hasher")
+
+    @property
+    def stats(self) -> HashingStats:
+        return HashingStats(
+            max_workers=self._config.max_workers,
+            max_in_flight=self._config.max_in_flight,
+            in_flight=self._in_flight,
+            waiting=self._waiting,
+            peak_waiting=self._peak_waiting,
+            completed=self._completed,
+        )
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(check_password, plain_password, hashed_password)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self._semaphore.locked():
+            self._waiting += 1
+            self._peak_waiting = max(self._peak_waiting, self._waiting)
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self._waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+            self._semaphore.release()
+
+    def collect_stats(self) -> HashingStats:
+        stats = self.stats
+        # the peak covers one collection interval
+        self._peak_waiting = self._waiting
+        return stats
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,20 @@
+from typing import Iterable
+from uuid import UUID
+
+from planify.api.v1.models.response.included import IncludedResponseModel
+from planify.api.v1.models.response.user import UserResponseModel
+from planify.infrastructure.db.dao.holder import HolderDAO
+
+
+async def collect_included(
+    dao: HolderDAO,
+    workspace_id: int,
+    user_ids: Iterable[UUID | None] = (),
+    project_ids: Iterable[int | None] = (),
+) -> IncludedResponseModel:
+    user_ids = [user_id for user_id in dict.fromkeys(user_ids) if user_id is not None]
+    project_ids = [project_id for project_id in dict.fromkeys(project_ids) if project_id is not None]
+    return IncludedResponseModel(
+        users=[UserResponseModel.from_dto(user) for user in await dao.user.get_by_ids(user_ids)],
+        projects=await dao.project.get_by_ids(project_ids, workspace_id),
+    )
@@ -0,0 +1,31 @@
+from typing import AsyncIterator, Callable, TypeVar
+
+from pydantic import TypeAdapter
+
+from planify.infrastructure.db.dao.holder import HolderDAO
+from planify.infrastructure.di.db import DaoFactory
+
+T = TypeVar("T")
+
+FLUSH_SIZE = 64 * 1024
+
+
+async def stream_json_array(
+    dao_factory: DaoFactory,
+    fetch: Callable[[HolderDAO], AsyncIterator[T]],
+    adapter: TypeAdapter[T],
+) -> AsyncIterator[bytes]:
+    # the request scoped session is closed before the body is sent, so the stream owns its own one
+    async with dao_factory() as dao:
+        chunk = bytearray(b"[")
+        first = True
+        async for item in fetch(dao):
+            if not first:
+                chunk += b","
+            chunk += adapter.dump_json(item)
+            first = False
+            if len(chunk) >= FLUSH_SIZE:
+                yield bytes(chunk)
+                chunk.clear()
+        chunk += b"]"
+        yield bytes(chunk)
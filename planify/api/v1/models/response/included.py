@@ -0,0 +1,10 @@
+from dataclasses import dataclass, field
+
+from planify.core.models import dto
+from .user import UserResponseModel
+
+
+@dataclass
+class IncludedResponseModel:
+    users: list[UserResponseModel] = field(default_factory=list)
+    projects: list[dto.Project] = field(default_factory=list)
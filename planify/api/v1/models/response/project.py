@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from planify.core.models import dto
+from .included import IncludedResponseModel
+
+
+@dataclass
+class ProjectListResponseModel:
+    items: list[dto.Project]
+    included: IncludedResponseModel
@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from planify.core.models import dto
+from planify.core.models.enums.task import TaskPriority, TaskStatus
+from .included import IncludedResponseModel
+
+
+# lists never load the description, the task endpoint returns it
+@dataclass
+class TaskListItemResponseModel:
+    id: int
+    name: str
+    priority: TaskPriority
+    status: TaskStatus
+    workspace_id: int
+    deadline: datetime | None = None
+    project_id: int | None = None
+    author_id: UUID | None = None
+    performer_id: UUID | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    version: int | None = None
+
+    author: dto.User | None = None
+    performer: dto.User | None = None
+    project: dto.Project | None = None
+
+    @classmethod
+    def from_dto(cls, task_dto: dto.Task) -> "TaskListItemResponseModel":
+        return cls(
+            id=task_dto.id,
+            name=task_dto.name,
+            priority=task_dto.priority,
+            status=task_dto.status,
+            workspace_id=task_dto.workspace_id,
+            deadline=task_dto.deadline,
+            project_id=task_dto.project_id,
+            author_id=task_dto.author_id,
+            performer_id=task_dto.performer_id,
+            created_at=task_dto.created_at,
+            updated_at=task_dto.updated_at,
+            version=task_dto.version,
+            author=task_dto.author,
+            performer=task_dto.performer,
+            project=task_dto.project,
+        )
+
+
+@dataclass
+class TaskPageResponseModel:
+    items: list[TaskListItemResponseModel]
+    next_cursor: str | None = None
+    included: IncludedResponseModel | None = None
@@ -19,3 +19,9 @@ class UserResponseModel:
             first_name=user_dto.first_name,
             last_name=user_dto.last_name,
         )
+
+
+@dataclass
+class UserPageResponseModel:
+    items: list[UserResponseModel]
+    next_cursor: str | None = None
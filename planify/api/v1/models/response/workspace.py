@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from planify.core.models import dto
 from planify.core.models.enums.workspace import WorkspaceMemberRole
@@ -11,6 +11,7 @@ class WorkspaceMemberResponseModel:
     workspace_id: int
     role: WorkspaceMemberRole
     active: bool
+    version: int | None = None
 
     @classmethod
     def from_dto(cls, workspace_member_dto: dto.WorkspaceMember) -> "WorkspaceMemberResponseModel":
@@ -19,4 +20,18 @@ class WorkspaceMemberResponseModel:
             workspace_id=workspace_member_dto.workspace_id,
             role=workspace_member_dto.role,
             active=workspace_member_dto.active,
+            version=workspace_member_dto.version,
         )
+
+
+@dataclass
+class WorkspaceChangesResponseModel:
+    items: list[dto.WorkspaceChange]
+    next_cursor: str
+    # the cursor is too old, reload the lists and continue from next_cursor
+    reset: bool = False
+    has_more: bool = False
+    # current state of the entities upserted by the returned changes
+    tasks: list[dto.Task] = field(default_factory=list)
+    projects: list[dto.Project] = field(default_factory=list)
+    members: list[WorkspaceMemberResponseModel] = field(default_factory=list)
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 
 from planify.core.models import dto
 
@@ -27,3 +27,23 @@ class EditProjectModel(BaseModel):
             author_id=self.author_id,
             manager_id=self.manager_id,
         )
+
+
+class PatchProjectModel(BaseModel):
+    name: str | None = None
+    description: str | None = None
+    author_id: UUID | None = None
+    manager_id: UUID | None = None
+
+    @model_validator(mode="after")
+    def check_required(self) -> "PatchProjectModel":
+        if "name" in self.model_fields_set and self.name is None:
+            raise ValueError("name cannot be null")
+        return self
+
+    def to_dto(self, project_id: int, workspace_id: int) -> dto.ProjectPatch:
+        return dto.ProjectPatch(
+            id=project_id,
+            workspace_id=workspace_id,
+            changes=self.model_dump(include=self.model_fields_set),
+        )
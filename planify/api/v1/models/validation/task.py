@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 from planify.core.models import dto
 from planify.core.models.enums.task import TaskStatus, TaskPriority
@@ -23,6 +23,17 @@ class CreateTaskModel(BaseModel):
         )
 
 
+class BulkCreateTaskModel(CreateTaskModel):
+    performer_id: UUID | None = None
+    project_id: int | None = None
+
+    def to_dto(self, author_id: UUID, workspace_id: int) -> dto.Task:
+        task = super().to_dto(author_id, workspace_id)
+        task.performer_id = self.performer_id
+        task.project_id = self.project_id
+        return task
+
+
 class EditTaskModel(BaseModel):
     name: str
     description: str | None = None
@@ -46,3 +57,71 @@ class EditTaskModel(BaseModel):
             project_id=self.project_id,
             workspace_id=workspace_id,
         )
+
+
+class PatchTaskModel(BaseModel):
+    name: str | None = None
+    description: str | None = None
+    status: TaskStatus | None = None
+    priority: TaskPriority | None = None
+    deadline: datetime | None = None
+    author_id: UUID | None = None
+    performer_id: UUID | None = None
+    project_id: int | None = None
+
+    @model_validator(mode="after")
+    def check_required(self) -> "PatchTaskModel":
+        required = {"name", "status", "priority", "author_id"}
+        if any(getattr(self, name) is None for name in self.model_fields_set & required):
+            raise ValueError("name, status, priority and author_id cannot be null")
+        return self
+
+    def to_dto(self, task_id: int, workspace_id: int) -> dto.TaskPatch:
+        return dto.TaskPatch(
+            id=task_id,
+            workspace_id=workspace_id,
+            changes=self.model_dump(include=self.model_fields_set),
+        )
+
+
+class TaskFilterModel(BaseModel):
+    status: TaskStatus | None = None
+    priority: TaskPriority | None = None
+    performer_id: UUID | None = None
+    project_id: int | None = None
+    deadline_from: datetime | None = None
+    deadline_to: datetime | None = None
+
+    def to_dto(self) -> dto.TaskFilter:
+        return dto.TaskFilter(
+            status=self.status,
+            priority=self.priority,
+            performer_id=self.performer_id,
+            project_id=self.project_id,
+            deadline_from=self.deadline_from,
+            deadline_to=self.deadline_to,
+        )
+
+
+class TransitionTasksModel(BaseModel):
+    task_ids: list[int] = Field(min_length=1, max_length=1000)
+    status: TaskStatus | None = None
+    priority: TaskPriority | None = None
+    performer_id: UUID | None = None
+    project_id: int | None = None
+
+    @model_validator(mode="after")
+    def check_changes(self) -> "TransitionTasksModel":
+        changes = self.model_fields_set - {"task_ids"}
+        if not changes:
+            raise ValueError("Please provide at least one of status, priority, performer_id or project_id")
+        if (self.status is None and "status" in changes) or (self.priority is None and "priority" in changes):
+            raise ValueError("status and priority cannot be null")
+        return self
+
+    def to_dto(self, workspace_id: int) -> dto.TaskTransition:
+        return dto.TaskTransition(
+            workspace_id=workspace_id,
+            task_ids=list(dict.fromkeys(self.task_ids)),
+            changes=self.model_dump(include=self.model_fields_set - {"task_ids"}),
+        )
@@ -1,7 +1,7 @@
 from enum import Enum
 from uuid import UUID
 
-from pydantic import BaseModel, constr
+from pydantic import BaseModel, constr, model_validator
 
 from planify.core.models import dto
 from planify.core.models.enums.workspace import WorkspaceMemberRole
@@ -22,6 +22,19 @@ class EditWorkspaceModel(WorkspaceModel):
     pass
 
 
+class PatchWorkspaceModel(BaseModel):
+    name: constr(min_length=1, max_length=50) | None = None
+
+    @model_validator(mode="after")
+    def check_required(self) -> "PatchWorkspaceModel":
+        if "name" in self.model_fields_set and self.name is None:
+            raise ValueError("name cannot be null")
+        return self
+
+    def to_dto(self, workspace_id: int) -> dto.WorkspacePatch:
+        return dto.WorkspacePatch(id=workspace_id, changes=self.model_dump(include=self.model_fields_set))
+
+
 class AddWorkspaceMemberRole(Enum):
     ADMIN = "admin"
     EDITOR = "editor"
@@ -1,47 +1,75 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
-from planify.api.dependencies import current_user
-from planify.api.dependencies.workspace import check_workspace
-from planify.api.v1.models.validation.project import CreateProjectModel, EditProjectModel
+from planify.api.dependencies.etag import if_match_versions, version_etag, workspace_etag
+from planify.api.dependencies.workspace import check_workspace, check_workspace_context
+from planify.api.utils.included import collect_included
+from planify.api.utils.streaming import stream_json_array
+from planify.api.v1.models.response.project import ProjectListResponseModel
+from planify.api.v1.models.validation.project import CreateProjectModel, EditProjectModel, PatchProjectModel
 from planify.core.models import dto
 from planify.core.models.enums.workspace import WorkspaceMemberRole
 from planify.core.services import project as services
-from planify.core.utils.exceptions import NoWorkspaceFound
 from planify.infrastructure.db.dao.holder import HolderDAO
-from planify.infrastructure.di.db import dao_provider
+from planify.infrastructure.di.db import DaoFactory, dao_provider, dao_factory
 
 
 async def get_project(
     project_id: int,
     workspace_id: Annotated[int, Depends(check_workspace())],
     dao: Annotated[HolderDAO, Depends(dao_provider)],
+    response: Response,
 ) -> dto.Project:
-    return await services.get_project(project_id, workspace_id, dao.project)
+    project = await services.get_project(project_id, workspace_id, dao.project)
+    response.headers["ETag"] = version_etag(project.version)
+    return project
 
 
 async def get_projects(
     workspace_id: Annotated[int, Depends(check_workspace())],
     dao: Annotated[HolderDAO, Depends(dao_provider)],
-) -> list[dto.Project]:
-    return await dao.project.get_by_workspace_id(workspace_id)
+    _etag: Annotated[str, Depends(workspace_etag)],
+    normalized: bool = False,
+) -> list[dto.Project] | ProjectListResponseModel:
+    projects = await dao.project.get_by_workspace_id(workspace_id)
+    if not normalized:
+        return projects
+    return ProjectListResponseModel(
+        items=projects,
+        included=await collect_included(
+            dao,
+            workspace_id,
+            user_ids=[user_id for project in projects for user_id in (project.author_id, project.manager_id)],
+        ),
+    )
+
+
+async def export_projects(
+    workspace_id: Annotated[int, Depends(check_workspace())],
+    dao_factory_: Annotated[DaoFactory, Depends(dao_factory)],
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_json_array(
+            dao_factory_, lambda dao: dao.project.stream_by_workspace_id(workspace_id), TypeAdapter(dto.Project)
+        ),
+        media_type="application/json",
+    )
 
 
 async def create_project(
     create_project_model: CreateProjectModel,
-    workspace_id: int,
-    user: Annotated[dto.User, Depends(current_user)],
+    context: Annotated[
+        dto.WorkspaceContext,
+        Depends(check_workspace_context(roles=[WorkspaceMemberRole.ADMIN, WorkspaceMemberRole.OWNER])),
+    ],
     dao: Annotated[HolderDAO, Depends(dao_provider)],
 ) -> dto.Project:
-    if not await dao.workspace_member.is_member(
-        user_id=user.id,
-        workspace_id=workspace_id,
-        roles=[WorkspaceMemberRole.ADMIN, WorkspaceMemberRole.OWNER],
-    ):
-        raise NoWorkspaceFound
-
-    return await services.create_project(create_project_model.to_dto(user.id, workspace_id), dao.project)
+    return await services.create_project(
+        create_project_model.to_dto(context.user.id, context.workspace_id), dao.project
+    )
 
 
 async def edit_project(
@@ -51,12 +79,31 @@ async def edit_project(
         int, Depends(check_workspace(roles=[WorkspaceMemberRole.ADMIN, WorkspaceMemberRole.OWNER]))
     ],
     dao: Annotated[HolderDAO, Depends(dao_provider)],
+    versions: Annotated[tuple[int, ...] | None, Depends(if_match_versions)],
+    response: Response,
+) -> dto.Project:
+    project = await services.edit_project(
+        project=edit_project_model.to_dto(project_id, workspace_id), dao=dao.project, versions=versions
+    )
+    response.headers["ETag"] = version_etag(project.version)
+    return project
+
+
+async def patch_project(
+    project_id: int,
+    patch_project_model: PatchProjectModel,
+    workspace_id: Annotated[
+        int, Depends(check_workspace(roles=[WorkspaceMemberRole.ADMIN, WorkspaceMemberRole.OWNER]))
+    ],
+    dao: Annotated[HolderDAO, Depends(dao_provider)],
+    versions: Annotated[tuple[int, ...] | None, Depends(if_match_versions)],
+    response: Response,
 ) -> dto.Project:
-    return await services.edit_project(
-        project=edit_project_model.to_dto(project_id, workspace_id),
-        project_dao=dao.project,
-        workspace_member_dao=dao.workspace_member,
+    project = await services.patch_project(
+        project_patch=patch_project_model.to_dto(project_id, workspace_id), dao=dao.project, versions=versions
     )
+    response.headers["ETag"] = version_etag(project.version)
+    return project
 
 
 async def remove_project(
@@ -72,8 +119,10 @@ async def remove_project(
 def setup() -> APIRouter:
     router = APIRouter(prefix="/projects", tags=["projects"])
     router.add_api_route("", get_projects, methods=["GET"])
+    router.add_api_route("/export", export_projects, methods=["GET"])
     router.add_api_route("", create_project, methods=["POST"])
     router.add_api_route("/{project_id}", get_project, methods=["GET"])
     router.add_api_route("/{project_id}", edit_project, methods=["PUT"])
+    router.add_api_route("/{project_id}", patch_project, methods=["PATCH"])
     router.add_api_route("/{project_id}", remove_project, methods=["DELETE"])
     return router
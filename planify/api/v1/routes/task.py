@@ -1,47 +1,220 @@
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Body, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
-from planify.api.dependencies import current_user
-from planify.api.dependencies.workspace import check_workspace
-from planify.api.v1.models.validation.task import CreateTaskModel, EditTaskModel
+from planify.api.dependencies.etag import if_match_versions, version_etag, workspace_etag
+from planify.api.dependencies.workspace import check_workspace, check_workspace_context
+from planify.api.utils.included import collect_included
+from planify.api.utils.streaming import stream_json_array
+from planify.api.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, encode_cursor, decode_cursor
+from planify.api.v1.models.response.task import TaskListItemResponseModel, TaskPageResponseModel
+from planify.api.v1.models.validation.task import (
+    BulkCreateTaskModel,
+    CreateTaskModel,
+    EditTaskModel,
+    PatchTaskModel,
+    TaskFilterModel,
+    TransitionTasksModel,
+)
 from planify.core.models import dto
+from planify.core.models.enums.task import TaskSortOrder, TaskPriority
 from planify.core.models.enums.workspace import WorkspaceMemberRole
 from planify.core.services import task as services
-from planify.core.utils.exceptions import NoWorkspaceFound
+from planify.core.utils.exceptions import InvalidCursor
 from planify.infrastructure.db.dao.holder import HolderDAO
-from planify.infrastructure.di.db import dao_provider
+from planify.infrastructure.di.db import DaoFactory, dao_provider, dao_factory
+
+MAX_BULK_CREATE_SIZE = 1000
 
 
 async def get_task(
     task_id: int,
     workspace_id: Annotated[int, Depends(check_workspace())],
     dao: Annotated[HolderDAO, Depends(dao_provider)],
+    response: Response,
 ) -> dto.Task:
-    return await services.get_task(task_id, workspace_id, dao.task)
+    task = await services.get_task(task_id, workspace_id, dao.task)
+    response.headers["ETag"] = version_etag(task.version)
+    return task
+
+
+def _encode_task_cursor(task: dto.Task, sort: TaskSortOrder) -> str:
+    payload = {"sort": sort.value, "id": task.id}
+    match sort:
+        case TaskSortOrder.DEADLINE:
+            payload["value"] = task.deadline.isoformat() if task.deadline is not None else None
+        case TaskSortOrder.PRIORITY:
+            payload["value"] = task.priority.value
+        case TaskSortOrder.RECENTLY_UPDATED:
+            payload["value"] = task.updated_at.isoformat()
+    return encode_cursor(payload)
+
+
+def _decode_task_cursor(cursor: str, sort: TaskSortOrder) -> dto.TaskCursor:
+    payload = decode_cursor(cursor)
+    task_id, value = payload.get("id"), payload.get("value")
+    if payload.get("sort") != sort.value or not isinstance(task_id, int):
+        raise InvalidCursor
+
+    try:
+        match sort:
+            case TaskSortOrder.DEADLINE:
+                return dto.TaskCursor(id=task_id, value=datetime.fromisoformat(value) if value is not None else None)
+            case TaskSortOrder.PRIORITY:
+                return dto.TaskCursor(id=task_id, value=TaskPriority(value))
+            case TaskSortOrder.RECENTLY_UPDATED:
+                return dto.TaskCursor(id=task_id, value=datetime.fromisoformat(value))
+            case _:
+                return dto.TaskCursor(id=task_id)
+    except (TypeError, ValueError) as e:
+        raise InvalidCursor from e
 
 
 async def get_tasks(
     workspace_id: Annotated[int, Depends(check_workspace())],
     dao: Annotated[HolderDAO, Depends(dao_provider)],
-) -> list[dto.Task]:
-    return await dao.task.get_by_workspace_id(workspace_id)
+    _etag: Annotated[str, Depends(workspace_etag)],
+    task_filter: Annotated[TaskFilterModel, Depends()],
+    sort: TaskSortOrder = TaskSortOrder.NEWEST,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    normalized: bool = False,
+) -> TaskPageResponseModel:
+    after = _decode_task_cursor(cursor, sort) if cursor is not None else None
+    tasks = await dao.task.get_page_by_workspace_id(
+        workspace_id,
+        limit=limit + 1,
+        task_filter=task_filter.to_dto(),
+        sort=sort,
+        after=after,
+        with_relations=not normalized,
+    )
+    page = TaskPageResponseModel(items=[TaskListItemResponseModel.from_dto(task) for task in tasks[:limit]])
+    if len(tasks) > limit:
+        page.next_cursor = _encode_task_cursor(tasks[limit - 1], sort)
+    if normalized:
+        page.included = await collect_included(
+            dao,
+            workspace_id,
+            user_ids=[user_id for task in page.items for user_id in (task.author_id, task.performer_id)],
+            project_ids=[task.project_id for task in page.items],
+        )
+    return page
+
+
+async def export_tasks(
+    workspace_id: Annotated[int, Depends(check_workspace())],
+    dao_factory_: Annotated[DaoFactory, Depends(dao_factory)],
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_json_array(
+            dao_factory_, lambda dao: dao.task.stream_by_workspace_id(workspace_id), TypeAdapter(dto.Task)
+        ),
+        media_type="application/json",
+    )
+
+
+async def search_tasks(
+    workspace_id: Annotated[int, Depends(check_workspace())],
+    dao: Annotated[HolderDAO, Depends(dao_provider)],
+    q: Annotated[str, Query(min_length=1, max_length=256)],
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+) -> TaskPageResponseModel:
+    after = None
+    if cursor is not None:
+        payload = decode_cursor(cursor)
+        rank, task_id = payload.get("rank"), payload.get("id")
+        if not isinstance(rank, (int, float)) or not isinstance(task_id, int):
+            raise InvalidCursor
+        after = (rank, task_id)
+
+    hits = await dao.task.search(workspace_id, q, limit=limit + 1, after=after)
+    page = TaskPageResponseModel(items=[TaskListItemResponseModel.from_dto(task) for task, _ in hits[:limit]])
+    if len(hits) > limit:
+        task, rank = hits[limit - 1]
+        page.next_cursor = encode_cursor({"rank": rank, "id": task.id})
+    return page
+
+
+async def get_task_summary(
+    workspace_id: Annotated[int, Depends(check_workspace())],
+    dao: Annotated[HolderDAO, Depends(dao_provider)],
+    _etag: Annotated[str, Depends(workspace_etag)],
+    project_id: int | None = None,
+) -> dto.TaskSummary:
+    return await services.get_task_summary(workspace_id, project_id, dao.task_counter, dao.project)
 
 
 async def create_task(
     create_task_model: CreateTaskModel,
-    workspace_id: int,
-    user: Annotated[dto.User, Depends(current_user)],
+    context: Annotated[
+        dto.WorkspaceContext,
+        Depends(
+            check_workspace_context(
+                roles=[
+                    WorkspaceMemberRole.EDITOR,
+                    WorkspaceMemberRole.ADMIN,
+                    WorkspaceMemberRole.OWNER,
+                ]
+            )
+        ),
+    ],
     dao: Annotated[HolderDAO, Depends(dao_provider)],
 ) -> dto.Task:
-    if not await dao.workspace_member.is_member(
-        user_id=user.id,
-        workspace_id=workspace_id,
-        roles=[WorkspaceMemberRole.EDITOR, WorkspaceMemberRole.ADMIN, WorkspaceMemberRole.OWNER],
-    ):
-        raise NoWorkspaceFound
+    return await services.create_task(create_task_model.to_dto(context.user.id, context.workspace_id), dao.task)
+
+
+async def create_tasks(
+    create_task_models: Annotated[list[BulkCreateTaskModel], Body(min_length=1, max_length=MAX_BULK_CREATE_SIZE)],
+    context: Annotated[
+        dto.WorkspaceContext,
+        Depends(
+            check_workspace_context(
+                roles=[
+                    WorkspaceMemberRole.EDITOR,
+                    WorkspaceMemberRole.ADMIN,
+                    WorkspaceMemberRole.OWNER,
+                ]
+            )
+        ),
+    ],
+    dao: Annotated[HolderDAO, Depends(dao_provider)],
+) -> list[int]:
+    return await services.create_tasks(
+        context.workspace_id,
+        [create_task_model.to_dto(context.user.id, context.workspace_id) for create_task_model in create_task_models],
+        task_dao=dao.task,
+        project_dao=dao.project,
+        workspace_member_dao=dao.workspace_member,
+    )
+
 
-    return await services.create_task(create_task_model.to_dto(user.id, workspace_id), dao.task)
+async def transition_tasks(
+    transition_tasks_model: TransitionTasksModel,
+    workspace_id: Annotated[
+        int,
+        Depends(
+            check_workspace(
+                roles=[
+                    WorkspaceMemberRole.EDITOR,
+                    WorkspaceMemberRole.ADMIN,
+                    WorkspaceMemberRole.OWNER,
+                ]
+            )
+        ),
+    ],
+    dao: Annotated[HolderDAO, Depends(dao_provider)],
+) -> list[int]:
+    return await services.transition_tasks(
+        transition=transition_tasks_model.to_dto(workspace_id),
+        task_dao=dao.task,
+        project_dao=dao.project,
+        workspace_member_dao=dao.workspace_member,
+    )
 
 
 async def edit_task(
@@ -60,13 +233,38 @@ async def edit_task(
         ),
     ],
     dao: Annotated[HolderDAO, Depends(dao_provider)],
+    versions: Annotated[tuple[int, ...] | None, Depends(if_match_versions)],
+    response: Response,
 ) -> dto.Task:
-    return await services.edit_task(
-        task=edit_task_model.to_dto(task_id, workspace_id),
-        task_dao=dao.task,
-        project_dao=dao.project,
-        workspace_member_dao=dao.workspace_member,
+    task = await services.edit_task(task=edit_task_model.to_dto(task_id, workspace_id), dao=dao.task, versions=versions)
+    response.headers["ETag"] = version_etag(task.version)
+    return task
+
+
+async def patch_task(
+    task_id: int,
+    patch_task_model: PatchTaskModel,
+    workspace_id: Annotated[
+        int,
+        Depends(
+            check_workspace(
+                roles=[
+                    WorkspaceMemberRole.EDITOR,
+                    WorkspaceMemberRole.ADMIN,
+                    WorkspaceMemberRole.OWNER,
+                ]
+            )
+        ),
+    ],
+    dao: Annotated[HolderDAO, Depends(dao_provider)],
+    versions: Annotated[tuple[int, ...] | None, Depends(if_match_versions)],
+    response: Response,
+) -> dto.Task:
+    task = await services.patch_task(
+        task_patch=patch_task_model.to_dto(task_id, workspace_id), dao=dao.task, versions=versions
     )
+    response.headers["ETag"] = version_etag(task.version)
+    return task
 
 
 async def remove_task(
@@ -90,8 +288,14 @@ async def remove_task(
 def setup() -> APIRouter:
     router = APIRouter(prefix="/tasks", tags=["tasks"])
     router.add_api_route("", get_tasks, methods=["GET"])
+    router.add_api_route("/export", export_tasks, methods=["GET"])
+    router.add_api_route("/summary", get_task_summary, methods=["GET"])
+    router.add_api_route("/search", search_tasks, methods=["GET"])
+    router.add_api_route("/bulk", create_tasks, methods=["POST"])
+    router.add_api_route("/bulk", transition_tasks, methods=["PATCH"])
     router.add_api_route("", create_task, methods=["POST"])
     router.add_api_route("/{task_id}", get_task, methods=["GET"])
     router.add_api_route("/{task_id}", edit_task, methods=["PUT"])
+    router.add_api_route("/{task_id}", patch_task, methods=["PATCH"])
     router.add_api_route("/{task_id}", remove_task, methods=["DELETE"])
     return router
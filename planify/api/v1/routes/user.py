@@ -4,13 +4,17 @@ from fastapi import APIRouter, Depends, Query
 from pydantic import Field
 
 from planify.api.dependencies.auth import get_auth_provider, AuthProvider, current_user
-from planify.api.v1.models.response.user import UserResponseModel
+from planify.api.utils.pagination import encode_cursor, decode_cursor
+from planify.api.v1.models.response.user import UserResponseModel, UserPageResponseModel
 from planify.api.v1.models.validation.user import CreateUserModel
 from planify.core.models import dto
 from planify.core.services import user as services
+from planify.core.utils.exceptions import InvalidCursor, NoWorkspaceFound
 from planify.infrastructure.db.dao.holder import HolderDAO
 from planify.infrastructure.di.db import dao_provider
 
+MAX_USER_SEARCH_PAGE_SIZE = 50
+
 
 async def get_current_user(user: Annotated[dto.User, Depends(current_user)]) -> dto.User:
     return user
@@ -20,13 +24,29 @@ async def search_users(
     username: Annotated[str, Field(min_length=3, max_length=16, pattern="^[a-zA-Z0-9_]+$")],
     user: Annotated[dto.User, Depends(current_user)],
     dao: Annotated[HolderDAO, Depends(dao_provider)],
-    offset: int = Query(default=0),
-    limit: int = Query(default=10),
-) -> list[UserResponseModel]:
-    return [
-        UserResponseModel.from_dto(user_dto)
-        for user_dto in await dao.user.search_by_username(username=username, offset=offset, limit=limit)
-    ]
+    not_in_workspace_id: int | None = None,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_USER_SEARCH_PAGE_SIZE)] = 10,
+) -> UserPageResponseModel:
+    after = None
+    if cursor is not None:
+        payload = decode_cursor(cursor)
+        rank, after_username = payload.get("rank"), payload.get("username")
+        if not isinstance(rank, (int, float)) or not isinstance(after_username, str):
+            raise InvalidCursor
+        after = (rank, after_username)
+
+    if not_in_workspace_id is not None and not await dao.workspace_member.is_member(user.id, not_in_workspace_id):
+        raise NoWorkspaceFound
+
+    hits = await dao.user.search_by_username(
+        username=username, limit=limit + 1, after=after, exclude_workspace_id=not_in_workspace_id
+    )
+    page = UserPageResponseModel(items=[UserResponseModel.from_dto(user_dto) for user_dto, _ in hits[:limit]])
+    if len(hits) > limit:
+        user_dto, rank = hits[limit - 1]
+        page.next_cursor = encode_cursor({"rank": rank, "username": user_dto.username})
+    return page
 
 
 async def create_user(
@@ -36,7 +56,7 @@ async def create_user(
 ) -> dto.User:
     return await services.create_user(
         user=user.to_dto(),
-        hashed_password=auth_provider.properties.get_password_hash(user.password),
+        hashed_password=await auth_provider.properties.get_password_hash(user.password),
         dao=dao.user,
     )
 
@@ -1,22 +1,29 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from planify.api.dependencies.auth import current_user
+from planify.api.dependencies.etag import if_match_versions, version_etag, workspace_etag
 from planify.api.dependencies.workspace import check_workspace
-from planify.api.v1.models.response.workspace import WorkspaceMemberResponseModel
+from planify.api.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, encode_cursor, decode_cursor
+from planify.api.utils.streaming import stream_json_array
+from planify.api.v1.models.response.workspace import WorkspaceChangesResponseModel, WorkspaceMemberResponseModel
 from planify.api.v1.models.validation.workspace import (
     CreateWorkspaceModel,
     AddMemberModel,
     EditWorkspaceModel,
+    PatchWorkspaceModel,
     EditMemberModel,
 )
 from planify.core.models import dto
-from planify.core.models.enums.workspace import WorkspaceMemberRole
+from planify.core.models.enums.workspace import WorkspaceChangeAction, WorkspaceChangeEntity, WorkspaceMemberRole
 from planify.core.services import workspace as services
+from planify.core.utils.exceptions import InvalidCursor
 from planify.infrastructure.db.dao.holder import HolderDAO
-from planify.infrastructure.di.db import dao_provider
+from planify.infrastructure.di.db import DaoFactory, dao_provider, dao_factory
 
 
 async def get_workspace(
@@ -57,6 +64,17 @@ async def edit_workspace(
     )
 
 
+async def patch_workspace(
+    workspace_id: Annotated[int, Depends(check_workspace(roles=[WorkspaceMemberRole.OWNER]))],
+    patch_workspace_model: PatchWorkspaceModel,
+    dao: Annotated[HolderDAO, Depends(dao_provider)],
+) -> dto.Workspace:
+    return await services.patch_workspace(
+        workspace_patch=patch_workspace_model.to_dto(workspace_id),
+        workspace_dao=dao.workspace,
+    )
+
+
 async def remove_workspace(
     workspace_id: Annotated[int, Depends(check_workspace(roles=[WorkspaceMemberRole.OWNER]))],
     dao: Annotated[HolderDAO, Depends(dao_provider)],
@@ -68,15 +86,17 @@ async def get_workspace_member(
     workspace_id: Annotated[int, Depends(check_workspace())],
     user_id: UUID,
     dao: Annotated[HolderDAO, Depends(dao_provider)],
+    response: Response,
 ) -> WorkspaceMemberResponseModel:
-    return WorkspaceMemberResponseModel.from_dto(
-        await dao.workspace_member.get_member(user_id=user_id, workspace_id=workspace_id)
-    )
+    workspace_member = await dao.workspace_member.get_member(user_id=user_id, workspace_id=workspace_id)
+    response.headers["ETag"] = version_etag(workspace_member.version)
+    return WorkspaceMemberResponseModel.from_dto(workspace_member)
 
 
 async def get_workspace_members(
     workspace_id: Annotated[int, Depends(check_workspace())],
     dao: Annotated[HolderDAO, Depends(dao_provider)],
+    _etag: Annotated[str, Depends(workspace_etag)],
 ) -> list[WorkspaceMemberResponseModel]:
     return [
         WorkspaceMemberResponseModel.from_dto(member_dto)
@@ -84,6 +104,20 @@ async def get_workspace_members(
     ]
 
 
+async def export_workspace_members(
+    workspace_id: Annotated[int, Depends(check_workspace())],
+    dao_factory_: Annotated[DaoFactory, Depends(dao_factory)],
+) -> StreamingResponse:
+    async def fetch(dao: HolderDAO):
+        async for member_dto in dao.workspace_member.stream_members(workspace_id=workspace_id):
+            yield WorkspaceMemberResponseModel.from_dto(member_dto)
+
+    return StreamingResponse(
+        stream_json_array(dao_factory_, fetch, TypeAdapter(WorkspaceMemberResponseModel)),
+        media_type="application/json",
+    )
+
+
 async def add_workspace_member(
     workspace_id: Annotated[
         int, Depends(check_workspace(roles=[WorkspaceMemberRole.ADMIN, WorkspaceMemberRole.OWNER]))
@@ -104,10 +138,59 @@ async def edit_workspace_member(
     ],
     edit_member_model: EditMemberModel,
     dao: Annotated[HolderDAO, Depends(dao_provider)],
+    versions: Annotated[tuple[int, ...] | None, Depends(if_match_versions)],
+    response: Response,
 ) -> dto.WorkspaceMember:
-    return await services.edit_workspace_member(
+    workspace_member = await services.edit_workspace_member(
         workspace_member=edit_member_model.to_dto(workspace_id),
         workspace_member_dao=dao.workspace_member,
+        versions=versions,
+    )
+    response.headers["ETag"] = version_etag(workspace_member.version)
+    return workspace_member
+
+
+def _decode_change_cursor(cursor: str) -> int:
+    change_id = decode_cursor(cursor).get("id")
+    if not isinstance(change_id, int):
+        raise InvalidCursor
+    return change_id
+
+
+async def get_workspace_changes(
+    workspace_id: Annotated[int, Depends(check_workspace())],
+    dao: Annotated[HolderDAO, Depends(dao_provider)],
+    since: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+) -> WorkspaceChangesResponseModel:
+    after = _decode_change_cursor(since) if since is not None else None
+    feed = await services.get_workspace_changes(workspace_id, after, limit, dao.workspace_change)
+
+    latest = {(change.entity, change.entity_id): change.action for change in feed.changes}
+    upserted: dict[WorkspaceChangeEntity, list[str]] = {entity: [] for entity in WorkspaceChangeEntity}
+    for (entity, entity_id), action in latest.items():
+        if action == WorkspaceChangeAction.UPSERT:
+            upserted[entity].append(entity_id)
+
+    return WorkspaceChangesResponseModel(
+        items=feed.changes,
+        next_cursor=encode_cursor({"id": feed.change_id}),
+        reset=feed.reset,
+        has_more=feed.has_more,
+        tasks=await dao.task.get_by_ids(
+            [int(task_id) for task_id in upserted[WorkspaceChangeEntity.TASK]], workspace_id
+        ),
+        projects=await dao.project.get_by_ids(
+            [int(project_id) for project_id in upserted[WorkspaceChangeEntity.PROJECT]],
+            workspace_id,
+            with_description=True,
+        ),
+        members=[
+            WorkspaceMemberResponseModel.from_dto(member_dto)
+            for member_dto in await dao.workspace_member.get_by_user_ids(
+                [UUID(user_id) for user_id in upserted[WorkspaceChangeEntity.MEMBER]], workspace_id
+            )
+        ],
     )
 
 
@@ -119,11 +202,14 @@ def setup() -> APIRouter:
     router.add_api_route("", create_workspace, methods=["POST"])
     router.add_api_route("/{workspace_id}", get_workspace, methods=["GET"])
     router.add_api_route("/{workspace_id}", edit_workspace, methods=["PUT"])
+    router.add_api_route("/{workspace_id}", patch_workspace, methods=["PATCH"])
     router.add_api_route("/{workspace_id}", remove_workspace, methods=["DELETE"])
+    router.add_api_route("/{workspace_id}/changes", get_workspace_changes, methods=["GET"])
 
     # members
     router.add_api_route("/{workspace_id}/members", get_workspace_members, methods=["GET"])
     router.add_api_route("/{workspace_id}/members", add_workspace_member, methods=["POST"])
     router.add_api_route("/{workspace_id}/members", edit_workspace_member, methods=["PUT"])
+    router.add_api_route("/{workspace_id}/members/export", export_workspace_members, methods=["GET"])
     router.add_api_route("/{workspace_id}/members/{user_id}", get_workspace_member, methods=["GET"])
     return router
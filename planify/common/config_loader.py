@@ -3,8 +3,10 @@ from datetime import timedelta
 from envparse import Env
 from sqlalchemy.util import EMPTY_DICT
 
-from planify.api.config import ApiConfig, AuthConfig
-from planify.infrastructure.config.db import DbConfig, DbEngineConfig, DbConnectConfig
+from planify.api.config import ApiConfig, AuthConfig, HashingConfig
+from planify.api.config.hashing import HashingExecutorType
+from planify.infrastructure.config.db import DbConfig, DbEngineConfig, DbConnectConfig, DbCacheConfig
+from planify.jobs.config import ChangeCompactorConfig, JobsConfig, PeriodicJobConfig, StatsReporterConfig
 
 
 class ConfigLoader:
@@ -25,6 +27,14 @@ class ConfigLoader:
                     days=self.env.int(self._prefix + "REFRESH_TOKEN_EX_DAYS", default=30)
                 ),
                 max_refresh_sessions_count=self.env.int(self._prefix + "MAX_REFRESH_SESSIONS_COUNT", default=5),
+                token_cache_size=self.env.int(self._prefix + "TOKEN_CACHE_SIZE", default=10000),
+            ),
+            hashing=HashingConfig(
+                executor_type=HashingExecutorType(
+                    self.env.str(self._prefix + "HASHING_EXECUTOR_TYPE", default=HashingExecutorType.THREAD.value)
+                ),
+                max_workers=self.env.int(self._prefix + "HASHING_MAX_WORKERS", default=4),
+                max_in_flight=self.env.int(self._prefix + "HASHING_MAX_IN_FLIGHT", default=16),
             ),
             enable_logging=self.env.bool(self._prefix + "ENABLE_LOGGING", default=False),
         )
@@ -50,4 +60,44 @@ class ConfigLoader:
                 pool_use_lifo=self.env.bool(self._prefix + "DB_POOL_USE_LIFO", default=True),
                 pool_timeout=self.env.int(self._prefix + "DB_POOL_TIMEOUT", default=60),
             ),
+            cache=DbCacheConfig(
+                user_ttl=self.env.int(self._prefix + "DB_CACHE_USER_TTL", default=60),
+                user_max_size=self.env.int(self._prefix + "DB_CACHE_USER_MAX_SIZE", default=10000),
+                workspace_member_ttl=self.env.int(self._prefix + "DB_CACHE_WORKSPACE_MEMBER_TTL", default=30),
+                workspace_non_member_ttl=self.env.int(self._prefix + "DB_CACHE_WORKSPACE_NON_MEMBER_TTL", default=5),
+                workspace_member_max_size=self.env.int(
+                    self._prefix + "DB_CACHE_WORKSPACE_MEMBER_MAX_SIZE", default=50000
+                ),
+            ),
+        )
+
+    @property
+    def jobs_config(self) -> JobsConfig:
+        return JobsConfig(
+            refresh_session_reaper=PeriodicJobConfig(
+                enabled=self.env.bool(self._prefix + "REFRESH_SESSION_REAPER_ENABLED", default=True),
+                interval=timedelta(seconds=self.env.int(self._prefix + "REFRESH_SESSION_REAPER_INTERVAL", default=300)),
+                batch_size=self.env.int(self._prefix + "REFRESH_SESSION_REAPER_BATCH_SIZE", default=500),
+            ),
+            task_counter_reconciler=PeriodicJobConfig(
+                enabled=self.env.bool(self._prefix + "TASK_COUNTER_RECONCILER_ENABLED", default=True),
+                interval=timedelta(
+                    seconds=self.env.int(self._prefix + "TASK_COUNTER_RECONCILER_INTERVAL", default=3600)
+                ),
+                batch_size=self.env.int(self._prefix + "TASK_COUNTER_RECONCILER_BATCH_SIZE", default=100),
+            ),
+            workspace_change_compactor=ChangeCompactorConfig(
+                enabled=self.env.bool(self._prefix + "WORKSPACE_CHANGE_COMPACTOR_ENABLED", default=True),
+                interval=timedelta(
+                    seconds=self.env.int(self._prefix + "WORKSPACE_CHANGE_COMPACTOR_INTERVAL", default=3600)
+                ),
+                batch_size=self.env.int(self._prefix + "WORKSPACE_CHANGE_COMPACTOR_BATCH_SIZE", default=100),
+                retention=timedelta(
+                    seconds=self.env.int(self._prefix + "WORKSPACE_CHANGE_COMPACTOR_RETENTION", default=7 * 24 * 3600)
+                ),
+            ),
+            password_hashing_stats=StatsReporterConfig(
+                enabled=self.env.bool(self._prefix + "PASSWORD_HASHING_STATS_ENABLED", default=True),
+                interval=timedelta(seconds=self.env.int(self._prefix + "PASSWORD_HASHING_STATS_INTERVAL", default=60)),
+            ),
         )
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Iterable, Protocol
 
 from planify.core.interfaces.dal.base import Committer
 from planify.core.models import dto
@@ -19,8 +19,18 @@ class IsProjectExistsResolver(Committer, Protocol):
         raise NotImplementedError
 
 
-class ProjectEditor(IsProjectExistsResolver, Committer, Protocol):
-    async def update(self, project_dto: dto.Project) -> dto.Project:
+class ProjectsResolver(Protocol):
+    async def get_missing_project_ids(self, project_ids: Iterable[int], workspace_id: int) -> set[int]:
+        raise NotImplementedError
+
+
+class ProjectEditor(Committer, Protocol):
+    async def update(self, project_dto: dto.Project, versions: tuple[int, ...] | None = None) -> dto.Project:
+        raise NotImplementedError
+
+
+class ProjectPatcher(Committer, Protocol):
+    async def patch(self, project_patch: dto.ProjectPatch, versions: tuple[int, ...] | None = None) -> dto.Project:
         raise NotImplementedError
 
 
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
@@ -6,19 +7,28 @@ from ...models import dto
 
 
 class RefreshSessionCreator(Committer, Protocol):
-    async def count_by_user_id(self, user_id: UUID) -> int:
+    async def create_with_limit(
+        self,
+        refresh_session_dto: dto.RefreshSession,
+        max_sessions_count: int,
+    ) -> dto.RefreshSession:
         raise NotImplementedError
 
-    async def create(self, refresh_session: dto.RefreshSession) -> dto.RefreshSession:
-        raise NotImplementedError
 
-    async def remove_oldest_by_user_id(self, user_id: UUID):
+class RefreshSessionRotator(Committer, Protocol):
+    async def rotate(
+        self,
+        refresh_session_id: UUID,
+        new_refresh_session_id: UUID,
+        fingerprint: UUID,
+        device: str,
+        ip: str,
+        expires_in: datetime,
+        max_sessions_count: int,
+    ) -> dto.RefreshSession:
         raise NotImplementedError
 
 
-class RefreshSessionVerifier(Committer, Protocol):
-    async def get_by_id(self, id_: UUID) -> dto.RefreshSession:
-        raise NotImplementedError
-
-    async def remove_by_id(self, id_: UUID) -> int:
+class ExpiredRefreshSessionRemover(Committer, Protocol):
+    async def remove_expired(self, limit: int) -> int:
         raise NotImplementedError
@@ -19,11 +19,36 @@ class TaskCreator(Committer, Protocol):
         raise NotImplementedError
 
 
-class TaskEditor(IsTaskExistsResolver, Committer, Protocol):
-    async def update(self, task_dto: dto.Task) -> dto.Task:
+class TaskBulkCreator(Committer, Protocol):
+    async def create_many(self, workspace_id: int, task_dtos: list[dto.Task]) -> list[int]:
+        raise NotImplementedError
+
+
+class TaskEditor(Committer, Protocol):
+    async def update(self, task_dto: dto.Task, versions: tuple[int, ...] | None = None) -> dto.Task:
+        raise NotImplementedError
+
+
+class TaskPatcher(Committer, Protocol):
+    async def patch(self, task_patch: dto.TaskPatch, versions: tuple[int, ...] | None = None) -> dto.Task:
+        raise NotImplementedError
+
+
+class TaskTransitioner(Committer, Protocol):
+    async def transition(self, transition: dto.TaskTransition) -> list[int]:
         raise NotImplementedError
 
 
 class TaskRemover(IsTaskExistsResolver, Committer, Protocol):
     async def remove(self, task_id: int):
         raise NotImplementedError
+
+
+class TaskSummaryResolver(Protocol):
+    async def get_summary(self, workspace_id: int, project_id: int | None = None) -> dto.TaskSummary:
+        raise NotImplementedError
+
+
+class TaskCounterReconciler(Committer, Protocol):
+    async def reconcile(self, after_workspace_id: int, limit: int) -> list[int]:
+        raise NotImplementedError
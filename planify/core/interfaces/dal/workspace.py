@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Protocol
 
 from planify.core.interfaces.dal.base import Committer
@@ -14,6 +15,27 @@ class WorkspaceEditor(Committer, Protocol):
         raise NotImplementedError
 
 
+class WorkspacePatcher(Committer, Protocol):
+    async def patch(self, workspace_patch: dto.WorkspacePatch) -> dto.Workspace:
+        raise NotImplementedError
+
+
 class WorkspaceRemover(Committer, Protocol):
     async def remove(self, workspace_id: int) -> None:
         raise NotImplementedError
+
+
+class WorkspaceChangeResolver(Protocol):
+    async def get_compacted_change_id(self, workspace_id: int) -> int:
+        raise NotImplementedError
+
+    async def get_last_change_id(self, workspace_id: int) -> int:
+        raise NotImplementedError
+
+    async def get_changes(self, workspace_id: int, after: int, limit: int) -> list[dto.WorkspaceChange]:
+        raise NotImplementedError
+
+
+class WorkspaceChangeCompactor(Committer, Protocol):
+    async def compact(self, after_workspace_id: int, limit: int, retain_since: datetime) -> list[int]:
+        raise NotImplementedError
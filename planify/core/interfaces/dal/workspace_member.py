@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Protocol, Iterable
 from uuid import UUID
 
 from planify.core.interfaces.dal.base import Committer
@@ -12,7 +12,9 @@ class WorkspaceMemberCreator(Committer, Protocol):
 
 
 class WorkspaceMemberEditor(Committer, Protocol):
-    async def update(self, workspace_member_dto: dto.WorkspaceMember) -> dto.WorkspaceMember:
+    async def update(
+        self, workspace_member_dto: dto.WorkspaceMember, versions: tuple[int, ...] | None = None
+    ) -> dto.WorkspaceMember:
         raise NotImplementedError
 
 
@@ -24,3 +26,8 @@ class IsWorkspaceMemberResolver(Protocol):
         roles: list[WorkspaceMemberRole] | None = None,
     ) -> bool:
         raise NotImplementedError
+
+
+class WorkspaceMembersResolver(Protocol):
+    async def get_non_members(self, user_ids: Iterable[UUID], workspace_id: int) -> set[UUID]:
+        raise NotImplementedError
@@ -1,5 +1,13 @@
-from .project import Project, ProjectMember
+from .project import Project, ProjectMember, ProjectPatch
 from .refresh_session import RefreshSession
-from .task import Task
+from .task import Task, TaskFilter, TaskCursor, TaskSummary, TaskTransition, TaskPatch
 from .user import User, UserWithCredentials
-from .workspace import Workspace, WorkspaceMember
+from .workspace import (
+    Workspace,
+    WorkspacePatch,
+    WorkspaceMember,
+    WorkspaceMembership,
+    WorkspaceContext,
+    WorkspaceChange,
+    WorkspaceChangeFeed,
+)
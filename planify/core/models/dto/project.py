@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, Mapping
 from uuid import UUID
 
 from .user import User
@@ -15,6 +16,7 @@ class Project:
     manager_id: UUID | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
+    version: int | None = None
 
     author: User | None = None
     manager: User | None = None
@@ -26,3 +28,11 @@ class ProjectMember:
     project_id: int
 
     user: User | None = None
+
+
+@dataclass
+class ProjectPatch:
+    id: int
+    workspace_id: int
+    # only the supplied columns are changed, None clears nullable ones
+    changes: Mapping[str, Any] = field(default_factory=dict)
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, Mapping
 from uuid import UUID
 
 from planify.core.models.dto.project import Project
@@ -21,7 +22,50 @@ class Task:
     performer_id: UUID | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
+    version: int | None = None
 
     author: User | None = None
     performer: User | None = None
     project: Project | None = None
+
+
+@dataclass(frozen=True)
+class TaskFilter:
+    status: TaskStatus | None = None
+    priority: TaskPriority | None = None
+    performer_id: UUID | None = None
+    project_id: int | None = None
+    deadline_from: datetime | None = None
+    deadline_to: datetime | None = None
+
+
+@dataclass(frozen=True)
+class TaskCursor:
+    id: int
+    # value of the sort column of the last returned task, None for id based orders
+    value: datetime | TaskPriority | None = None
+
+
+@dataclass
+class TaskSummary:
+    workspace_id: int
+    project_id: int | None = None
+    total: int = 0
+    by_status: dict[TaskStatus, int] = field(default_factory=dict)
+    by_priority: dict[TaskPriority, int] = field(default_factory=dict)
+
+
+@dataclass
+class TaskTransition:
+    workspace_id: int
+    task_ids: list[int]
+    # only the supplied columns are changed, None clears nullable ones
+    changes: Mapping[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class TaskPatch:
+    id: int
+    workspace_id: int
+    # only the supplied columns are changed, None clears nullable ones
+    changes: Mapping[str, Any] = field(default_factory=dict)
@@ -1,9 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, Mapping
 from uuid import UUID
 
 from .user import User
-from ..enums.workspace import WorkspaceMemberRole
+from ..enums.workspace import WorkspaceMemberRole, WorkspaceChangeAction, WorkspaceChangeEntity
 
 
 @dataclass
@@ -14,6 +15,12 @@ class Workspace:
     updated_at: datetime | None = None
 
 
+@dataclass
+class WorkspacePatch:
+    id: int
+    changes: Mapping[str, Any] = field(default_factory=dict)
+
+
 @dataclass
 class WorkspaceMember:
     user_id: UUID
@@ -22,5 +29,43 @@ class WorkspaceMember:
     active: bool
     created_at: datetime | None = None
     updated_at: datetime | None = None
+    version: int | None = None
 
     user: User | None = None
+
+
+@dataclass(frozen=True)
+class WorkspaceMembership:
+    role: WorkspaceMemberRole
+    active: bool
+
+    def has_role(self, roles: list[WorkspaceMemberRole] | None = None) -> bool:
+        return self.active and (not roles or self.role in roles)
+
+
+@dataclass(frozen=True)
+class WorkspaceContext:
+    user: User
+    workspace_id: int
+    membership: WorkspaceMembership | None = None
+
+    def has_role(self, roles: list[WorkspaceMemberRole] | None = None) -> bool:
+        return self.membership is not None and self.membership.has_role(roles)
+
+
+@dataclass
+class WorkspaceChange:
+    id: int
+    entity: WorkspaceChangeEntity
+    entity_id: str
+    action: WorkspaceChangeAction
+
+
+@dataclass
+class WorkspaceChangeFeed:
+    # position after the returned changes
+    change_id: int
+    changes: list[WorkspaceChange] = field(default_factory=list)
+    # the requested position was compacted away, the client has to reload everything
+    reset: bool = False
+    has_more: bool = False
@@ -14,3 +14,11 @@ class TaskPriority(Enum):
     MEDIUM = "medium"
     HIGH = "high"
     CRITICAL = "critical"
+
+
+class TaskSortOrder(Enum):
+    NEWEST = "newest"
+    OLDEST = "oldest"
+    DEADLINE = "deadline"
+    PRIORITY = "priority"
+    RECENTLY_UPDATED = "recently_updated"
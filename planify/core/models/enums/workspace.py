@@ -6,3 +6,14 @@ class WorkspaceMemberRole(Enum):
     ADMIN = "admin"
     EDITOR = "editor"
     VIEWER = "viewer"
+
+
+class WorkspaceChangeEntity(Enum):
+    TASK = "task"
+    PROJECT = "project"
+    MEMBER = "member"
+
+
+class WorkspaceChangeAction(Enum):
+    UPSERT = "upsert"
+    DELETE = "delete"
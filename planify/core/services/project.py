@@ -1,7 +1,11 @@
-from planify.core.interfaces.dal.project import ProjectByIdResolver, ProjectCreator, ProjectEditor, ProjectRemover
-from planify.core.interfaces.dal.workspace_member import IsWorkspaceMemberResolver
+from planify.core.interfaces.dal.project import (
+    ProjectByIdResolver,
+    ProjectCreator,
+    ProjectEditor,
+    ProjectPatcher,
+    ProjectRemover,
+)
 from planify.core.models import dto
-from planify.core.services.workspace_member import is_members
 from planify.core.utils.exceptions import ProjectNotFound
 
 
@@ -20,18 +24,19 @@ async def create_project(project: dto.Project, dao: ProjectCreator) -> dto.Proje
 
 
 async def edit_project(
-    project: dto.Project,
-    project_dao: ProjectEditor,
-    workspace_member_dao: IsWorkspaceMemberResolver,
+    project: dto.Project, dao: ProjectEditor, versions: tuple[int, ...] | None = None
 ) -> dto.Project:
-    if not await project_dao.is_project_exists(project.id, project.workspace_id):
-        raise ProjectNotFound
+    edited_project = await dao.update(project, versions)
+    await dao.commit()
+    return edited_project
 
-    await is_members([project.author_id, project.manager_id], project.workspace_id, workspace_member_dao)
 
-    edited_project = await project_dao.update(project)
-    await project_dao.commit()
-    return edited_project
+async def patch_project(
+    project_patch: dto.ProjectPatch, dao: ProjectPatcher, versions: tuple[int, ...] | None = None
+) -> dto.Project:
+    patched_project = await dao.patch(project_patch, versions)
+    await dao.commit()
+    return patched_project
 
 
 async def remove_project(project_id: int, workspace_id: int, project_dao: ProjectRemover) -> None:
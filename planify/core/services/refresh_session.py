@@ -1,9 +1,12 @@
+from datetime import datetime
 from uuid import UUID
 
-from planify.common import dt_utils
-from planify.core.interfaces.dal.refresh_session import RefreshSessionCreator, RefreshSessionVerifier
+from planify.core.interfaces.dal.refresh_session import (
+    RefreshSessionCreator,
+    RefreshSessionRotator,
+    ExpiredRefreshSessionRemover,
+)
 from planify.core.models import dto
-from planify.core.utils.exceptions import SessionExpired, InvalidRefreshSession
 
 
 async def add_refresh_session(
@@ -11,23 +14,35 @@ async def add_refresh_session(
     dao: RefreshSessionCreator,
     max_refresh_sessions_count: int,
 ) -> dto.RefreshSession:
-    if await dao.count_by_user_id(refresh_session.user_id) >= max_refresh_sessions_count:
-        await dao.remove_oldest_by_user_id(refresh_session.user_id)
+    return await dao.create_with_limit(refresh_session, max_refresh_sessions_count)
 
-    new_refresh_session = await dao.create(refresh_session)
-    return new_refresh_session
 
-
-async def verify_refresh_session(
+async def rotate_refresh_session(
     refresh_session_id: UUID,
-    new_fingerprint: UUID,
-    dao: RefreshSessionVerifier,
+    new_refresh_session_id: UUID,
+    fingerprint: UUID,
+    device: str,
+    ip: str,
+    expires_in: datetime,
+    dao: RefreshSessionRotator,
+    max_refresh_sessions_count: int,
 ) -> dto.RefreshSession:
-    old_refresh_session = await dao.get_by_id(refresh_session_id)
-    if dt_utils.now() > old_refresh_session.expires_in:
-        raise SessionExpired
-    if old_refresh_session.fingerprint != new_fingerprint:
-        raise InvalidRefreshSession
+    return await dao.rotate(
+        refresh_session_id=refresh_session_id,
+        new_refresh_session_id=new_refresh_session_id,
+        fingerprint=fingerprint,
+        device=device,
+        ip=ip,
+        expires_in=expires_in,
+        max_sessions_count=max_refresh_sessions_count,
+    )
+
 
-    await dao.remove_by_id(old_refresh_session.id)
-    return old_refresh_session
+async def remove_expired_refresh_sessions(dao: ExpiredRefreshSessionRemover, batch_size: int) -> int:
+    removed = 0
+    while True:
+        batch_removed = await dao.remove_expired(limit=batch_size)
+        await dao.commit()
+        removed += batch_removed
+        if batch_removed < batch_size:
+            return removed
@@ -1,6 +1,16 @@
-from planify.core.interfaces.dal.project import IsProjectExistsResolver
-from planify.core.interfaces.dal.task import TaskByIdResolver, TaskCreator, TaskEditor, TaskRemover
-from planify.core.interfaces.dal.workspace_member import IsWorkspaceMemberResolver
+from planify.core.interfaces.dal.project import IsProjectExistsResolver, ProjectsResolver
+from planify.core.interfaces.dal.task import (
+    TaskByIdResolver,
+    TaskCreator,
+    TaskBulkCreator,
+    TaskEditor,
+    TaskPatcher,
+    TaskRemover,
+    TaskTransitioner,
+    TaskSummaryResolver,
+    TaskCounterReconciler,
+)
+from planify.core.interfaces.dal.workspace_member import WorkspaceMembersResolver
 from planify.core.models import dto
 from planify.core.services.workspace_member import is_members
 from planify.core.utils.exceptions import TaskNotFound, ProjectNotFound
@@ -20,25 +30,53 @@ async def create_task(task: dto.Task, dao: TaskCreator) -> dto.Task:
     return created_task
 
 
-async def edit_task(
-    task: dto.Task,
-    task_dao: TaskEditor,
-    project_dao: IsProjectExistsResolver,
-    workspace_member_dao: IsWorkspaceMemberResolver,
-) -> dto.Task:
-    if not await task_dao.is_task_exists(task.id, task.workspace_id):
-        raise TaskNotFound
-
-    if task.project_id is not None and not await project_dao.is_project_exists(task.project_id, task.workspace_id):
+async def create_tasks(
+    workspace_id: int,
+    tasks: list[dto.Task],
+    task_dao: TaskBulkCreator,
+    project_dao: ProjectsResolver,
+    workspace_member_dao: WorkspaceMembersResolver,
+) -> list[int]:
+    project_ids = {task.project_id for task in tasks if task.project_id is not None}
+    if project_ids and await project_dao.get_missing_project_ids(project_ids, workspace_id):
         raise ProjectNotFound
 
-    await is_members([task.author_id, task.performer_id], task.workspace_id, workspace_member_dao)
+    await is_members([task.performer_id for task in tasks], workspace_id, workspace_member_dao)
 
-    edited_task = await task_dao.update(task)
+    task_ids = await task_dao.create_many(workspace_id, tasks)
     await task_dao.commit()
+    return task_ids
+
+
+async def edit_task(task: dto.Task, dao: TaskEditor, versions: tuple[int, ...] | None = None) -> dto.Task:
+    edited_task = await dao.update(task, versions)
+    await dao.commit()
     return edited_task
 
 
+async def patch_task(task_patch: dto.TaskPatch, dao: TaskPatcher, versions: tuple[int, ...] | None = None) -> dto.Task:
+    patched_task = await dao.patch(task_patch, versions)
+    await dao.commit()
+    return patched_task
+
+
+async def transition_tasks(
+    transition: dto.TaskTransition,
+    task_dao: TaskTransitioner,
+    project_dao: IsProjectExistsResolver,
+    workspace_member_dao: WorkspaceMembersResolver,
+) -> list[int]:
+    project_id = transition.changes.get("project_id")
+    if project_id is not None and not await project_dao.is_project_exists(project_id, transition.workspace_id):
+        raise ProjectNotFound
+
+    await is_members([transition.changes.get("performer_id")], transition.workspace_id, workspace_member_dao)
+
+    task_ids = await task_dao.transition(transition)
+    await task_dao.commit()
+    return task_ids
+
+
 async def remove_task(task_id: int, workspace_id: int, dao: TaskRemover) -> None:
     if not await dao.is_task_exists(task_id, workspace_id):
         raise ProjectNotFound
@@ -46,3 +84,26 @@ async def remove_task(task_id: int, workspace_id: int, dao: TaskRemover) -> None
     await dao.remove(task_id)
     await dao.commit()
     return None
+
+
+async def get_task_summary(
+    workspace_id: int,
+    project_id: int | None,
+    dao: TaskSummaryResolver,
+    project_dao: IsProjectExistsResolver,
+) -> dto.TaskSummary:
+    if project_id is not None and not await project_dao.is_project_exists(project_id, workspace_id):
+        raise ProjectNotFound
+
+    return await dao.get_summary(workspace_id, project_id)
+
+
+async def reconcile_task_counters(dao: TaskCounterReconciler, batch_size: int) -> int:
+    reconciled, after_workspace_id = 0, 0
+    while True:
+        workspace_ids = await dao.reconcile(after_workspace_id=after_workspace_id, limit=batch_size)
+        await dao.commit()
+        reconciled += len(workspace_ids)
+        if len(workspace_ids) < batch_size:
+            return reconciled
+        after_workspace_id = workspace_ids[-1]
@@ -1,7 +1,15 @@
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 from planify.core.interfaces.dal.user import UserByIdResolver
-from planify.core.interfaces.dal.workspace import WorkspaceCreator, WorkspaceEditor, WorkspaceRemover
+from planify.core.interfaces.dal.workspace import (
+    WorkspaceCreator,
+    WorkspaceEditor,
+    WorkspacePatcher,
+    WorkspaceRemover,
+    WorkspaceChangeResolver,
+    WorkspaceChangeCompactor,
+)
 from planify.core.interfaces.dal.workspace_member import WorkspaceMemberCreator, WorkspaceMemberEditor
 from planify.core.models import dto
 from planify.core.models.enums.workspace import WorkspaceMemberRole
@@ -32,6 +40,12 @@ async def edit_workspace(workspace: dto.Workspace, workspace_dao: WorkspaceEdito
     return workspace_dto
 
 
+async def patch_workspace(workspace_patch: dto.WorkspacePatch, workspace_dao: WorkspacePatcher) -> dto.Workspace:
+    workspace_dto = await workspace_dao.patch(workspace_patch)
+    await workspace_dao.commit()
+    return workspace_dto
+
+
 async def remove_workspace(workspace_id: int, workspace_dao: WorkspaceRemover) -> None:
     await workspace_dao.remove(workspace_id)
     await workspace_dao.commit()
@@ -52,7 +66,37 @@ async def add_workspace_member(
 async def edit_workspace_member(
     workspace_member: dto.WorkspaceMember,
     workspace_member_dao: WorkspaceMemberEditor,
+    versions: tuple[int, ...] | None = None,
 ) -> dto.WorkspaceMember:
-    await workspace_member_dao.update(workspace_member)
+    edited_member = await workspace_member_dao.update(workspace_member, versions)
     await workspace_member_dao.commit()
-    return workspace_member
+    return edited_member
+
+
+async def get_workspace_changes(
+    workspace_id: int, after: int | None, limit: int, dao: WorkspaceChangeResolver
+) -> dto.WorkspaceChangeFeed:
+    compacted_change_id = await dao.get_compacted_change_id(workspace_id)
+    if after is None or after < compacted_change_id:
+        last_change_id = await dao.get_last_change_id(workspace_id)
+        return dto.WorkspaceChangeFeed(change_id=max(last_change_id, compacted_change_id), reset=True)
+
+    changes = await dao.get_changes(workspace_id, after=after, limit=limit + 1)
+    feed = dto.WorkspaceChangeFeed(change_id=after, changes=changes[:limit], has_more=len(changes) > limit)
+    if feed.changes:
+        feed.change_id = feed.changes[-1].id
+    return feed
+
+
+async def compact_workspace_changes(dao: WorkspaceChangeCompactor, batch_size: int, retention: timedelta) -> int:
+    retain_since = datetime.now(timezone.utc) - retention
+    compacted, after_workspace_id = 0, 0
+    while True:
+        workspace_ids = await dao.compact(
+            after_workspace_id=after_workspace_id, limit=batch_size, retain_since=retain_since
+        )
+        await dao.commit()
+        compacted += len(workspace_ids)
+        if len(workspace_ids) < batch_size:
+            return compacted
+        after_workspace_id = workspace_ids[-1]
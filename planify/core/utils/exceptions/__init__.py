@@ -13,4 +13,7 @@ from .models import (
     ProjectNotFound,
     ProjectMemberExists,
     TaskNotFound,
+    StaleVersion,
+    ConcurrentUpdate,
+    InvalidCursor,
 )
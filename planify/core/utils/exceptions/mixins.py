@@ -16,3 +16,7 @@ class NotFoundMixin:
 
 class ConflictMixin:
     status_code = 409
+
+
+class PreconditionFailedMixin:
+    status_code = 412
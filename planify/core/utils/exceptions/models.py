@@ -1,4 +1,4 @@
-from .mixins import BadRequestMixin, UnauthorizedMixin, NotFoundMixin, ConflictMixin
+from .mixins import BadRequestMixin, UnauthorizedMixin, NotFoundMixin, ConflictMixin, PreconditionFailedMixin
 
 
 class PlanifyError(BadRequestMixin, Exception):
@@ -55,3 +55,15 @@ class ProjectMemberExists(ConflictMixin, PlanifyError):
 
 class TaskNotFound(NotFoundMixin, PlanifyError):
     notify_user = "The requested task was not found"
+
+
+class StaleVersion(PreconditionFailedMixin, PlanifyError):
+    notify_user = "The resource has been modified since the given version"
+
+
+class ConcurrentUpdate(ConflictMixin, PlanifyError):
+    notify_user = "The resource was modified concurrently, please retry"
+
+
+class InvalidCursor(PlanifyError):
+    notify_user = "Invalid pagination cursor"
@@ -38,7 +38,18 @@ class DbEngineConfig:
     pool_timeout: int
 
 
+@dataclass(frozen=True)
+class DbCacheConfig:
+    user_ttl: int
+    user_max_size: int
+    workspace_member_ttl: int
+    # users that are not members are cached briefly, so a new member is not kept out for the full ttl
+    workspace_non_member_ttl: int
+    workspace_member_max_size: int
+
+
 @dataclass(frozen=True)
 class DbConfig:
     connect: DbConnectConfig
     engine: DbEngineConfig
+    cache: DbCacheConfig
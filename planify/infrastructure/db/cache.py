@@ -0,0 +1,55 @@
+from typing import Callable
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from planify.common.cache import TTLCache
+from planify.core.models import dto
+from planify.infrastructure.config.db import DbCacheConfig
+
+_PENDING_EVICTIONS = "pending_cache_evictions"
+
+
+def evict(session: AsyncSession, evict_func: Callable[[], None]) -> None:
+    # repeated after commit, otherwise a concurrent reader could cache the old row until the ttl expires
+    evict_func()
+    session.info.setdefault(_PENDING_EVICTIONS, []).append(evict_func)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _run_pending_evictions(session: Session) -> None:
+    for evict_func in session.info.pop(_PENDING_EVICTIONS, []):
+        evict_func()
+
+
+# None is cached for users that are not members of the workspace, with its own shorter ttl
+class MembershipCache(TTLCache[tuple[UUID, int], dto.WorkspaceMembership | None]):
+    def __init__(self, max_size: int, ttl: float | None = None, non_member_ttl: float | None = None):
+        super().__init__(max_size=max_size, ttl=ttl)
+        self._non_member_ttl = non_member_ttl
+
+    def set(self, key: tuple[UUID, int], value: dto.WorkspaceMembership | None, ttl: float | None = None) -> None:
+        if value is None and ttl is None:
+            ttl = self._non_member_ttl
+        super().set(key, value, ttl=ttl)
+
+
+class CacheHolder:
+    def __init__(self, config: DbCacheConfig):
+        self._user: TTLCache[UUID, dto.User] = TTLCache(max_size=config.user_max_size, ttl=config.user_ttl)
+        self._workspace_member = MembershipCache(
+            max_size=config.workspace_member_max_size,
+            ttl=config.workspace_member_ttl,
+            non_member_ttl=config.workspace_non_member_ttl,
+        )
+
+    @property
+    def user(self) -> TTLCache[UUID, dto.User]:
+        return self._user
+
+    @property
+    def workspace_member(self) -> MembershipCache:
+        return self._workspace_member
@@ -1,5 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from planify.infrastructure.db.cache import CacheHolder
+from planify.infrastructure.db.dao.memo import RequestMemo
+
 from planify.infrastructure.db.dao.rdb import (
     UserDAO,
     RefreshSessionDAO,
@@ -8,19 +11,24 @@ from planify.infrastructure.db.dao.rdb import (
     ProjectDAO,
     ProjectMemberDAO,
     TaskDAO,
+    TaskCounterDAO,
+    WorkspaceChangeDAO,
 )
 
 
 class HolderDAO:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache: CacheHolder):
         self._session = session
-        self._user = UserDAO(session)
-        self._refresh_session = RefreshSessionDAO(session)
-        self._workspace = WorkspaceDAO(session)
-        self._workspace_member = WorkspaceMemberDAO(session)
-        self._project = ProjectDAO(session)
-        self._project_member = ProjectMemberDAO(session)
-        self._task = TaskDAO(session)
+        self._memo = RequestMemo()
+        self._user = UserDAO(session, self._memo, cache.user)
+        self._refresh_session = RefreshSessionDAO(session, self._memo)
+        self._workspace = WorkspaceDAO(session, self._memo, cache.workspace_member)
+        self._workspace_member = WorkspaceMemberDAO(session, self._memo, cache.workspace_member, cache.user)
+        self._project = ProjectDAO(session, self._memo)
+        self._project_member = ProjectMemberDAO(session, self._memo)
+        self._task = TaskDAO(session, self._memo)
+        self._task_counter = TaskCounterDAO(session, self._memo)
+        self._workspace_change = WorkspaceChangeDAO(session, self._memo)
 
     async def commit(self):
         await self._session.commit()
@@ -52,3 +60,11 @@ class HolderDAO:
     @property
     def task(self) -> TaskDAO:
         return self._task
+
+    @property
+    def task_counter(self) -> TaskCounterDAO:
+        return self._task_counter
+
+    @property
+    def workspace_change(self) -> WorkspaceChangeDAO:
+        return self._workspace_change
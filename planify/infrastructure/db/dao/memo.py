@@ -0,0 +1,63 @@
+import inspect
+from functools import wraps
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+class RequestMemo:
+    def __init__(self):
+        self._results: dict[Hashable, Any] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self._results.get(key, default)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._results[key] = value
+
+    def clear(self) -> None:
+        self._results.clear()
+
+
+_MISSING = object()
+
+
+def memoized(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs) -> T:
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        key = (type(self), func.__name__, _freeze(tuple(arguments.arguments.items())[1:]))
+        try:
+            result = self._memo.get(key, _MISSING)
+        except TypeError:
+            return await func(self, *args, **kwargs)
+
+        if result is _MISSING:
+            result = await func(self, *args, **kwargs)
+            self._memo.set(key, result)
+        return result
+
+    return wrapper
+
+
+def invalidates(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs) -> T:
+        self._memo.clear()
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            self._memo.clear()
+
+    return wrapper
@@ -0,0 +1,24 @@
+from typing import Any, Callable
+
+from sqlalchemy.orm import Bundle
+
+
+class DTOBundle(Bundle):
+    # builds DTOs straight from result rows, bypassing ORM entities and the identity map;
+    # column keys must match the DTO field names
+    def __init__(self, name: str, factory: Callable[..., Any], *exprs, **kw):
+        super().__init__(name, *exprs, **kw)
+        self.factory = factory
+
+    def create_row_processor(self, query, procs, labels):
+        # labels are deduplicated across the whole statement, the column keys are not
+        factory, keys = self.factory, [expr.key for expr in self.exprs]
+
+        def proc(row):
+            values = {key: proc_(row) for key, proc_ in zip(keys, procs)}
+            # outer joined entity that did not match
+            if values.get("id") is None:
+                return None
+            return factory(**values)
+
+        return proc
@@ -2,6 +2,8 @@ from .project import ProjectDAO
 from .project_member import ProjectMemberDAO
 from .refresh_session import RefreshSessionDAO
 from .task import TaskDAO
+from .task_counter import TaskCounterDAO
 from .user import UserDAO
 from .workspace import WorkspaceDAO
+from .workspace_change import WorkspaceChangeDAO
 from .workspace_member import WorkspaceMemberDAO
@@ -1,22 +1,24 @@
 from collections.abc import Sequence
-from typing import TypeVar, Generic
+from typing import Any, Mapping, TypeVar, Generic
 from uuid import UUID
 
-from sqlalchemy import delete, func, ScalarResult
+from sqlalchemy import delete, func, or_, ScalarResult, ColumnElement, literal
 from sqlalchemy import select
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.interfaces import ORMOption
 
+from planify.infrastructure.db.dao.memo import RequestMemo, invalidates
 from planify.infrastructure.db.models import Base
 
 Model = TypeVar("Model", bound=Base, covariant=True, contravariant=False)
 
 
 class BaseDAO(Generic[Model]):
-    def __init__(self, model: type[Model], session: AsyncSession):
+    def __init__(self, model: type[Model], session: AsyncSession, memo: RequestMemo):
         self._model = model
         self._session = session
+        self._memo = memo
 
     async def _get_all(self, options: Sequence[ORMOption] = ()) -> Sequence[Model]:
         result: ScalarResult[Model] = await self._session.scalars(select(self._model).options(*options))
@@ -39,12 +41,21 @@ class BaseDAO(Generic[Model]):
     def _save(self, obj: Base):
         self._session.add(obj)
 
+    @invalidates
     async def delete_all(self):
         await self._session.execute(delete(self._model))
 
     async def _delete(self, obj: Base):
         await self._session.delete(obj)
 
+    async def exists(self, *whereclause: ColumnElement[bool], **criteria) -> bool:
+        query = select(literal(1)).select_from(self._model).where(*whereclause).filter_by(**criteria).limit(1)
+        return await self._session.scalar(select(query.exists()))
+
+    def _changed(self, values: Mapping[str, Any]) -> ColumnElement[bool]:
+        # lets an UPDATE skip rows that already hold the given values
+        return or_(*(getattr(self._model, key).is_distinct_from(value) for key, value in values.items()))
+
     async def count(self):
         result = await self._session.execute(select(func.count(self._model.id)))
         return result.scalar_one()
@@ -1,18 +1,42 @@
-from sqlalchemy import select, Result
+from typing import Any, AsyncIterator, Iterable, Mapping
+
+from sqlalchemy import delete, select, update, any_, bindparam, true, types
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from planify.core.models import dto
-from planify.core.utils.exceptions import ProjectNotFound
+from planify.core.models.enums.workspace import WorkspaceChangeAction, WorkspaceChangeEntity
+from planify.core.utils.exceptions import ProjectNotFound, NoWorkspaceMemberFound, StaleVersion
+from planify.infrastructure.db.dao.memo import RequestMemo, invalidates, memoized
+from planify.infrastructure.db.dao.projection import DTOBundle
 from planify.infrastructure.db.dao.rdb.base import BaseDAO
-from planify.infrastructure.db.models import Project
+from planify.infrastructure.db.dao.rdb.task_counter import move_project_counters
+from planify.infrastructure.db.dao.rdb.workspace_change import record_changes
+from planify.infrastructure.db.dao.rdb.workspace_member import active_members_exist
+from planify.infrastructure.db.models import Project, Task
+
+# list views skip the description and build DTOs from plain rows
+_PROJECT_LIST_PROJECTION = DTOBundle(
+    "project",
+    dto.Project,
+    Project.id,
+    Project.name,
+    Project.workspace_id,
+    Project.author_id,
+    Project.manager_id,
+    Project.created_at,
+    Project.updated_at,
+    Project.version,
+)
 
 
 class ProjectDAO(BaseDAO[Project]):
-    def __init__(self, session: AsyncSession):
-        super().__init__(Project, session)
+    def __init__(self, session: AsyncSession, memo: RequestMemo):
+        super().__init__(Project, session, memo)
 
+    @memoized
     async def get_by_id(self, id_: int) -> dto.Project:
         try:
             return (
@@ -21,34 +45,149 @@ class ProjectDAO(BaseDAO[Project]):
         except NoResultFound as e:
             raise ProjectNotFound from e
 
+    @memoized
     async def get_by_workspace_id(self, workspace_id: int) -> list[dto.Project]:
-        result = await self._session.scalars(select(Project).where(Project.workspace_id == workspace_id))
-        return [project.to_dto() for project in result.all()]
+        result = await self._session.scalars(
+            select(_PROJECT_LIST_PROJECTION).where(Project.workspace_id == workspace_id)
+        )
+        return list(result.all())
+
+    async def stream_by_workspace_id(self, workspace_id: int, batch_size: int = 1000) -> AsyncIterator[dto.Project]:
+        result = await self._session.stream_scalars(
+            select(_PROJECT_LIST_PROJECTION)
+            .where(Project.workspace_id == workspace_id)
+            .order_by(Project.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for project in result:
+            yield project
 
+    @memoized
+    async def get_by_ids(
+        self, project_ids: list[int], workspace_id: int, with_description: bool = False
+    ) -> list[dto.Project]:
+        if not project_ids:
+            return []
+        result = await self._session.scalars(
+            select(Project if with_description else _PROJECT_LIST_PROJECTION).where(
+                Project.workspace_id == workspace_id,
+                Project.id == any_(bindparam("project_ids", list(set(project_ids)), type_=ARRAY(types.BigInteger))),
+            )
+        )
+        if with_description:
+            return [project.to_dto() for project in result.all()]
+        return list(result.all())
+
+    @memoized
     async def is_project_exists(self, project_id: int, workspace_id: int) -> bool:
-        result: Result[tuple[Project]] = await self._session.execute(
-            select(Project).where(Project.id == project_id, Project.workspace_id == workspace_id)
+        return await self.exists(id=project_id, workspace_id=workspace_id)
+
+    @memoized
+    async def get_missing_project_ids(self, project_ids: Iterable[int], workspace_id: int) -> set[int]:
+        project_ids = set(project_ids)
+        result = await self._session.scalars(
+            select(Project.id).where(
+                Project.workspace_id == workspace_id,
+                Project.id == any_(bindparam("project_ids", list(project_ids), type_=ARRAY(types.BigInteger))),
+            )
         )
-        return bool(result.scalar())
+        return project_ids.difference(result.all())
 
+    @invalidates
     async def create(self, project_dto: dto.Project) -> dto.Project:
         project = Project.from_dto(project_dto)
         self._save(project)
         await self._flush(project)
+        await record_changes(
+            self._session,
+            project.workspace_id,
+            WorkspaceChangeEntity.PROJECT,
+            WorkspaceChangeAction.UPSERT,
+            [project.id],
+        )
         return project.to_dto()
 
-    async def update(self, project_dto: dto.Project) -> dto.Project:
-        try:
-            project = await self._get_by_id(project_dto.id)
-        except NoResultFound as e:
-            raise ProjectNotFound from e
+    @invalidates
+    async def update(self, project_dto: dto.Project, versions: tuple[int, ...] | None = None) -> dto.Project:
+        return await self._update(
+            project_dto.id,
+            project_dto.workspace_id,
+            {
+                "name": project_dto.name,
+                "description": project_dto.description,
+                "author_id": project_dto.author_id,
+                "manager_id": project_dto.manager_id,
+            },
+            versions,
+        )
 
-        project.name = project.name
-        project.description = project_dto.description
-        project.author_id = project_dto.author_id
-        project.manager_id = project_dto.manager_id
-        await self._flush(project)
+    @invalidates
+    async def patch(self, project_patch: dto.ProjectPatch, versions: tuple[int, ...] | None = None) -> dto.Project:
+        return await self._update(project_patch.id, project_patch.workspace_id, project_patch.changes, versions)
+
+    async def _update(
+        self, project_id: int, workspace_id: int, values: Mapping[str, Any], versions: tuple[int, ...] | None = None
+    ) -> dto.Project:
+        members_guard = active_members_exist([values.get("author_id"), values.get("manager_id")], workspace_id)
+        project = None
+        if values:
+            project = await self._session.scalar(
+                update(Project)
+                .where(
+                    Project.id == project_id,
+                    Project.workspace_id == workspace_id,
+                    true() if versions is None else Project.version.in_(versions),
+                    members_guard,
+                    self._changed(values),
+                )
+                .values(**values, version=Project.version + 1)
+                .returning(Project)
+            )
+
+        if project is None:
+            # the guarded update matched nothing: either a check failed or there was nothing to change
+            result = await self._session.execute(
+                select(Project, members_guard.label("members_found")).where(
+                    Project.id == project_id, Project.workspace_id == workspace_id
+                )
+            )
+            row = result.one_or_none()
+            if row is None:
+                raise ProjectNotFound
+            project, members_found = row
+            if versions is not None and project.version not in versions:
+                raise StaleVersion
+            if not members_found:
+                raise NoWorkspaceMemberFound
+            return project.to_dto()
+
+        await record_changes(
+            self._session,
+            project.workspace_id,
+            WorkspaceChangeEntity.PROJECT,
+            WorkspaceChangeAction.UPSERT,
+            [project.id],
+        )
         return project.to_dto()
 
+    @invalidates
     async def remove(self, project_id: int):
-        await self._remove_by_id(project_id)
+        await move_project_counters(self._session, project_id)
+        # detach the tasks here rather than by the foreign key, so they get a new version and a change entry
+        task_ids = await self._session.scalars(
+            update(Task)
+            .where(Task.project_id == project_id)
+            .values(project_id=None, version=Task.version + 1)
+            .returning(Task.id)
+        )
+        task_ids = list(task_ids.all())
+        workspace_id = await self._session.scalar(
+            delete(Project).where(Project.id == project_id).returning(Project.workspace_id)
+        )
+        if workspace_id is not None:
+            await record_changes(
+                self._session, workspace_id, WorkspaceChangeEntity.TASK, WorkspaceChangeAction.UPSERT, task_ids
+            )
+            await record_changes(
+                self._session, workspace_id, WorkspaceChangeEntity.PROJECT, WorkspaceChangeAction.DELETE, [project_id]
+            )
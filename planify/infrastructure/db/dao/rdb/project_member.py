@@ -5,20 +5,23 @@ from sqlalchemy.orm import joinedload
 
 from planify.core.models import dto
 from planify.core.utils.exceptions import ProjectMemberExists
+from planify.infrastructure.db.dao.memo import RequestMemo, invalidates, memoized
 from planify.infrastructure.db.dao.rdb.base import BaseDAO
 from planify.infrastructure.db.models import ProjectMember
 
 
 class ProjectMemberDAO(BaseDAO[ProjectMember]):
-    def __init__(self, session: AsyncSession):
-        super().__init__(ProjectMember, session)
+    def __init__(self, session: AsyncSession, memo: RequestMemo):
+        super().__init__(ProjectMember, session, memo)
 
+    @memoized
     async def get_members(self, project_id: int) -> list[dto.ProjectMember]:
         result: ScalarResult[ProjectMember] = await self._session.scalars(
             select(ProjectMember).where(ProjectMember.project_id == project_id).options(joinedload(ProjectMember.user))
         )
         return [member.to_dto(with_user=True) for member in result.all()]
 
+    @invalidates
     async def create(self, project_member_dto: dto.ProjectMember) -> dto.ProjectMember:
         project_member = ProjectMember.from_dto(project_member_dto)
         self._save(project_member)
@@ -29,6 +32,7 @@ class ProjectMemberDAO(BaseDAO[ProjectMember]):
         else:
             return project_member.to_dto()
 
+    @invalidates
     async def remove(self, project_member_dto: dto.ProjectMember):
         await self._session.execute(
             delete(ProjectMember).where(
@@ -1,19 +1,21 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import Result, select, delete, func, and_
+from sqlalchemy import Result, select, delete, func, and_, insert, literal, true, ColumnElement, CTE
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from planify.common import dt_utils
 from planify.core.models import dto
-from planify.core.utils.exceptions import NoRefreshSessionFound
+from planify.core.utils.exceptions import NoRefreshSessionFound, SessionExpired, InvalidRefreshSession
+from planify.infrastructure.db.dao.memo import RequestMemo, invalidates
 from planify.infrastructure.db.dao.rdb.base import BaseDAO
 from planify.infrastructure.db.models import RefreshSession
 
 
 class RefreshSessionDAO(BaseDAO[RefreshSession]):
-    def __init__(self, session: AsyncSession):
-        super().__init__(RefreshSession, session)
+    def __init__(self, session: AsyncSession, memo: RequestMemo):
+        super().__init__(RefreshSession, session, memo)
 
     async def get_by_id(self, id_: UUID) -> dto.RefreshSession:
         try:
@@ -21,12 +23,129 @@ class RefreshSessionDAO(BaseDAO[RefreshSession]):
         except NoResultFound as e:
             raise NoRefreshSessionFound from e
 
+    @invalidates
     async def create(self, refresh_session_dto: dto.RefreshSession) -> dto.RefreshSession:
         refresh_session = RefreshSession.from_dto(refresh_session_dto)
         self._save(refresh_session)
         await self._flush(refresh_session)
         return refresh_session.to_dto()
 
+    @invalidates
+    async def create_with_limit(
+        self,
+        refresh_session_dto: dto.RefreshSession,
+        max_sessions_count: int,
+    ) -> dto.RefreshSession:
+        trimmed = self._trim_sessions_cte(
+            literal(refresh_session_dto.user_id, RefreshSession.user_id.type), max_sessions_count
+        )
+        result = await self._session.scalars(
+            insert(RefreshSession)
+            .add_cte(trimmed)
+            .values(
+                id=refresh_session_dto.id,
+                user_id=refresh_session_dto.user_id,
+                device=refresh_session_dto.device,
+                fingerprint=refresh_session_dto.fingerprint,
+                ip=refresh_session_dto.ip,
+                expires_in=refresh_session_dto.expires_in,
+            )
+            .returning(RefreshSession)
+        )
+        return result.one().to_dto()
+
+    @invalidates
+    async def rotate(
+        self,
+        refresh_session_id: UUID,
+        new_refresh_session_id: UUID,
+        fingerprint: UUID,
+        device: str,
+        ip: str,
+        expires_in: datetime,
+        max_sessions_count: int,
+    ) -> dto.RefreshSession:
+        now = dt_utils.now()
+        old = select(RefreshSession.expires_in).where(RefreshSession.id == refresh_session_id).cte("old")
+        removed = (
+            delete(RefreshSession)
+            .where(
+                RefreshSession.id == refresh_session_id,
+                RefreshSession.fingerprint == fingerprint,
+                RefreshSession.expires_in > now,
+            )
+            .returning(RefreshSession.id, RefreshSession.user_id)
+            .cte("removed")
+        )
+        trimmed = self._trim_sessions_cte(
+            select(removed.c.user_id).scalar_subquery(), max_sessions_count, exclude_id=refresh_session_id
+        )
+        inserted = (
+            insert(RefreshSession)
+            .from_select(
+                ["id", "user_id", "device", "fingerprint", "ip", "expires_in"],
+                select(
+                    literal(new_refresh_session_id, RefreshSession.id.type),
+                    removed.c.user_id,
+                    literal(device, RefreshSession.device.type),
+                    literal(fingerprint, RefreshSession.fingerprint.type),
+                    literal(ip, RefreshSession.ip.type),
+                    literal(expires_in, RefreshSession.expires_in.type),
+                ),
+            )
+            .returning(*RefreshSession.__table__.columns)
+            .cte("inserted")
+        )
+        result = await self._session.execute(
+            select(old.c.expires_in.label("old_expires_in"), inserted)
+            .select_from(old.outerjoin(inserted, true()))
+            .add_cte(trimmed)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise NoRefreshSessionFound
+        if row.id is None:
+            if row.old_expires_in <= now:
+                raise SessionExpired
+            raise InvalidRefreshSession
+
+        return dto.RefreshSession(
+            id=row.id,
+            user_id=row.user_id,
+            device=row.device,
+            fingerprint=row.fingerprint,
+            ip=row.ip,
+            expires_in=row.expires_in,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+    @staticmethod
+    def _trim_sessions_cte(
+        user_id: ColumnElement[UUID],
+        max_sessions_count: int,
+        exclude_id: UUID | None = None,
+    ) -> CTE:
+        # keeps the newest sessions so that the one being inserted fits into the limit
+        whereclause = [RefreshSession.user_id == user_id]
+        if exclude_id is not None:
+            whereclause.append(RefreshSession.id != exclude_id)
+
+        return (
+            delete(RefreshSession)
+            .where(
+                RefreshSession.id.in_(
+                    select(RefreshSession.id)
+                    .where(*whereclause)
+                    .order_by(RefreshSession.created_at.desc())
+                    .offset(max(max_sessions_count - 1, 0))
+                )
+            )
+            .returning(RefreshSession.id)
+            .cte("trimmed")
+        )
+
+    @invalidates
     async def remove_by_id(self, id_: UUID) -> int:
         result: Result[tuple[int]] = await self._session.execute(
             delete(RefreshSession).where(RefreshSession.id == id_).returning(RefreshSession.id)
@@ -36,6 +155,7 @@ class RefreshSessionDAO(BaseDAO[RefreshSession]):
         except NoResultFound as e:
             raise NoRefreshSessionFound from e
 
+    @invalidates
     async def remove_oldest_by_user_id(self, user_id: UUID):
         await self._session.execute(
             delete(RefreshSession).where(
@@ -48,6 +168,23 @@ class RefreshSessionDAO(BaseDAO[RefreshSession]):
             )
         )
 
+    @invalidates
+    async def remove_expired(self, limit: int) -> int:
+        result: Result[tuple[UUID]] = await self._session.execute(
+            delete(RefreshSession)
+            .where(
+                RefreshSession.id.in_(
+                    select(RefreshSession.id)
+                    .where(RefreshSession.expires_in <= dt_utils.now())
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+            )
+            .returning(RefreshSession.id)
+        )
+        return len(result.all())
+
+    @invalidates
     async def remove_by_user_id(self, user_id: UUID):
         await self._session.execute(delete(RefreshSession).where(RefreshSession.user_id == user_id))
 
@@ -1,18 +1,100 @@
-from sqlalchemy import select, Result
+from collections import Counter
+from typing import Any, AsyncIterator, Mapping
+
+from sqlalchemy import (
+    any_,
+    bindparam,
+    update,
+    cast,
+    delete,
+    func,
+    literal,
+    select,
+    types,
+    ColumnElement,
+    Row,
+    Select,
+    UnaryExpression,
+    true,
+    tuple_,
+    and_,
+    or_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, REGCONFIG, insert
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, joinedload
 
 from planify.core.models import dto
-from planify.core.utils.exceptions import TaskNotFound
+from planify.core.models.enums.task import TaskSortOrder
+from planify.core.models.enums.workspace import WorkspaceChangeAction, WorkspaceChangeEntity
+from planify.core.utils.exceptions import TaskNotFound, ProjectNotFound, NoWorkspaceMemberFound, StaleVersion
+from planify.infrastructure.db.dao.memo import RequestMemo, invalidates, memoized
+from planify.infrastructure.db.dao.projection import DTOBundle
 from planify.infrastructure.db.dao.rdb.base import BaseDAO
-from planify.infrastructure.db.models import Task
+from planify.infrastructure.db.dao.rdb.task_counter import adjust_task_counters
+from planify.infrastructure.db.dao.rdb.workspace_change import record_changes
+from planify.infrastructure.db.dao.rdb.workspace_member import active_members_exist
+from planify.infrastructure.db.models import Task, User, Project
+from planify.infrastructure.db.models.task import SEARCH_CONFIG
+
+_Author = aliased(User)
+_Performer = aliased(User)
+
+
+def _user_bundle(name: str, user: type[User]) -> DTOBundle:
+    return DTOBundle(
+        name,
+        dto.User,
+        user.id,
+        user.username,
+        user.first_name,
+        user.last_name,
+        user.email,
+        user.phone,
+        user.created_at,
+        user.updated_at,
+    )
+
+
+# list views skip the description and build DTOs from plain rows
+_TASK_LIST_BUNDLE = DTOBundle(
+    "task",
+    dto.Task,
+    Task.id,
+    Task.name,
+    Task.priority,
+    Task.status,
+    Task.deadline,
+    Task.workspace_id,
+    Task.project_id,
+    Task.author_id,
+    Task.performer_id,
+    Task.created_at,
+    Task.updated_at,
+    Task.version,
+)
+_AUTHOR_BUNDLE = _user_bundle("author", _Author)
+_PERFORMER_BUNDLE = _user_bundle("performer", _Performer)
+_PROJECT_LIST_BUNDLE = DTOBundle(
+    "project",
+    dto.Project,
+    Project.id,
+    Project.name,
+    Project.workspace_id,
+    Project.author_id,
+    Project.manager_id,
+    Project.created_at,
+    Project.updated_at,
+    Project.version,
+)
 
 
 class TaskDAO(BaseDAO[Task]):
-    def __init__(self, session: AsyncSession):
-        super().__init__(Task, session)
+    def __init__(self, session: AsyncSession, memo: RequestMemo):
+        super().__init__(Task, session, memo)
 
+    @memoized
     async def get_by_id(self, id_: int) -> dto.Task:
         try:
             return (
@@ -23,43 +105,348 @@ class TaskDAO(BaseDAO[Task]):
         except NoResultFound as e:
             raise TaskNotFound from e
 
+    @memoized
     async def get_by_workspace_id(self, workspace_id: int) -> list[dto.Task]:
+        result = await self._session.execute(
+            self._select_list().where(Task.workspace_id == workspace_id).order_by(Task.id.desc())
+        )
+        return [self._task_from_row(row) for row in result.all()]
+
+    @memoized
+    async def get_by_ids(self, task_ids: list[int], workspace_id: int) -> list[dto.Task]:
+        if not task_ids:
+            return []
         result = await self._session.scalars(
-            select(Task)
+            select(Task).where(
+                Task.workspace_id == workspace_id,
+                Task.id == any_(bindparam("task_ids", list(set(task_ids)), type_=ARRAY(types.BigInteger))),
+            )
+        )
+        return [task.to_dto() for task in result.all()]
+
+    @memoized
+    async def get_page_by_workspace_id(
+        self,
+        workspace_id: int,
+        limit: int,
+        task_filter: dto.TaskFilter = dto.TaskFilter(),
+        sort: TaskSortOrder = TaskSortOrder.NEWEST,
+        after: dto.TaskCursor | None = None,
+        with_relations: bool = True,
+    ) -> list[dto.Task]:
+        whereclause = [Task.workspace_id == workspace_id, *self._filter_clauses(task_filter)]
+        if after is not None:
+            whereclause.append(self._after_clause(sort, after))
+
+        if not with_relations:
+            result = await self._session.scalars(
+                select(_TASK_LIST_BUNDLE).where(*whereclause).order_by(*self._order_by(sort)).limit(limit)
+            )
+            return list(result.all())
+
+        result = await self._session.execute(
+            self._select_list().where(*whereclause).order_by(*self._order_by(sort)).limit(limit)
+        )
+        return [self._task_from_row(row) for row in result.all()]
+
+    @memoized
+    async def search(
+        self,
+        workspace_id: int,
+        query: str,
+        limit: int,
+        after: tuple[float, int] | None = None,
+    ) -> list[tuple[dto.Task, float]]:
+        ts_query = func.websearch_to_tsquery(cast(literal(SEARCH_CONFIG), REGCONFIG), query)
+        rank = func.ts_rank(Task.__table__.c.search_vector, ts_query, type_=types.Float)
+        whereclause = [Task.workspace_id == workspace_id, Task.__table__.c.search_vector.bool_op("@@")(ts_query)]
+        if after is not None:
+            whereclause.append(tuple_(rank, Task.id) < after)
+
+        result = await self._session.execute(
+            self._select_list()
+            .add_columns(rank.label("rank"))
+            .where(*whereclause)
+            .order_by(rank.desc(), Task.id.desc())
+            .limit(limit)
+        )
+        return [(self._task_from_row(row), row.rank) for row in result.all()]
+
+    async def stream_by_workspace_id(self, workspace_id: int, batch_size: int = 1000) -> AsyncIterator[dto.Task]:
+        result = await self._session.stream(
+            self._select_list()
             .where(Task.workspace_id == workspace_id)
-            .order_by(Task.id.desc())
-            .options(joinedload(Task.author), joinedload(Task.performer), joinedload(Task.project))
+            .order_by(Task.id)
+            .execution_options(yield_per=batch_size)
         )
-        return [task.to_dto(with_author=True, with_project=True, with_performer=True) for task in result.all()]
+        async for row in result:
+            yield self._task_from_row(row)
 
-    async def is_task_exists(self, task_id: int, workspace_id: int) -> bool:
-        result: Result[tuple[Task]] = await self._session.execute(
-            select(Task).where(Task.id == task_id, Task.workspace_id == workspace_id)
+    @staticmethod
+    def _select_list() -> Select:
+        return (
+            select(
+                _TASK_LIST_BUNDLE,
+                _AUTHOR_BUNDLE,
+                _PERFORMER_BUNDLE,
+                _PROJECT_LIST_BUNDLE,
+            )
+            .select_from(Task)
+            .outerjoin(_Author, Task.author_id == _Author.id)
+            .outerjoin(_Performer, Task.performer_id == _Performer.id)
+            .outerjoin(Project, Task.project_id == Project.id)
         )
-        return bool(result.scalar())
 
+    @staticmethod
+    def _task_from_row(row: Row) -> dto.Task:
+        task = row.task
+        task.author, task.performer, task.project = row.author, row.performer, row.project
+        return task
+
+    @staticmethod
+    def _filter_clauses(task_filter: dto.TaskFilter) -> list[ColumnElement[bool]]:
+        whereclause = []
+        if task_filter.status is not None:
+            whereclause.append(Task.status == task_filter.status)
+        if task_filter.priority is not None:
+            whereclause.append(Task.priority == task_filter.priority)
+        if task_filter.performer_id is not None:
+            whereclause.append(Task.performer_id == task_filter.performer_id)
+        if task_filter.project_id is not None:
+            whereclause.append(Task.project_id == task_filter.project_id)
+        if task_filter.deadline_from is not None:
+            whereclause.append(Task.deadline >= task_filter.deadline_from)
+        if task_filter.deadline_to is not None:
+            whereclause.append(Task.deadline < task_filter.deadline_to)
+        return whereclause
+
+    @staticmethod
+    def _order_by(sort: TaskSortOrder) -> list[UnaryExpression]:
+        match sort:
+            case TaskSortOrder.OLDEST:
+                return [Task.id.asc()]
+            case TaskSortOrder.DEADLINE:
+                return [Task.deadline.asc().nulls_last(), Task.id.asc()]
+            case TaskSortOrder.PRIORITY:
+                return [Task.priority.desc(), Task.id.desc()]
+            case TaskSortOrder.RECENTLY_UPDATED:
+                return [Task.updated_at.desc(), Task.id.desc()]
+            case _:
+                return [Task.id.desc()]
+
+    @staticmethod
+    def _after_clause(sort: TaskSortOrder, after: dto.TaskCursor) -> ColumnElement[bool]:
+        match sort:
+            case TaskSortOrder.OLDEST:
+                return Task.id > after.id
+            case TaskSortOrder.DEADLINE if after.value is None:
+                return and_(Task.deadline.is_(None), Task.id > after.id)
+            case TaskSortOrder.DEADLINE:
+                return or_(tuple_(Task.deadline, Task.id) > (after.value, after.id), Task.deadline.is_(None))
+            case TaskSortOrder.PRIORITY:
+                return tuple_(Task.priority, Task.id) < (after.value, after.id)
+            case TaskSortOrder.RECENTLY_UPDATED:
+                return tuple_(Task.updated_at, Task.id) < (after.value, after.id)
+            case _:
+                return Task.id < after.id
+
+    @memoized
+    async def is_task_exists(self, task_id: int, workspace_id: int) -> bool:
+        return await self.exists(id=task_id, workspace_id=workspace_id)
+
+    @invalidates
     async def create(self, task_dto: dto.Task) -> dto.Task:
         task = Task.from_dto(task_dto)
         self._save(task)
         await self._flush(task)
+        await adjust_task_counters(self._session, task.workspace_id, {(task.project_id, task.status, task.priority): 1})
+        await record_changes(
+            self._session, task.workspace_id, WorkspaceChangeEntity.TASK, WorkspaceChangeAction.UPSERT, [task.id]
+        )
         return task.to_dto()
 
-    async def update(self, task_dto: dto.Task) -> dto.Task:
-        try:
-            task = await self._get_by_id(task_dto.id)
-        except NoResultFound as e:
-            raise TaskNotFound from e
+    @invalidates
+    async def create_many(self, workspace_id: int, task_dtos: list[dto.Task]) -> list[int]:
+        # executemany with RETURNING goes through the batched insertmanyvalues path
+        result = await self._session.scalars(
+            insert(Task).returning(Task.id, sort_by_parameter_order=True),
+            [
+                {
+                    "name": task_dto.name,
+                    "description": task_dto.description,
+                    "priority": task_dto.priority,
+                    "status": task_dto.status,
+                    "deadline": task_dto.deadline,
+                    "workspace_id": workspace_id,
+                    "project_id": task_dto.project_id,
+                    "author_id": task_dto.author_id,
+                    "performer_id": task_dto.performer_id,
+                }
+                for task_dto in task_dtos
+            ],
+        )
+        task_ids = list(result.all())
+        await adjust_task_counters(
+            self._session,
+            workspace_id,
+            Counter((task_dto.project_id, task_dto.status, task_dto.priority) for task_dto in task_dtos),
+        )
+        await record_changes(
+            self._session, workspace_id, WorkspaceChangeEntity.TASK, WorkspaceChangeAction.UPSERT, task_ids
+        )
+        return task_ids
 
-        task.name = task_dto.name
-        task.description = task_dto.description
-        task.priority = task_dto.priority
-        task.status = task_dto.status
-        task.deadline = task_dto.deadline
-        task.project_id = task_dto.project_id
-        task.author_id = task_dto.author_id
-        task.performer_id = task_dto.performer_id
-        await self._flush(task)
+    @invalidates
+    async def transition(self, transition: dto.TaskTransition) -> list[int]:
+        old = (
+            select(Task.id, Task.project_id, Task.status, Task.priority)
+            .where(
+                Task.workspace_id == transition.workspace_id,
+                Task.id == any_(bindparam("task_ids", transition.task_ids, type_=ARRAY(types.BigInteger))),
+            )
+            .with_for_update()
+            .cte("old")
+        )
+        result = await self._session.execute(
+            update(Task)
+            .where(Task.id == old.c.id)
+            .values(**transition.changes, version=Task.version + 1)
+            .returning(
+                Task.id,
+                old.c.project_id,
+                old.c.status,
+                old.c.priority,
+                Task.project_id,
+                Task.status,
+                Task.priority,
+            )
+        )
+
+        task_ids, deltas = [], Counter()
+        for task_id, *keys in result.all():
+            task_ids.append(task_id)
+            deltas[tuple(keys[:3])] -= 1
+            deltas[tuple(keys[3:])] += 1
+        if task_ids:
+            await adjust_task_counters(self._session, transition.workspace_id, deltas)
+            await record_changes(
+                self._session,
+                transition.workspace_id,
+                WorkspaceChangeEntity.TASK,
+                WorkspaceChangeAction.UPSERT,
+                task_ids,
+            )
+        return task_ids
+
+    @invalidates
+    async def update(self, task_dto: dto.Task, versions: tuple[int, ...] | None = None) -> dto.Task:
+        return await self._update(
+            task_dto.id,
+            task_dto.workspace_id,
+            {
+                "name": task_dto.name,
+                "description": task_dto.description,
+                "priority": task_dto.priority,
+                "status": task_dto.status,
+                "deadline": task_dto.deadline,
+                "project_id": task_dto.project_id,
+                "author_id": task_dto.author_id,
+                "performer_id": task_dto.performer_id,
+            },
+            versions,
+        )
+
+    @invalidates
+    async def patch(self, task_patch: dto.TaskPatch, versions: tuple[int, ...] | None = None) -> dto.Task:
+        return await self._update(task_patch.id, task_patch.workspace_id, task_patch.changes, versions)
+
+    async def _update(
+        self, task_id: int, workspace_id: int, values: Mapping[str, Any], versions: tuple[int, ...] | None = None
+    ) -> dto.Task:
+        if not values:
+            return await self._get_unchanged(task_id, workspace_id, values, versions)
+
+        old = (
+            select(Task.id, Task.project_id, Task.status, Task.priority)
+            .where(Task.id == task_id, Task.workspace_id == workspace_id)
+            .with_for_update()
+            .cte("old")
+        )
+        result = await self._session.execute(
+            update(Task)
+            .where(
+                Task.id == old.c.id,
+                self._version_guard(versions),
+                self._project_guard(workspace_id, values),
+                active_members_exist([values.get("author_id"), values.get("performer_id")], workspace_id),
+                self._changed(values),
+            )
+            .values(**values, version=Task.version + 1)
+            .returning(Task, old.c.project_id, old.c.status, old.c.priority)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return await self._get_unchanged(task_id, workspace_id, values, versions)
+
+        task, *old_counter_key = row
+        new_counter_key = (task.project_id, task.status, task.priority)
+        if new_counter_key != tuple(old_counter_key):
+            await adjust_task_counters(
+                self._session, task.workspace_id, {tuple(old_counter_key): -1, new_counter_key: 1}
+            )
+        await record_changes(
+            self._session, task.workspace_id, WorkspaceChangeEntity.TASK, WorkspaceChangeAction.UPSERT, [task.id]
+        )
         return task.to_dto()
 
+    async def _get_unchanged(
+        self, task_id: int, workspace_id: int, values: Mapping[str, Any], versions: tuple[int, ...] | None
+    ) -> dto.Task:
+        # the guarded update matched nothing: either a check failed or there was nothing to change
+        result = await self._session.execute(
+            select(
+                Task,
+                self._project_guard(workspace_id, values).label("project_found"),
+                active_members_exist([values.get("author_id"), values.get("performer_id")], workspace_id).label(
+                    "members_found"
+                ),
+            ).where(Task.id == task_id, Task.workspace_id == workspace_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise TaskNotFound
+
+        task, project_found, members_found = row
+        if versions is not None and task.version not in versions:
+            raise StaleVersion
+        if not project_found:
+            raise ProjectNotFound
+        if not members_found:
+            raise NoWorkspaceMemberFound
+        return task.to_dto()
+
+    @staticmethod
+    def _version_guard(versions: tuple[int, ...] | None) -> ColumnElement[bool]:
+        return true() if versions is None else Task.version.in_(versions)
+
+    @staticmethod
+    def _project_guard(workspace_id: int, values: Mapping[str, Any]) -> ColumnElement[bool]:
+        project_id = values.get("project_id")
+        if project_id is None:
+            return true()
+        return select(Project.id).where(Project.id == project_id, Project.workspace_id == workspace_id).exists()
+
+    @invalidates
     async def remove(self, task_id: int):
-        await self._remove_by_id(task_id)
+        result = await self._session.execute(
+            delete(Task)
+            .where(Task.id == task_id)
+            .returning(Task.workspace_id, Task.project_id, Task.status, Task.priority)
+        )
+        removed = result.one_or_none()
+        if removed is not None:
+            workspace_id, project_id, status, priority = removed
+            await adjust_task_counters(self._session, workspace_id, {(project_id, status, priority): -1})
+            await record_changes(
+                self._session, workspace_id, WorkspaceChangeEntity.TASK, WorkspaceChangeAction.DELETE, [task_id]
+            )
@@ -0,0 +1,105 @@
+from collections import defaultdict
+from typing import Mapping
+
+from sqlalchemy import any_, bindparam, cast, delete, func, select, types
+from sqlalchemy.dialects.postgresql import ARRAY, Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from planify.core.models import dto
+from planify.core.models.enums.task import TaskPriority, TaskStatus
+from planify.infrastructure.db.dao.memo import RequestMemo, memoized, invalidates
+from planify.infrastructure.db.dao.rdb.base import BaseDAO
+from planify.infrastructure.db.models import Task, TaskCounter, Workspace
+from planify.infrastructure.db.models.task_counter import NO_PROJECT
+
+TaskCounterKey = tuple[int | None, TaskStatus, TaskPriority]
+
+
+def _add_on_conflict(stmt: Insert) -> Insert:
+    return stmt.on_conflict_do_update(
+        index_elements=[TaskCounter.workspace_id, TaskCounter.project_id, TaskCounter.status, TaskCounter.priority],
+        set_={"count": TaskCounter.count + stmt.excluded.count},
+    )
+
+
+async def adjust_task_counters(session: AsyncSession, workspace_id: int, deltas: Mapping[TaskCounterKey, int]) -> None:
+    # sorted so concurrent writers lock counter rows in the same order
+    rows = sorted(
+        (
+            {
+                "workspace_id": workspace_id,
+                "project_id": project_id if project_id is not None else NO_PROJECT,
+                "status": status,
+                "priority": priority,
+                "count": delta,
+            }
+            for (project_id, status, priority), delta in deltas.items()
+            if delta
+        ),
+        key=lambda row: (row["project_id"], row["status"].value, row["priority"].value),
+    )
+    if rows:
+        await session.execute(_add_on_conflict(insert(TaskCounter)), rows)
+
+
+async def move_project_counters(session: AsyncSession, project_id: int) -> None:
+    # tasks of a removed project are left without a project
+    removed = await session.execute(
+        delete(TaskCounter)
+        .where(TaskCounter.project_id == project_id)
+        .returning(TaskCounter.workspace_id, TaskCounter.status, TaskCounter.priority, TaskCounter.count)
+    )
+    deltas: dict[int, dict[TaskCounterKey, int]] = defaultdict(dict)
+    for workspace_id, status, priority, count in removed.all():
+        deltas[workspace_id][(None, status, priority)] = count
+    for workspace_id, workspace_deltas in deltas.items():
+        await adjust_task_counters(session, workspace_id, workspace_deltas)
+
+
+class TaskCounterDAO(BaseDAO[TaskCounter]):
+    def __init__(self, session: AsyncSession, memo: RequestMemo):
+        super().__init__(TaskCounter, session, memo)
+
+    @memoized
+    async def get_summary(self, workspace_id: int, project_id: int | None = None) -> dto.TaskSummary:
+        whereclause = [TaskCounter.workspace_id == workspace_id, TaskCounter.count != 0]
+        if project_id is not None:
+            whereclause.append(TaskCounter.project_id == project_id)
+
+        result = await self._session.execute(
+            select(TaskCounter.status, TaskCounter.priority, cast(func.sum(TaskCounter.count), types.BigInteger))
+            .where(*whereclause)
+            .group_by(TaskCounter.status, TaskCounter.priority)
+        )
+        summary = dto.TaskSummary(workspace_id=workspace_id, project_id=project_id)
+        for status, priority, count in result.all():
+            summary.total += count
+            summary.by_status[status] = summary.by_status.get(status, 0) + count
+            summary.by_priority[priority] = summary.by_priority.get(priority, 0) + count
+        return summary
+
+    @invalidates
+    async def reconcile(self, after_workspace_id: int, limit: int) -> list[int]:
+        workspace_ids = list(
+            await self._session.scalars(
+                select(Workspace.id).where(Workspace.id > after_workspace_id).order_by(Workspace.id).limit(limit)
+            )
+        )
+        if not workspace_ids:
+            return workspace_ids
+
+        in_batch = any_(bindparam("workspace_ids", workspace_ids, type_=ARRAY(types.BigInteger)))
+        await self._session.execute(delete(TaskCounter).where(TaskCounter.workspace_id == in_batch))
+        project_id = func.coalesce(Task.project_id, NO_PROJECT)
+        # additive upsert: counters of tasks committed after this snapshot were written by their own transactions
+        await self._session.execute(
+            _add_on_conflict(
+                insert(TaskCounter).from_select(
+                    ["workspace_id", "project_id", "status", "priority", "count"],
+                    select(Task.workspace_id, project_id, Task.status, Task.priority, func.count())
+                    .where(Task.workspace_id == in_batch)
+                    .group_by(Task.workspace_id, project_id, Task.status, Task.priority),
+                )
+            )
+        )
+        return workspace_ids
@@ -1,25 +1,59 @@
 from uuid import UUID
 
-from sqlalchemy import select, ScalarResult, Result
+from sqlalchemy import select, ScalarResult, Result, and_, any_, bindparam, func, or_, types
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import NoResultFound, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from planify.common.cache import TTLCache
 from planify.core.models import dto
 from planify.core.utils.exceptions import NoUsernameFound, UserExists, NoUserFound
-from planify.infrastructure.db.models import User
+from planify.infrastructure.db.dao.memo import RequestMemo, invalidates, memoized
+from planify.infrastructure.db.models import User, WorkspaceMember
 from .base import BaseDAO
 
 
 class UserDAO(BaseDAO[User]):
-    def __init__(self, session: AsyncSession):
-        super().__init__(User, session)
+    def __init__(self, session: AsyncSession, memo: RequestMemo, cache: TTLCache[UUID, dto.User]):
+        super().__init__(User, session, memo)
+        self._cache = cache
 
+    @memoized
     async def get_by_id(self, id_: UUID) -> dto.User:
+        user_dto = self._cache.get(id_)
+        if user_dto is not None:
+            return user_dto
+
         try:
-            return (await self._get_by_id(id_)).to_dto()
+            user_dto = (await self._get_by_id(id_)).to_dto()
         except NoResultFound as e:
             raise NoUserFound from e
 
+        self._cache.set(id_, user_dto)
+        return user_dto
+
+    @memoized
+    async def get_by_ids(self, user_ids: list[UUID]) -> list[dto.User]:
+        users, uncached_user_ids = [], []
+        for user_id in dict.fromkeys(user_ids):
+            user_dto = self._cache.get(user_id)
+            if user_dto is None:
+                uncached_user_ids.append(user_id)
+            else:
+                users.append(user_dto)
+
+        if uncached_user_ids:
+            result: ScalarResult[User] = await self._session.scalars(
+                select(User).where(
+                    User.id == any_(bindparam("user_ids", uncached_user_ids, type_=ARRAY(types.UUID(as_uuid=True))))
+                )
+            )
+            for user in result.all():
+                user_dto = user.to_dto()
+                self._cache.set(user_dto.id, user_dto)
+                users.append(user_dto)
+        return users
+
     async def get_by_username(self, username: str) -> dto.User:
         return (await self._get_by_username(username)).to_dto()
 
@@ -35,12 +69,34 @@ class UserDAO(BaseDAO[User]):
             raise NoUsernameFound from e
         return user
 
-    async def search_by_username(self, username: str, offset: int, limit: int) -> list[dto.User]:
-        result: ScalarResult[User] = await self._session.scalars(
-            select(User).where(User.username.ilike(f"%{username}%")).limit(limit).offset(offset)
+    @memoized
+    async def search_by_username(
+        self,
+        username: str,
+        limit: int,
+        after: tuple[float, str] | None = None,
+        exclude_workspace_id: int | None = None,
+    ) -> list[tuple[dto.User, float]]:
+        pattern = username.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        rank = func.similarity(User.username, username, type_=types.Float)
+        # ILIKE is served by the trigram index, similarity only ranks the matches
+        whereclause = [User.username.ilike(f"%{pattern}%", escape="\\")]
+        if after is not None:
+            after_rank, after_username = after
+            whereclause.append(or_(rank < after_rank, and_(rank == after_rank, User.username > after_username)))
+        if exclude_workspace_id is not None:
+            whereclause.append(
+                ~select(WorkspaceMember.user_id)
+                .where(WorkspaceMember.user_id == User.id, WorkspaceMember.workspace_id == exclude_workspace_id)
+                .exists()
+            )
+
+        result = await self._session.execute(
+            select(User, rank).where(*whereclause).order_by(rank.desc(), User.username).limit(limit)
         )
-        return [user.to_dto() for user in result.all()]
+        return [(user.to_dto(), user_rank) for user, user_rank in result.all()]
 
+    @invalidates
     async def create(self, user_dto: dto.UserWithCredentials) -> dto.User:
         user = User.from_dto(user_dto)
         user.hashed_password = user_dto.hashed_password
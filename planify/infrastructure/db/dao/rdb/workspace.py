@@ -1,44 +1,83 @@
+from functools import partial
+from typing import Any, Mapping
 from uuid import UUID
 
-from sqlalchemy import ScalarResult, select
+from sqlalchemy import ScalarResult, select, update
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from planify.core.models import dto
 from planify.core.utils.exceptions import NoWorkspaceFound
+from planify.infrastructure.db.cache import MembershipCache, evict
+from planify.infrastructure.db.dao.memo import RequestMemo, invalidates, memoized
 from planify.infrastructure.db.dao.rdb.base import BaseDAO
 from planify.infrastructure.db.models import Workspace, WorkspaceMember
 
 
+async def bump_generation(session: AsyncSession, workspace_id: int) -> None:
+    await session.execute(
+        update(Workspace).where(Workspace.id == workspace_id)
+        # keep updated_at for changes of the workspace itself
+        .values(generation=Workspace.generation + 1, updated_at=Workspace.updated_at)
+    )
+
+
 class WorkspaceDAO(BaseDAO[Workspace]):
-    def __init__(self, session: AsyncSession):
-        super().__init__(Workspace, session)
+    def __init__(self, session: AsyncSession, memo: RequestMemo, membership_cache: MembershipCache):
+        super().__init__(Workspace, session, memo)
+        self._membership_cache = membership_cache
 
+    @memoized
     async def get_by_id(self, id_: int):
         try:
             return (await self._get_by_id(id_)).to_dto()
         except NoResultFound as e:
             raise NoWorkspaceFound from e
 
+    @memoized
+    async def get_generation(self, workspace_id: int) -> int:
+        generation = await self._session.scalar(select(Workspace.generation).where(Workspace.id == workspace_id))
+        if generation is None:
+            raise NoWorkspaceFound
+        return generation
+
+    @invalidates
     async def create(self, workspace_dto: dto.Workspace) -> dto.Workspace:
         workspace = Workspace.from_dto(workspace_dto)
         self._save(workspace)
         await self._flush(workspace)
         return workspace.to_dto()
 
+    @invalidates
     async def update(self, workspace_dto: dto.Workspace) -> dto.Workspace:
-        try:
-            workspace = await self._get_by_id(workspace_dto.id)
-        except NoResultFound as e:
-            raise NoWorkspaceFound from e
+        return await self._update(workspace_dto.id, {"name": workspace_dto.name})
 
-        workspace.name = workspace_dto.name
-        await self._flush(workspace)
+    @invalidates
+    async def patch(self, workspace_patch: dto.WorkspacePatch) -> dto.Workspace:
+        return await self._update(workspace_patch.id, workspace_patch.changes)
+
+    async def _update(self, workspace_id: int, values: Mapping[str, Any]) -> dto.Workspace:
+        workspace = None
+        if values:
+            workspace = await self._session.scalar(
+                update(Workspace)
+                .where(Workspace.id == workspace_id, self._changed(values))
+                .values(**values)
+                .returning(Workspace)
+            )
+        if workspace is None:
+            try:
+                workspace = await self._get_by_id(workspace_id)
+            except NoResultFound as e:
+                raise NoWorkspaceFound from e
         return workspace.to_dto()
 
+    @invalidates
     async def remove(self, workspace_id: int):
+        evict(self._session, partial(self._membership_cache.pop_if, lambda key: key[1] == workspace_id))
         await self._remove_by_id(workspace_id)
 
+    @memoized
     async def get_workspaces_by_user(self, user_id: UUID) -> list[dto.Workspace]:
         result: ScalarResult[Workspace] = await self._session.scalars(
             select(Workspace).where(
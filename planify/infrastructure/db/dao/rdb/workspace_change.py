@@ -0,0 +1,114 @@
+from datetime import datetime
+from typing import Any, Iterable
+
+from sqlalchemy import any_, bindparam, delete, func, insert, select, types, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from planify.core.models import dto
+from planify.core.models.enums.workspace import WorkspaceChangeAction, WorkspaceChangeEntity
+from planify.core.utils.exceptions import NoWorkspaceFound
+from planify.infrastructure.db.dao.memo import RequestMemo, invalidates, memoized
+from planify.infrastructure.db.dao.rdb.base import BaseDAO
+from planify.infrastructure.db.dao.rdb.workspace import bump_generation
+from planify.infrastructure.db.models import Workspace, WorkspaceChange
+
+
+async def record_changes(
+    session: AsyncSession,
+    workspace_id: int,
+    entity: WorkspaceChangeEntity,
+    action: WorkspaceChangeAction,
+    entity_ids: Iterable[Any],
+) -> None:
+    rows = [
+        {"workspace_id": workspace_id, "entity": entity, "entity_id": str(entity_id), "action": action}
+        for entity_id in entity_ids
+    ]
+    if not rows:
+        return
+
+    # the generation bump locks the workspace row until commit, so change ids of a workspace follow its commit order
+    await bump_generation(session, workspace_id)
+    await session.execute(insert(WorkspaceChange), rows)
+
+
+class WorkspaceChangeDAO(BaseDAO[WorkspaceChange]):
+    def __init__(self, session: AsyncSession, memo: RequestMemo):
+        super().__init__(WorkspaceChange, session, memo)
+
+    @memoized
+    async def get_compacted_change_id(self, workspace_id: int) -> int:
+        change_id = await self._session.scalar(
+            select(Workspace.compacted_change_id).where(Workspace.id == workspace_id)
+        )
+        if change_id is None:
+            raise NoWorkspaceFound
+        return change_id
+
+    @memoized
+    async def get_last_change_id(self, workspace_id: int) -> int:
+        change_id = await self._session.scalar(
+            select(func.max(WorkspaceChange.id)).where(WorkspaceChange.workspace_id == workspace_id)
+        )
+        return change_id or 0
+
+    @memoized
+    async def get_changes(self, workspace_id: int, after: int, limit: int) -> list[dto.WorkspaceChange]:
+        result = await self._session.scalars(
+            select(WorkspaceChange)
+            .where(WorkspaceChange.workspace_id == workspace_id, WorkspaceChange.id > after)
+            .order_by(WorkspaceChange.id)
+            .limit(limit)
+        )
+        return [change.to_dto() for change in result.all()]
+
+    @invalidates
+    async def compact(self, after_workspace_id: int, limit: int, retain_since: datetime) -> list[int]:
+        workspace_ids = list(
+            await self._session.scalars(
+                select(Workspace.id).where(Workspace.id > after_workspace_id).order_by(Workspace.id).limit(limit)
+            )
+        )
+        if not workspace_ids:
+            return workspace_ids
+
+        in_batch = any_(bindparam("workspace_ids", workspace_ids, type_=ARRAY(types.BigInteger)))
+        # only the latest change of an entity matters to any cursor before it
+        newer = aliased(WorkspaceChange)
+        await self._session.execute(
+            delete(WorkspaceChange).where(
+                WorkspaceChange.workspace_id == in_batch,
+                select(newer.id)
+                .where(
+                    newer.workspace_id == WorkspaceChange.workspace_id,
+                    newer.entity == WorkspaceChange.entity,
+                    newer.entity_id == WorkspaceChange.entity_id,
+                    newer.id > WorkspaceChange.id,
+                )
+                .exists(),
+            )
+        )
+
+        expired = (
+            delete(WorkspaceChange)
+            .where(WorkspaceChange.workspace_id == in_batch, WorkspaceChange.created_at < retain_since)
+            .returning(WorkspaceChange.workspace_id, WorkspaceChange.id)
+            .cte("expired")
+        )
+        compacted = (
+            select(expired.c.workspace_id, func.max(expired.c.id).label("change_id"))
+            .group_by(expired.c.workspace_id)
+            .subquery("compacted")
+        )
+        await self._session.execute(
+            update(Workspace)
+            .where(Workspace.id == compacted.c.workspace_id)
+            .values(
+                compacted_change_id=func.greatest(Workspace.compacted_change_id, compacted.c.change_id),
+                updated_at=Workspace.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return workspace_ids
@@ -1,41 +1,140 @@
-from typing import Sequence
+from functools import partial
+from typing import AsyncIterator, Sequence, Iterable
 from uuid import UUID
 
-from sqlalchemy import select, Result, ScalarResult
+from sqlalchemy import select, ScalarResult, and_, any_, bindparam, true, types, ColumnElement, Exists
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.exc import StaleDataError
 from sqlalchemy.orm.interfaces import ORMOption
 
 from planify.core.models import dto
-from planify.core.models.enums.workspace import WorkspaceMemberRole
-from planify.core.utils.exceptions import WorkspaceMemberExists, NoWorkspaceMemberFound, WorkspaceMemberCannotBeUpdated
+from planify.core.models.enums.workspace import WorkspaceChangeAction, WorkspaceChangeEntity, WorkspaceMemberRole
+from planify.common.cache import TTLCache
+from planify.core.utils.exceptions import (
+    WorkspaceMemberExists,
+    NoWorkspaceMemberFound,
+    WorkspaceMemberCannotBeUpdated,
+    NoUserFound,
+    StaleVersion,
+    ConcurrentUpdate,
+)
+from planify.infrastructure.db.cache import MembershipCache, evict
+from planify.infrastructure.db.dao.memo import RequestMemo, invalidates, memoized
 from planify.infrastructure.db.dao.rdb.base import BaseDAO
-from planify.infrastructure.db.models import WorkspaceMember
+from planify.infrastructure.db.dao.rdb.workspace_change import record_changes
+from planify.infrastructure.db.models import WorkspaceMember, User
+
+
+_MISSING = object()
+
+
+def active_member_exists(user_id: UUID, workspace_id: int) -> Exists:
+    return (
+        select(WorkspaceMember.user_id)
+        .where(
+            WorkspaceMember.user_id == user_id,
+            WorkspaceMember.workspace_id == workspace_id,
+            WorkspaceMember.active.is_(True),
+        )
+        .exists()
+    )
+
+
+def active_members_exist(user_ids: Iterable[UUID | None], workspace_id: int) -> ColumnElement[bool]:
+    return and_(true(), *(active_member_exists(user_id, workspace_id) for user_id in set(user_ids) - {None}))
 
 
 class WorkspaceMemberDAO(BaseDAO[WorkspaceMember]):
-    def __init__(self, session: AsyncSession):
-        super().__init__(WorkspaceMember, session)
+    def __init__(
+        self, session: AsyncSession, memo: RequestMemo, cache: MembershipCache, user_cache: TTLCache[UUID, dto.User]
+    ):
+        super().__init__(WorkspaceMember, session, memo)
+        self._cache = cache
+        self._user_cache = user_cache
 
+    @memoized
     async def is_member(
         self,
         user_id: UUID,
         workspace_id: int,
         roles: list[WorkspaceMemberRole] | None = None,
     ) -> bool:
-        whereclause = [
-            WorkspaceMember.user_id == user_id,
-            WorkspaceMember.workspace_id == workspace_id,
-            WorkspaceMember.active.is_(True),
-        ]
-        if roles:
-            whereclause.append(WorkspaceMember.role.in_(roles))
+        membership = await self.get_membership(user_id, workspace_id)
+        return membership is not None and membership.has_role(roles)
+
+    @memoized
+    async def get_membership(self, user_id: UUID, workspace_id: int) -> dto.WorkspaceMembership | None:
+        membership = self._cache.get((user_id, workspace_id), _MISSING)
+        if membership is not _MISSING:
+            return membership
 
-        result: Result[tuple[WorkspaceMember]] = await self._session.execute(
-            select(WorkspaceMember).where(*whereclause)
+        result = await self._session.execute(
+            select(WorkspaceMember.role, WorkspaceMember.active).where(
+                WorkspaceMember.user_id == user_id,
+                WorkspaceMember.workspace_id == workspace_id,
+            )
         )
-        return bool(result.scalar())
+        row = result.one_or_none()
+        membership = dto.WorkspaceMembership(role=row.role, active=row.active) if row is not None else None
+        self._cache.set((user_id, workspace_id), membership)
+        return membership
+
+    @memoized
+    async def get_non_members(self, user_ids: Iterable[UUID], workspace_id: int) -> set[UUID]:
+        non_members: set[UUID] = set()
+        uncached_user_ids: list[UUID] = []
+        for user_id in set(user_ids):
+            membership = self._cache.get((user_id, workspace_id), _MISSING)
+            if membership is _MISSING:
+                uncached_user_ids.append(user_id)
+            elif membership is None or not membership.has_role():
+                non_members.add(user_id)
+
+        if not uncached_user_ids:
+            return non_members
+
+        result = await self._session.execute(
+            select(WorkspaceMember.user_id, WorkspaceMember.role, WorkspaceMember.active).where(
+                WorkspaceMember.workspace_id == workspace_id,
+                WorkspaceMember.user_id
+                == any_(bindparam("user_ids", uncached_user_ids, type_=ARRAY(types.UUID(as_uuid=True)))),
+            )
+        )
+        memberships = {row.user_id: dto.WorkspaceMembership(role=row.role, active=row.active) for row in result.all()}
+        for user_id in uncached_user_ids:
+            membership = memberships.get(user_id)
+            self._cache.set((user_id, workspace_id), membership)
+            if membership is None or not membership.has_role():
+                non_members.add(user_id)
+        return non_members
+
+    @memoized
+    async def get_context(self, user_id: UUID, workspace_id: int) -> dto.WorkspaceContext:
+        user_dto = self._user_cache.get(user_id)
+        membership = self._cache.get((user_id, workspace_id), _MISSING)
+        if user_dto is not None and membership is not _MISSING:
+            return dto.WorkspaceContext(user=user_dto, workspace_id=workspace_id, membership=membership)
+
+        result = await self._session.execute(
+            select(User, WorkspaceMember.role, WorkspaceMember.active)
+            .outerjoin(
+                WorkspaceMember,
+                and_(WorkspaceMember.user_id == User.id, WorkspaceMember.workspace_id == workspace_id),
+            )
+            .where(User.id == user_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise NoUserFound
+
+        user_dto = row.User.to_dto()
+        membership = dto.WorkspaceMembership(role=row.role, active=row.active) if row.role is not None else None
+        self._user_cache.set(user_id, user_dto)
+        self._cache.set((user_id, workspace_id), membership)
+        return dto.WorkspaceContext(user=user_dto, workspace_id=workspace_id, membership=membership)
 
     async def _get_member(
         self,
@@ -48,6 +147,7 @@ class WorkspaceMemberDAO(BaseDAO[WorkspaceMember]):
         except NoResultFound as e:
             raise NoWorkspaceMemberFound from e
 
+    @memoized
     async def get_member(self, user_id: UUID, workspace_id: int) -> dto.WorkspaceMember:
         return (
             await self._get_member(
@@ -57,6 +157,22 @@ class WorkspaceMemberDAO(BaseDAO[WorkspaceMember]):
             )
         ).to_dto(with_user=True)
 
+    @memoized
+    async def get_by_user_ids(self, user_ids: list[UUID], workspace_id: int) -> list[dto.WorkspaceMember]:
+        if not user_ids:
+            return []
+        result: ScalarResult[WorkspaceMember] = await self._session.scalars(
+            select(WorkspaceMember)
+            .where(
+                WorkspaceMember.workspace_id == workspace_id,
+                WorkspaceMember.user_id
+                == any_(bindparam("user_ids", list(set(user_ids)), type_=ARRAY(types.UUID(as_uuid=True)))),
+            )
+            .options(joinedload(WorkspaceMember.user))
+        )
+        return [workspace_member.to_dto(with_user=True) for workspace_member in result.all()]
+
+    @memoized
     async def get_members(self, workspace_id: int) -> list[dto.WorkspaceMember]:
         result: ScalarResult[WorkspaceMember] = await self._session.scalars(
             select(WorkspaceMember)
@@ -66,22 +182,62 @@ class WorkspaceMemberDAO(BaseDAO[WorkspaceMember]):
         )
         return [member.to_dto(with_user=True) for member in result.all()]
 
+    async def stream_members(self, workspace_id: int, batch_size: int = 1000) -> AsyncIterator[dto.WorkspaceMember]:
+        result = await self._session.stream_scalars(
+            select(WorkspaceMember)
+            .where(WorkspaceMember.workspace_id == workspace_id)
+            .order_by(WorkspaceMember.created_at.desc())
+            .options(joinedload(WorkspaceMember.user))
+            .execution_options(yield_per=batch_size)
+        )
+        async for member in result:
+            yield member.to_dto(with_user=True)
+
+    @invalidates
     async def create(self, workspace_member_dto: dto.WorkspaceMember) -> dto.WorkspaceMember:
         workspace_member = WorkspaceMember.from_dto(workspace_member_dto)
+        evict(
+            self._session, partial(self._cache.pop, (workspace_member_dto.user_id, workspace_member_dto.workspace_id))
+        )
         self._save(workspace_member)
         try:
             await self._flush(workspace_member)
         except IntegrityError as e:
             raise WorkspaceMemberExists from e
-        else:
-            return workspace_member.to_dto()
 
-    async def update(self, workspace_member_dto: dto.WorkspaceMember) -> dto.WorkspaceMember:
+        await record_changes(
+            self._session,
+            workspace_member.workspace_id,
+            WorkspaceChangeEntity.MEMBER,
+            WorkspaceChangeAction.UPSERT,
+            [workspace_member.user_id],
+        )
+        return workspace_member.to_dto()
+
+    @invalidates
+    async def update(
+        self, workspace_member_dto: dto.WorkspaceMember, versions: tuple[int, ...] | None = None
+    ) -> dto.WorkspaceMember:
         workspace_member = await self._get_member(workspace_member_dto.user_id, workspace_member_dto.workspace_id)
         if workspace_member.role == WorkspaceMemberRole.OWNER:
             raise WorkspaceMemberCannotBeUpdated
+        if versions is not None and workspace_member.version not in versions:
+            raise StaleVersion
 
+        evict(
+            self._session, partial(self._cache.pop, (workspace_member_dto.user_id, workspace_member_dto.workspace_id))
+        )
         workspace_member.role = workspace_member_dto.role
         workspace_member.active = workspace_member_dto.active
-        await self._flush(workspace_member)
+        try:
+            await self._flush(workspace_member)
+        except StaleDataError as e:
+            raise ConcurrentUpdate from e
+        await record_changes(
+            self._session,
+            workspace_member.workspace_id,
+            WorkspaceChangeEntity.MEMBER,
+            WorkspaceChangeAction.UPSERT,
+            [workspace_member.user_id],
+        )
         return workspace_member.to_dto()
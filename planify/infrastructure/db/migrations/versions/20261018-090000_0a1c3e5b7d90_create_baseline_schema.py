@@ -0,0 +1,173 @@
+"""create baseline schema
+
+Revision ID: 0a1c3e5b7d90
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0a1c3e5b7d90"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+workspace_member_role = postgresql.ENUM("OWNER", "ADMIN", "EDITOR", "VIEWER", name="workspacememberrole")
+task_priority = postgresql.ENUM("LOW", "MEDIUM", "HIGH", "CRITICAL", name="taskpriority")
+task_status = postgresql.ENUM("OPEN", "IN_PROGRESS", "IN_REVIEW", "DONE", "CLOSED", name="taskstatus")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("username", sa.Text(), nullable=False),
+        sa.Column("first_name", sa.Text(), nullable=True),
+        sa.Column("last_name", sa.Text(), nullable=True),
+        sa.Column("email", sa.Text(), nullable=True),
+        sa.Column("phone", sa.Text(), nullable=True),
+        sa.Column("hashed_password", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk__users")),
+        sa.UniqueConstraint("email", name=op.f("uq__users__email")),
+        sa.UniqueConstraint("phone", name=op.f("uq__users__phone")),
+    )
+    op.create_index(op.f("ix__users_username"), "users", ["username"], unique=True)
+    op.create_table(
+        "workspaces",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk__workspaces")),
+    )
+    op.create_table(
+        "projects",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("workspace_id", sa.BigInteger(), nullable=False),
+        sa.Column("author_id", sa.UUID(), nullable=True),
+        sa.Column("manager_id", sa.UUID(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["author_id"], ["users.id"], name=op.f("projects_author_id_fkey"), ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(
+            ["manager_id"], ["users.id"], name=op.f("projects_manager_id_fkey"), ondelete="SET NULL"
+        ),
+        sa.ForeignKeyConstraint(
+            ["workspace_id"], ["workspaces.id"], name=op.f("projects_workspace_id_fkey"), ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk__projects")),
+    )
+    op.create_index(op.f("ix__projects_workspace_id"), "projects", ["workspace_id"], unique=False)
+    op.create_table(
+        "refresh_sessions",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("device", sa.Text(), nullable=False),
+        sa.Column("fingerprint", sa.UUID(), nullable=False),
+        sa.Column("ip", sa.String(length=15), nullable=False),
+        sa.Column("expires_in", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], name=op.f("refresh_sessions_user_id_fkey"), ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk__refresh_sessions")),
+    )
+    op.create_index(op.f("ix__refresh_sessions_user_id"), "refresh_sessions", ["user_id"], unique=False)
+    op.create_table(
+        "workspace_members",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("workspace_id", sa.BigInteger(), nullable=False),
+        sa.Column("role", workspace_member_role, nullable=False),
+        sa.Column("active", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], name=op.f("workspace_members_user_id_fkey"), ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["workspace_id"], ["workspaces.id"], name=op.f("workspace_members_workspace_id_fkey"), ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("user_id", "workspace_id", name=op.f("pk__workspace_members")),
+    )
+    op.create_index(op.f("ix__workspace_members_user_id"), "workspace_members", ["user_id"], unique=False)
+    op.create_index(op.f("ix__workspace_members_workspace_id"), "workspace_members", ["workspace_id"], unique=False)
+    op.create_table(
+        "project_members",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("project_id", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["project_id"], ["projects.id"], name=op.f("project_members_project_id_fkey"), ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], name=op.f("project_members_user_id_fkey"), ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("user_id", "project_id", name=op.f("pk__project_members")),
+    )
+    op.create_index(op.f("ix__project_members_project_id"), "project_members", ["project_id"], unique=False)
+    op.create_index(op.f("ix__project_members_user_id"), "project_members", ["user_id"], unique=False)
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("priority", task_priority, nullable=False),
+        sa.Column("status", task_status, nullable=False),
+        sa.Column("deadline", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("workspace_id", sa.BigInteger(), nullable=False),
+        sa.Column("project_id", sa.BigInteger(), nullable=True),
+        sa.Column("author_id", sa.UUID(), nullable=False),
+        sa.Column("performer_id", sa.UUID(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["author_id"], ["users.id"], name=op.f("tasks_author_id_fkey"), ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(
+            ["performer_id"], ["users.id"], name=op.f("tasks_performer_id_fkey"), ondelete="SET NULL"
+        ),
+        sa.ForeignKeyConstraint(
+            ["project_id"], ["projects.id"], name=op.f("tasks_project_id_fkey"), ondelete="SET NULL"
+        ),
+        sa.ForeignKeyConstraint(
+            ["workspace_id"], ["workspaces.id"], name=op.f("tasks_workspace_id_fkey"), ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk__tasks")),
+    )
+    op.create_index(op.f("ix__tasks_author_id"), "tasks", ["author_id"], unique=False)
+    op.create_index(op.f("ix__tasks_performer_id"), "tasks", ["performer_id"], unique=False)
+    op.create_index(op.f("ix__tasks_project_id"), "tasks", ["project_id"], unique=False)
+    op.create_index(op.f("ix__tasks_workspace_id"), "tasks", ["workspace_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix__tasks_workspace_id"), table_name="tasks")
+    op.drop_index(op.f("ix__tasks_project_id"), table_name="tasks")
+    op.drop_index(op.f("ix__tasks_performer_id"), table_name="tasks")
+    op.drop_index(op.f("ix__tasks_author_id"), table_name="tasks")
+    op.drop_table("tasks")
+    op.drop_index(op.f("ix__project_members_user_id"), table_name="project_members")
+    op.drop_index(op.f("ix__project_members_project_id"), table_name="project_members")
+    op.drop_table("project_members")
+    op.drop_index(op.f("ix__workspace_members_workspace_id"), table_name="workspace_members")
+    op.drop_index(op.f("ix__workspace_members_user_id"), table_name="workspace_members")
+    op.drop_table("workspace_members")
+    op.drop_index(op.f("ix__refresh_sessions_user_id"), table_name="refresh_sessions")
+    op.drop_table("refresh_sessions")
+    op.drop_index(op.f("ix__projects_workspace_id"), table_name="projects")
+    op.drop_table("projects")
+    op.drop_table("workspaces")
+    op.drop_index(op.f("ix__users_username"), table_name="users")
+    op.drop_table("users")
+    task_status.drop(op.get_bind())
+    task_priority.drop(op.get_bind())
+    workspace_member_role.drop(op.get_bind())
@@ -0,0 +1,38 @@
+"""add refresh_sessions expires_in index
+
+Revision ID: 5b1f0c9a7e21
+Revises: 0a1c3e5b7d90
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1f0c9a7e21"
+down_revision: Union[str, None] = "0a1c3e5b7d90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix__refresh_sessions_expires_in"),
+            "refresh_sessions",
+            ["expires_in"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix__refresh_sessions_expires_in"),
+            table_name="refresh_sessions",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,42 @@
+"""add tasks workspace_id id index
+
+Revision ID: 8d3e4a6b2c10
+Revises: 5b1f0c9a7e21
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3e4a6b2c10"
+down_revision: Union[str, None] = "5b1f0c9a7e21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix__tasks_workspace_id_id",
+            "tasks",
+            ["workspace_id", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix__tasks_workspace_id", table_name="tasks", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix__tasks_workspace_id",
+            "tasks",
+            ["workspace_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix__tasks_workspace_id_id", table_name="tasks", postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""add tasks filter indexes
+
+Revision ID: 3f9a1c7d5e42
+Revises: 8d3e4a6b2c10
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9a1c7d5e42"
+down_revision: Union[str, None] = "8d3e4a6b2c10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXED_COLUMNS = ("status", "priority", "performer_id", "project_id", "deadline", "updated_at")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in INDEXED_COLUMNS:
+            op.create_index(
+                f"ix__tasks_workspace_id_{column}_id",
+                "tasks",
+                ["workspace_id", column, "id"],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in reversed(INDEXED_COLUMNS):
+            op.drop_index(f"ix__tasks_workspace_id_{column}_id", table_name="tasks", postgresql_concurrently=True)
@@ -0,0 +1,27 @@
+"""add workspaces generation
+
+Revision ID: a4c2e8f1b736
+Revises: 3f9a1c7d5e42
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4c2e8f1b736"
+down_revision: Union[str, None] = "3f9a1c7d5e42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("workspaces", sa.Column("generation", sa.BigInteger(), server_default="0", nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column("workspaces", "generation")
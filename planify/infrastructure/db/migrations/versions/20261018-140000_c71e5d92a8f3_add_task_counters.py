@@ -0,0 +1,47 @@
+"""add task counters
+
+Revision ID: c71e5d92a8f3
+Revises: a4c2e8f1b736
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c71e5d92a8f3"
+down_revision: Union[str, None] = "a4c2e8f1b736"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_counters",
+        sa.Column("workspace_id", sa.BigInteger(), nullable=False),
+        sa.Column("project_id", sa.BigInteger(), nullable=False),
+        sa.Column("status", postgresql.ENUM(name="taskstatus", create_type=False), nullable=False),
+        sa.Column("priority", postgresql.ENUM(name="taskpriority", create_type=False), nullable=False),
+        sa.Column("count", sa.BigInteger(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(
+            ["workspace_id"], ["workspaces.id"], name=op.f("task_counters_workspace_id_fkey"), ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("workspace_id", "project_id", "status", "priority", name=op.f("pk__task_counters")),
+    )
+    op.execute(
+        """
+        INSERT INTO task_counters (workspace_id, project_id, status, priority, count)
+        SELECT workspace_id, coalesce(project_id, 0), status, priority, count(*)
+        FROM tasks
+        GROUP BY workspace_id, coalesce(project_id, 0), status, priority
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("task_counters")
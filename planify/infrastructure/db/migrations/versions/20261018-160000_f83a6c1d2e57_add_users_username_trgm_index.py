@@ -0,0 +1,37 @@
+"""add users username trgm index
+
+Revision ID: f83a6c1d2e57
+Revises: e2b8d4a61f95
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f83a6c1d2e57"
+down_revision: Union[str, None] = "e2b8d4a61f95"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix__users_username_trgm",
+            "users",
+            ["username"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix__users_username_trgm", table_name="users", postgresql_concurrently=True)
@@ -0,0 +1,31 @@
+"""add row versions
+
+Revision ID: 9b4d7e2f6a18
+Revises: f83a6c1d2e57
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4d7e2f6a18"
+down_revision: Union[str, None] = "f83a6c1d2e57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("tasks", sa.Column("version", sa.Integer(), server_default="1", nullable=False))
+    op.add_column("projects", sa.Column("version", sa.Integer(), server_default="1", nullable=False))
+    op.add_column("workspace_members", sa.Column("version", sa.Integer(), server_default="1", nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column("workspace_members", "version")
+    op.drop_column("projects", "version")
+    op.drop_column("tasks", "version")
@@ -0,0 +1,55 @@
+"""add workspace changes
+
+Revision ID: d52a9c8e1f07
+Revises: 9b4d7e2f6a18
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d52a9c8e1f07"
+down_revision: Union[str, None] = "9b4d7e2f6a18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+workspace_change_entity = postgresql.ENUM("TASK", "PROJECT", "MEMBER", name="workspacechangeentity")
+workspace_change_action = postgresql.ENUM("UPSERT", "DELETE", name="workspacechangeaction")
+
+
+def upgrade() -> None:
+    op.add_column("workspaces", sa.Column("compacted_change_id", sa.BigInteger(), server_default="0", nullable=False))
+    op.create_table(
+        "workspace_changes",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("workspace_id", sa.BigInteger(), nullable=False),
+        sa.Column("entity", workspace_change_entity, nullable=False),
+        sa.Column("entity_id", sa.Text(), nullable=False),
+        sa.Column("action", workspace_change_action, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["workspace_id"], ["workspaces.id"], name=op.f("workspace_changes_workspace_id_fkey"), ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk__workspace_changes")),
+    )
+    op.create_index("ix__workspace_changes_workspace_id_id", "workspace_changes", ["workspace_id", "id"])
+    op.create_index(
+        "ix__workspace_changes_workspace_id_entity_entity_id_id",
+        "workspace_changes",
+        ["workspace_id", "entity", "entity_id", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix__workspace_changes_workspace_id_entity_entity_id_id", table_name="workspace_changes")
+    op.drop_index("ix__workspace_changes_workspace_id_id", table_name="workspace_changes")
+    op.drop_table("workspace_changes")
+    workspace_change_action.drop(op.get_bind())
+    workspace_change_entity.drop(op.get_bind())
+    op.drop_column("workspaces", "compacted_change_id")
@@ -0,0 +1,44 @@
+"""add tasks filter sort indexes
+
+Revision ID: 6e3b9f0d4c28
+Revises: d52a9c8e1f07
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6e3b9f0d4c28"
+down_revision: Union[str, None] = "d52a9c8e1f07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FILTER_COLUMNS = ("status", "priority", "performer_id", "project_id")
+SORT_COLUMNS = ("deadline", "priority", "updated_at")
+INDEXED_COLUMNS = [
+    (column, sort_column) for column in FILTER_COLUMNS for sort_column in SORT_COLUMNS if column != sort_column
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column, sort_column in INDEXED_COLUMNS:
+            op.create_index(
+                f"ix__tasks_workspace_id_{column}_{sort_column}_id",
+                "tasks",
+                ["workspace_id", column, sort_column, "id"],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column, sort_column in reversed(INDEXED_COLUMNS):
+            op.drop_index(
+                f"ix__tasks_workspace_id_{column}_{sort_column}_id", table_name="tasks", postgresql_concurrently=True
+            )
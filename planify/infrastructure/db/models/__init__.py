@@ -4,3 +4,5 @@ from .refresh_session import RefreshSession
 from .task import Task
 from .user import User
 from .workspace import Workspace, WorkspaceMember
+from .task_counter import TaskCounter
+from .workspace_change import WorkspaceChange
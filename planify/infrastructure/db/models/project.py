@@ -11,10 +11,11 @@ from planify.infrastructure.db.models.user import User
 
 class Project(TimestampMixin, Base):
     __tablename__ = "projects"
-    __mapper_args__ = {"eager_defaults": True}
     id: Mapped[int] = mapped_column(types.BigInteger, autoincrement=True, primary_key=True)
     name: Mapped[str] = mapped_column(types.Text, nullable=False)
     description: Mapped[str] = mapped_column(types.Text, nullable=True)
+    version: Mapped[int] = mapped_column(types.Integer, nullable=False, server_default="1")
+    __mapper_args__ = {"eager_defaults": True, "version_id_col": version}
     workspace_id: Mapped[int] = mapped_column(
         types.BigInteger,
         ForeignKey("workspaces.id", ondelete="CASCADE"),
@@ -47,6 +48,7 @@ class Project(TimestampMixin, Base):
             manager_id=self.manager_id,
             created_at=self.created_at,
             updated_at=self.updated_at,
+            version=self.version,
             author=self.author.to_dto() if with_author and self.author else None,
             manager=self.manager.to_dto() if with_manager and self.manager else None,
         )
@@ -22,7 +22,7 @@ class RefreshSession(TimestampMixin, Base):
     device: Mapped[str] = mapped_column(types.Text, nullable=False)
     fingerprint: Mapped[uuid.UUID] = mapped_column(types.UUID(as_uuid=True), nullable=False)
     ip: Mapped[str] = mapped_column(types.String(length=15), nullable=False)
-    expires_in: Mapped[datetime] = mapped_column(types.DateTime(timezone=True), nullable=False)
+    expires_in: Mapped[datetime] = mapped_column(types.DateTime(timezone=True), index=True, nullable=False)
 
     def __repr__(self):
         return f"<RefreshSession(id={self.id}, user_id={self.user_id})>"
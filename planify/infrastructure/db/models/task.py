@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import types, ForeignKey
+from sqlalchemy import types, Column, Computed, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from planify.core.models import dto
@@ -11,21 +12,51 @@ from planify.infrastructure.db.models.mixins import TimestampMixin
 from planify.infrastructure.db.models.project import Project
 from planify.infrastructure.db.models.user import User
 
+SEARCH_CONFIG = "simple"
+# equality filters and sort keys of task lists, every filter x sort pair is backed by an index
+FILTER_COLUMNS = ("status", "priority", "performer_id", "project_id")
+SORT_COLUMNS = ("deadline", "priority", "updated_at")
+
 
 class Task(TimestampMixin, Base):
     __tablename__ = "tasks"
-    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix__tasks_workspace_id_id", "workspace_id", "id"),
+        Index("ix__tasks_workspace_id_status_id", "workspace_id", "status", "id"),
+        Index("ix__tasks_workspace_id_priority_id", "workspace_id", "priority", "id"),
+        Index("ix__tasks_workspace_id_performer_id_id", "workspace_id", "performer_id", "id"),
+        Index("ix__tasks_workspace_id_project_id_id", "workspace_id", "project_id", "id"),
+        Index("ix__tasks_workspace_id_deadline_id", "workspace_id", "deadline", "id"),
+        Index("ix__tasks_workspace_id_updated_at_id", "workspace_id", "updated_at", "id"),
+        *(
+            Index(f"ix__tasks_workspace_id_{column}_{sort_column}_id", "workspace_id", column, sort_column, "id")
+            for column in FILTER_COLUMNS
+            for sort_column in SORT_COLUMNS
+            if column != sort_column
+        ),
+        Index("ix__tasks_search_vector", "search_vector", postgresql_using="gin"),
+    )
     id: Mapped[int] = mapped_column(types.BigInteger, autoincrement=True, primary_key=True)
     name: Mapped[str] = mapped_column(types.Text, nullable=False)
     description: Mapped[str] = mapped_column(types.Text, nullable=True)
     priority: Mapped[TaskPriority]
     status: Mapped[TaskStatus]
     deadline: Mapped[datetime] = mapped_column(types.DateTime(timezone=True), nullable=True)
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', name), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+    )
+    version: Mapped[int] = mapped_column(types.Integer, nullable=False, server_default="1")
+    # search_vector is maintained by postgres and only used in search queries, keep it out of ORM loads and writes
+    __mapper_args__ = {"eager_defaults": True, "exclude_properties": ["search_vector"], "version_id_col": version}
 
     workspace_id: Mapped[int] = mapped_column(
         types.BigInteger,
         ForeignKey("workspaces.id", ondelete="CASCADE"),
-        index=True,
         nullable=False,
     )
     project_id: Mapped[int] = mapped_column(
@@ -73,6 +104,7 @@ class Task(TimestampMixin, Base):
             performer_id=self.performer_id,
             created_at=self.created_at,
             updated_at=self.updated_at,
+            version=self.version,
             author=self.author.to_dto() if with_author and self.author else None,
             performer=self.performer.to_dto() if with_performer and self.performer else None,
             project=self.project.to_dto() if with_project and self.project else None,
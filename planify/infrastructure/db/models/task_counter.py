@@ -0,0 +1,27 @@
+from sqlalchemy import types, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from planify.core.models.enums.task import TaskPriority, TaskStatus
+from planify.infrastructure.db.models.base import Base
+
+# project_id of counters for tasks without a project
+NO_PROJECT = 0
+
+
+class TaskCounter(Base):
+    __tablename__ = "task_counters"
+    workspace_id: Mapped[int] = mapped_column(
+        types.BigInteger,
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    project_id: Mapped[int] = mapped_column(types.BigInteger, primary_key=True)
+    status: Mapped[TaskStatus] = mapped_column(primary_key=True)
+    priority: Mapped[TaskPriority] = mapped_column(primary_key=True)
+    count: Mapped[int] = mapped_column(types.BigInteger, nullable=False, server_default="0")
+
+    def __repr__(self):
+        return (
+            f"<TaskCounter(workspace_id={self.workspace_id}, project_id={self.project_id}, "
+            f"status={self.status}, priority={self.priority}, count={self.count})>"
+        )
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import types
+from sqlalchemy import types, Index
 from sqlalchemy.orm import mapped_column, Mapped
 
 from planify.core.models import dto
@@ -11,6 +11,11 @@ from planify.infrastructure.db.models.mixins import TimestampMixin
 class User(TimestampMixin, Base):
     __tablename__ = "users"
     __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index(
+            "ix__users_username_trgm", "username", postgresql_using="gin", postgresql_ops={"username": "gin_trgm_ops"}
+        ),
+    )
     id: Mapped[uuid.UUID] = mapped_column(types.UUID(as_uuid=True), primary_key=True)
     username: Mapped[str] = mapped_column(types.Text, unique=True, index=True, nullable=False)
     first_name: Mapped[str] = mapped_column(types.Text, nullable=True)
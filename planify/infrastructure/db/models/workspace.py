@@ -15,6 +15,10 @@ class Workspace(TimestampMixin, Base):
     __mapper_args__ = {"eager_defaults": True}
     id: Mapped[int] = mapped_column(types.BigInteger, autoincrement=True, primary_key=True)
     name: Mapped[str] = mapped_column(types.Text, nullable=False)
+    # bumped by every task, project and member write, used for ETags of list endpoints
+    generation: Mapped[int] = mapped_column(types.BigInteger, nullable=False, server_default="0")
+    # highest change id dropped from the change log by retention, older cursors have to resync
+    compacted_change_id: Mapped[int] = mapped_column(types.BigInteger, nullable=False, server_default="0")
 
     def __repr__(self):
         return f"<Workspace(id={self.id}, name={self.name})>"
@@ -39,7 +43,6 @@ class Workspace(TimestampMixin, Base):
 
 class WorkspaceMember(TimestampMixin, Base):
     __tablename__ = "workspace_members"
-    __mapper_args__ = {"eager_defaults": True}
     user_id: Mapped[uuid.UUID] = mapped_column(
         types.UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -56,6 +59,8 @@ class WorkspaceMember(TimestampMixin, Base):
     )
     role: Mapped[WorkspaceMemberRole]
     active: Mapped[bool] = mapped_column(types.Boolean, nullable=False, default=True)
+    version: Mapped[int] = mapped_column(types.Integer, nullable=False, server_default="1")
+    __mapper_args__ = {"eager_defaults": True, "version_id_col": version}
 
     user: Mapped["User"] = relationship()
 
@@ -73,6 +78,7 @@ class WorkspaceMember(TimestampMixin, Base):
             active=self.active,
             created_at=self.created_at,
             updated_at=self.updated_at,
+            version=self.version,
             user=self.user.to_dto() if with_user else None,
         )
 
@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from sqlalchemy import types, ForeignKey, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from planify.core.models import dto
+from planify.core.models.enums.workspace import WorkspaceChangeAction, WorkspaceChangeEntity
+from planify.infrastructure.db.models.base import Base
+
+
+class WorkspaceChange(Base):
+    __tablename__ = "workspace_changes"
+    __table_args__ = (
+        Index("ix__workspace_changes_workspace_id_id", "workspace_id", "id"),
+        Index("ix__workspace_changes_workspace_id_entity_entity_id_id", "workspace_id", "entity", "entity_id", "id"),
+    )
+    # written after the workspace generation bump, so ids of one workspace follow its commit order
+    id: Mapped[int] = mapped_column(types.BigInteger, autoincrement=True, primary_key=True)
+    workspace_id: Mapped[int] = mapped_column(
+        types.BigInteger,
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    entity: Mapped[WorkspaceChangeEntity]
+    entity_id: Mapped[str] = mapped_column(types.Text, nullable=False)
+    action: Mapped[WorkspaceChangeAction]
+    created_at: Mapped[datetime] = mapped_column(
+        types.DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    def __repr__(self):
+        return (
+            f"<WorkspaceChange(id={self.id}, workspace_id={self.workspace_id}, entity={self.entity}, "
+            f"entity_id={self.entity_id}, action={self.action})>"
+        )
+
+    def to_dto(self) -> dto.WorkspaceChange:
+        return dto.WorkspaceChange(
+            id=self.id,
+            entity=self.entity,
+            entity_id=self.entity_id,
+            action=self.action,
+        )
@@ -1,15 +1,24 @@
-from typing import AsyncIterable
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterable, AsyncIterator, Callable
 
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
 
 from planify.infrastructure.config.db import DbConfig
+from planify.infrastructure.db.cache import CacheHolder
 from planify.infrastructure.db.dao.holder import HolderDAO
 
 
+DaoFactory = Callable[[], AsyncContextManager[HolderDAO]]
+
+
 def dao_provider() -> HolderDAO:
     raise NotImplementedError
 
 
+def dao_factory() -> DaoFactory:
+    raise NotImplementedError
+
+
 class DbProvider:
     def __init__(self, config: DbConfig):
         self._config = config
@@ -19,10 +28,20 @@ class DbProvider:
             expire_on_commit=False,
             autoflush=False,
         )
+        self._cache = CacheHolder(config.cache)
 
-    async def get_dao(self) -> AsyncIterable[HolderDAO]:
+    @property
+    def cache(self) -> CacheHolder:
+        return self._cache
+
+    @asynccontextmanager
+    async def dao(self) -> AsyncIterator[HolderDAO]:
         async with self._pool() as session:
-            yield HolderDAO(session=session)
+            yield HolderDAO(session=session, cache=self._cache)
+
+    async def get_dao(self) -> AsyncIterable[HolderDAO]:
+        async with self.dao() as dao:
+            yield dao
 
     async def shutdown(self):
         await self._engine.dispose()
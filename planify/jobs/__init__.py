@@ -0,0 +1,52 @@
+from functools import partial
+
+from fastapi import FastAPI
+
+from planify.api.utils.hashing import PasswordHasher
+from planify.infrastructure.di.db import DbProvider
+from planify.jobs.config import JobsConfig
+from planify.jobs.hashing import report_password_hashing_stats
+from planify.jobs.periodic import PeriodicJob
+from planify.jobs.refresh_session import reap_expired_refresh_sessions
+from planify.jobs.task_counter import reconcile_workspace_task_counters
+from planify.jobs.workspace_change import compact_change_log
+
+
+def setup(app: FastAPI, db_provider: DbProvider, config: JobsConfig, password_hasher: PasswordHasher):
+    jobs: list[PeriodicJob] = []
+    if config.refresh_session_reaper.enabled:
+        jobs.append(
+            PeriodicJob(
+                name="refresh_session_reaper",
+                func=partial(reap_expired_refresh_sessions, db_provider, config.refresh_session_reaper),
+                interval=config.refresh_session_reaper.interval,
+            )
+        )
+    if config.task_counter_reconciler.enabled:
+        jobs.append(
+            PeriodicJob(
+                name="task_counter_reconciler",
+                func=partial(reconcile_workspace_task_counters, db_provider, config.task_counter_reconciler),
+                interval=config.task_counter_reconciler.interval,
+            )
+        )
+    if config.workspace_change_compactor.enabled:
+        jobs.append(
+            PeriodicJob(
+                name="workspace_change_compactor",
+                func=partial(compact_change_log, db_provider, config.workspace_change_compactor),
+                interval=config.workspace_change_compactor.interval,
+            )
+        )
+    if config.password_hashing_stats.enabled:
+        jobs.append(
+            PeriodicJob(
+                name="password_hashing_stats",
+                func=partial(report_password_hashing_stats, password_hasher),
+                interval=config.password_hashing_stats.interval,
+            )
+        )
+
+    for job in jobs:
+        app.add_event_handler("startup", job.start)
+        app.add_event_handler("shutdown", job.stop)
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+
+@dataclass(frozen=True)
+class PeriodicJobConfig:
+    enabled: bool
+    interval: timedelta
+    batch_size: int
+
+
+@dataclass(frozen=True)
+class ChangeCompactorConfig(PeriodicJobConfig):
+    retention: timedelta
+
+
+@dataclass(frozen=True)
+class StatsReporterConfig:
+    enabled: bool
+    interval: timedelta
+
+
+@dataclass(frozen=True)
+class JobsConfig:
+    refresh_session_reaper: PeriodicJobConfig
+    task_counter_reconciler: PeriodicJobConfig
+    workspace_change_compactor: ChangeCompactorConfig
+    password_hashing_stats: StatsReporterConfig
@@ -0,0 +1,16 @@
+import logging
+
+from planify.api.utils.hashing import HashingStats, PasswordHasher
+
+logger = logging.getLogger(__name__)
+
+
+async def report_password_hashing_stats(password_hasher: PasswordHasher) -> HashingStats:
+    stats = password_hasher.collect_stats()
+
+    logger.info(
+        f"password hashing queue depth {stats.queue_depth}, peak waiting {stats.peak_waiting}, "
+        f"in flight {stats.in_flight}/{stats.max_in_flight} on {stats.max_workers} workers, "
+        f"completed {stats.completed}"
+    )
+    return stats
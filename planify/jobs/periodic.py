@@ -0,0 +1,37 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    def __init__(self, name: str, func: Callable[[], Awaitable[None]], interval: timedelta):
+        self._name = name
+        self._func = func
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self._name)
+
+    async def stop(self):
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self._interval.total_seconds())
+            try:
+                await self._func()
+            except Exception as e:
+                logger.exception(f"periodic job {self._name} failed", exc_info=e)
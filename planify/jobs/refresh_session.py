@@ -0,0 +1,15 @@
+import logging
+
+from planify.core.services.refresh_session import remove_expired_refresh_sessions
+from planify.infrastructure.di.db import DbProvider
+from planify.jobs.config import PeriodicJobConfig
+
+logger = logging.getLogger(__name__)
+
+
+async def reap_expired_refresh_sessions(db_provider: DbProvider, config: PeriodicJobConfig) -> int:
+    async with db_provider.dao() as dao:
+        removed = await remove_expired_refresh_sessions(dao.refresh_session, batch_size=config.batch_size)
+
+    logger.info(f"removed {removed} expired refresh sessions")
+    return removed
@@ -0,0 +1,15 @@
+import logging
+
+from planify.core.services.task import reconcile_task_counters
+from planify.infrastructure.di.db import DbProvider
+from planify.jobs.config import PeriodicJobConfig
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_workspace_task_counters(db_provider: DbProvider, config: PeriodicJobConfig) -> int:
+    async with db_provider.dao() as dao:
+        reconciled = await reconcile_task_counters(dao.task_counter, batch_size=config.batch_size)
+
+    logger.info(f"reconciled task counters of {reconciled} workspaces")
+    return reconciled
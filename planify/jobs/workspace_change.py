@@ -0,0 +1,17 @@
+import logging
+
+from planify.core.services.workspace import compact_workspace_changes
+from planify.infrastructure.di.db import DbProvider
+from planify.jobs.config import ChangeCompactorConfig
+
+logger = logging.getLogger(__name__)
+
+
+async def compact_change_log(db_provider: DbProvider, config: ChangeCompactorConfig) -> int:
+    async with db_provider.dao() as dao:
+        compacted = await compact_workspace_changes(
+            dao.workspace_change, batch_size=config.batch_size, retention=config.retention
+        )
+
+    logger.info(f"compacted change logs of {compacted} workspaces")
+    return compacted
@@ -11,9 +11,13 @@ from tests.fixtures.user import get_test_user
 
 
 @pytest.fixture(scope="session")
-def app(config_loader: ConfigLoader) -> FastAPI:
+def db_provider(config_loader: ConfigLoader) -> DbProvider:
+    return DbProvider(config_loader.db_config)
+
+
+@pytest.fixture(scope="session")
+def app(config_loader: ConfigLoader, db_provider: DbProvider) -> FastAPI:
     app = create_app()
-    db_provider = DbProvider(config_loader.db_config)
     dependencies.setup(app, db_provider, config_loader.api_config)
     return app
 
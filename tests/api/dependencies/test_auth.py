@@ -0,0 +1,84 @@
+import time
+import uuid
+from datetime import timedelta
+from typing import Iterator
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from planify.api.config import AuthConfig, HashingConfig
+from planify.api.config.hashing import HashingExecutorType
+from planify.api.dependencies.auth import AuthProperties
+from planify.api.utils.hashing import PasswordHasher
+
+SECRET_KEY = "secret"
+
+
+@pytest.fixture
+def auth_properties() -> Iterator[AuthProperties]:
+    password_hasher = PasswordHasher(
+        HashingConfig(executor_type=HashingExecutorType.THREAD, max_workers=1, max_in_flight=1)
+    )
+    yield AuthProperties(
+        AuthConfig(
+            secret_key=SECRET_KEY,
+            algorithm="HS256",
+            access_token_expiration=timedelta(minutes=15),
+            refresh_token_expiration=timedelta(days=30),
+            max_refresh_sessions_count=5,
+            token_cache_size=100,
+        ),
+        password_hasher,
+    )
+    password_hasher.shutdown()
+
+
+def _encode(claims: dict, secret_key: str = SECRET_KEY) -> str:
+    return jwt.encode(claims, secret_key, algorithm="HS256")
+
+
+def test_cached_token_expires_at_exp(auth_properties: AuthProperties):
+    session_id = uuid.uuid4()
+    exp = int(time.time()) + 2
+    token = _encode({"sub": str(session_id), "exp": exp})
+
+    assert auth_properties.get_refresh_session_id_by_token(token) == session_id
+    assert auth_properties.get_refresh_session_id_by_token(token) == session_id
+    stats = auth_properties.token_cache_stats
+    assert (stats.hits, stats.size) == (1, 1)
+
+    # jose rejects a token only once the clock is past exp
+    time.sleep(exp + 1.1 - time.time())
+    with pytest.raises(HTTPException) as exc_info:
+        auth_properties.get_refresh_session_id_by_token(token)
+    assert exc_info.value.status_code == 401
+    assert auth_properties.token_cache_stats.hits == 1
+
+
+@pytest.mark.parametrize(
+    "claims, secret_key",
+    [
+        ({"sub": str(uuid.uuid4()), "exp": int(time.time()) + 60}, "another secret"),
+        ({"sub": str(uuid.uuid4()), "exp": int(time.time()) - 60}, SECRET_KEY),
+        ({"exp": int(time.time()) + 60}, SECRET_KEY),
+    ],
+    ids=["bad signature", "expired", "no sub"],
+)
+def test_invalid_token_is_not_cached(auth_properties: AuthProperties, claims: dict, secret_key: str):
+    token = _encode(claims, secret_key)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            auth_properties.get_refresh_session_id_by_token(token)
+        assert exc_info.value.status_code == 401
+
+    stats = auth_properties.token_cache_stats
+    assert (stats.hits, stats.misses, stats.size) == (0, 2, 0)
+
+
+def test_malformed_token_is_not_cached(auth_properties: AuthProperties):
+    with pytest.raises(HTTPException):
+        auth_properties.get_refresh_session_id_by_token("not a jwt")
+
+    assert auth_properties.token_cache_stats.size == 0
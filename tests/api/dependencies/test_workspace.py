@@ -0,0 +1,17 @@
+import inspect
+
+from planify.api.dependencies.etag import workspace_etag
+from planify.api.dependencies.workspace import check_workspace, check_workspace_context
+from planify.core.models.enums.workspace import WorkspaceMemberRole
+
+
+def test_check_workspace_is_shared():
+    # FastAPI resolves a dependency once per request only when every declaration uses the same callable
+    assert check_workspace() is check_workspace()
+    assert check_workspace() is check_workspace(roles=[])
+    assert check_workspace(roles=[WorkspaceMemberRole.OWNER]) is check_workspace([WorkspaceMemberRole.OWNER])
+    assert check_workspace(roles=[WorkspaceMemberRole.OWNER]) is not check_workspace()
+    assert check_workspace_context() is check_workspace_context(None)
+
+    [depends] = inspect.signature(workspace_etag).parameters["workspace_id"].annotation.__metadata__
+    assert depends.dependency is check_workspace()
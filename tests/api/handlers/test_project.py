@@ -0,0 +1,96 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_patch_project(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "patch projects"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    response = await client.post(
+        "/v1/projects", params={"workspace_id": workspace_id}, json={"name": "project"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    project_id = response.json()["id"]
+
+    response = await client.patch(
+        f"/v1/projects/{project_id}",
+        params={"workspace_id": workspace_id},
+        json={"description": "description"},
+        headers=auth_credentials,
+    )
+    assert response.status_code == 200
+    project = response.json()
+    assert (project["name"], project["description"]) == ("project", "description")
+
+    response = await client.patch(
+        f"/v1/projects/{project_id}",
+        params={"workspace_id": workspace_id},
+        json={"name": "renamed"},
+        headers=auth_credentials,
+    )
+    assert response.status_code == 200
+    project = response.json()
+    assert (project["name"], project["description"]) == ("renamed", "description")
+
+    response = await client.patch(
+        f"/v1/projects/{project_id}",
+        params={"workspace_id": workspace_id},
+        json={"name": "renamed", "description": "description"},
+        headers=auth_credentials,
+    )
+    assert response.status_code == 200
+    assert response.json()["updated_at"] == project["updated_at"]
+
+    response = await client.patch(
+        f"/v1/projects/{project_id}",
+        params={"workspace_id": workspace_id},
+        json={"name": None},
+        headers=auth_credentials,
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_edit_project_if_match(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "project if-match"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    response = await client.post(
+        "/v1/projects", params={"workspace_id": workspace_id}, json={"name": "project"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    project_id = response.json()["id"]
+
+    response = await client.get(
+        f"/v1/projects/{project_id}", params={"workspace_id": workspace_id}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = await client.patch(
+        f"/v1/projects/{project_id}",
+        params={"workspace_id": workspace_id},
+        json={"name": "first"},
+        headers={**auth_credentials, "If-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    response = await client.patch(
+        f"/v1/projects/{project_id}",
+        params={"workspace_id": workspace_id},
+        json={"name": "second"},
+        headers={**auth_credentials, "If-Match": etag},
+    )
+    assert response.status_code == 412
+
+    response = await client.put(
+        f"/v1/projects/{project_id}",
+        params={"workspace_id": workspace_id},
+        json={"name": "second"},
+        headers={**auth_credentials, "If-Match": etag},
+    )
+    assert response.status_code == 412
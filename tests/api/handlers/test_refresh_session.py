@@ -0,0 +1,202 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from planify import DbProvider
+from planify.core.models import dto
+from planify.core.utils.exceptions import InvalidRefreshSession, NoRefreshSessionFound, SessionExpired
+from planify.jobs.config import PeriodicJobConfig
+from planify.jobs.refresh_session import reap_expired_refresh_sessions
+
+FINGERPRINT = uuid.UUID("3fa85f64-5717-4562-b3fc-2c963f66afa6")
+
+
+async def _create_user(client: AsyncClient) -> uuid.UUID:
+    username = f"r{uuid.uuid4().hex[:8]}"
+    response = await client.post(
+        "/v1/users/create",
+        json={"username": username, "email": f"{username}@planify.com", "password": "Morpheus1234!"},
+    )
+    assert response.status_code == 200
+    return uuid.UUID(response.json()["id"])
+
+
+async def _create_session(
+    db_provider: DbProvider, user_id: uuid.UUID, max_sessions_count: int, expires_in: timedelta = timedelta(days=1)
+) -> dto.RefreshSession:
+    # every session gets its own transaction so that created_at orders them
+    async with db_provider.dao() as dao:
+        refresh_session = await dao.refresh_session.create_with_limit(
+            dto.RefreshSession(
+                id=uuid.uuid4(),
+                user_id=user_id,
+                device="test",
+                fingerprint=FINGERPRINT,
+                ip="127.0.0.1",
+                expires_in=datetime.now(timezone.utc) + expires_in,
+            ),
+            max_sessions_count,
+        )
+        await dao.commit()
+    return refresh_session
+
+
+async def _rotate(
+    db_provider: DbProvider, refresh_session_id: uuid.UUID, fingerprint: uuid.UUID = FINGERPRINT, max_sessions_count=5
+) -> dto.RefreshSession:
+    async with db_provider.dao() as dao:
+        refresh_session = await dao.refresh_session.rotate(
+            refresh_session_id=refresh_session_id,
+            new_refresh_session_id=uuid.uuid4(),
+            fingerprint=fingerprint,
+            device="test",
+            ip="127.0.0.1",
+            expires_in=datetime.now(timezone.utc) + timedelta(days=1),
+            max_sessions_count=max_sessions_count,
+        )
+        await dao.commit()
+    return refresh_session
+
+
+@pytest.mark.asyncio
+async def test_refresh_tokens(client: AsyncClient):
+    username = f"r{uuid.uuid4().hex[:8]}"
+    response = await client.post(
+        "/v1/users/create",
+        json={"username": username, "email": f"{username}@planify.com", "password": "Morpheus1234!"},
+    )
+    assert response.status_code == 200
+    response = await client.post(
+        "/v1/auth/login", json={"username": username, "password": "Morpheus1234!", "fingerprint": str(FINGERPRINT)}
+    )
+    assert response.status_code == 200
+    refresh_token = response.json()["refresh"]["token"]
+
+    async def refresh(token: str, fingerprint: uuid.UUID = FINGERPRINT):
+        return await client.post(
+            "/v1/auth/refresh", json={"fingerprint": str(fingerprint)}, headers={"Refresh": f"Bearer {token}"}
+        )
+
+    response = await refresh(refresh_token, fingerprint=uuid.uuid4())
+    assert response.status_code == 401
+
+    response = await refresh(refresh_token)
+    assert response.status_code == 200
+    new_refresh_token = response.json()["refresh"]["token"]
+    assert new_refresh_token != refresh_token
+
+    response = await refresh(refresh_token)
+    assert response.status_code == 401
+    response = await refresh(new_refresh_token)
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_rotate_refresh_session(db_provider: DbProvider, client: AsyncClient):
+    user_id = await _create_user(client)
+    refresh_session = await _create_session(db_provider, user_id, max_sessions_count=5)
+
+    rotated = await _rotate(db_provider, refresh_session.id)
+    assert rotated.id != refresh_session.id
+    assert (rotated.user_id, rotated.fingerprint) == (user_id, FINGERPRINT)
+
+    async with db_provider.dao() as dao:
+        assert await dao.refresh_session.count_by_user_id(user_id) == 1
+        with pytest.raises(NoRefreshSessionFound):
+            await dao.refresh_session.get_by_id(refresh_session.id)
+
+    # the rotated session is gone, so its token cannot be replayed
+    with pytest.raises(NoRefreshSessionFound):
+        await _rotate(db_provider, refresh_session.id)
+
+
+@pytest.mark.asyncio
+async def test_rotate_refresh_session_errors(db_provider: DbProvider, client: AsyncClient):
+    user_id = await _create_user(client)
+
+    with pytest.raises(NoRefreshSessionFound):
+        await _rotate(db_provider, uuid.uuid4())
+
+    expired = await _create_session(db_provider, user_id, max_sessions_count=5, expires_in=-timedelta(minutes=1))
+    with pytest.raises(SessionExpired):
+        await _rotate(db_provider, expired.id)
+
+    refresh_session = await _create_session(db_provider, user_id, max_sessions_count=5)
+    with pytest.raises(InvalidRefreshSession):
+        await _rotate(db_provider, refresh_session.id, fingerprint=uuid.uuid4())
+
+    # a failed rotation leaves the session in place
+    async with db_provider.dao() as dao:
+        assert (await dao.refresh_session.get_by_id(refresh_session.id)).fingerprint == FINGERPRINT
+        assert (await dao.refresh_session.get_by_id(expired.id)).id == expired.id
+
+
+@pytest.mark.asyncio
+async def test_refresh_sessions_limit(db_provider: DbProvider, client: AsyncClient):
+    user_id = await _create_user(client)
+    sessions = [await _create_session(db_provider, user_id, max_sessions_count=3) for _ in range(4)]
+
+    async with db_provider.dao() as dao:
+        assert await dao.refresh_session.count_by_user_id(user_id) == 3
+        with pytest.raises(NoRefreshSessionFound):
+            await dao.refresh_session.get_by_id(sessions[0].id)
+
+    # rotating with a lower limit trims the oldest of the other sessions
+    rotated = await _rotate(db_provider, sessions[-1].id, max_sessions_count=2)
+
+    async with db_provider.dao() as dao:
+        assert await dao.refresh_session.count_by_user_id(user_id) == 2
+        with pytest.raises(NoRefreshSessionFound):
+            await dao.refresh_session.get_by_id(sessions[1].id)
+        assert (await dao.refresh_session.get_by_id(sessions[2].id)).id == sessions[2].id
+        assert (await dao.refresh_session.get_by_id(rotated.id)).id == rotated.id
+
+
+@pytest.mark.asyncio
+async def test_reap_expired_refresh_sessions(db_provider: DbProvider, client: AsyncClient):
+    user_id = await _create_user(client)
+    expired = [
+        await _create_session(db_provider, user_id, max_sessions_count=10, expires_in=-timedelta(minutes=1))
+        for _ in range(5)
+    ]
+    live = await _create_session(db_provider, user_id, max_sessions_count=10)
+
+    # a batch smaller than the backlog makes the reaper loop until a short batch
+    removed = await reap_expired_refresh_sessions(
+        db_provider, PeriodicJobConfig(enabled=True, interval=timedelta(minutes=5), batch_size=2)
+    )
+    assert removed >= len(expired)
+
+    async with db_provider.dao() as dao:
+        assert await dao.refresh_session.count_by_user_id(user_id) == 1
+        assert (await dao.refresh_session.get_by_id(live.id)).id == live.id
+
+
+@pytest.mark.asyncio
+async def test_remove_expired_skips_locked_sessions(db_provider: DbProvider, client: AsyncClient):
+    user_id = await _create_user(client)
+    locked, unlocked = [
+        await _create_session(db_provider, user_id, max_sessions_count=10, expires_in=-timedelta(minutes=1))
+        for _ in range(2)
+    ]
+
+    async with db_provider.dao() as holder:
+        # an uncommitted delete keeps the row locked until the transaction ends
+        await holder.refresh_session.remove_by_id(locked.id)
+
+        async with db_provider.dao() as dao:
+            removed = await asyncio.wait_for(dao.refresh_session.remove_expired(limit=100), timeout=5)
+            await dao.commit()
+        assert removed >= 1
+
+    # the holder rolled back, so the skipped session is still there for the next run
+    async with db_provider.dao() as dao:
+        assert (await dao.refresh_session.get_by_id(locked.id)).id == locked.id
+        with pytest.raises(NoRefreshSessionFound):
+            await dao.refresh_session.get_by_id(unlocked.id)
+        assert await dao.refresh_session.remove_expired(limit=100) >= 1
+        await dao.commit()
+        assert await dao.refresh_session.count_by_user_id(user_id) == 0
@@ -0,0 +1,594 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+from planify import DbProvider
+from planify.infrastructure.db.models import Task
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_pagination(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "pagination"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    created_ids = []
+    for i in range(5):
+        response = await client.post(
+            "/v1/tasks", params={"workspace_id": workspace_id}, json={"name": f"task {i}"}, headers=auth_credentials
+        )
+        assert response.status_code == 200
+        created_ids.append(response.json()["id"])
+
+    task_ids = []
+    params = {"workspace_id": workspace_id, "limit": 2}
+    while True:
+        response = await client.get("/v1/tasks", params=params, headers=auth_credentials)
+        assert response.status_code == 200
+
+        page = response.json()
+        assert len(page["items"]) <= 2
+        task_ids.extend(task["id"] for task in page["items"])
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    assert task_ids == sorted(created_ids, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_filtered_by_priority_sorted(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "filtering"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    priorities = ["low", "high", "critical", "high", "low", "critical"]
+    created = []
+    for i, priority in enumerate(priorities):
+        response = await client.post(
+            "/v1/tasks",
+            params={"workspace_id": workspace_id},
+            json={"name": f"task {i}", "priority": priority},
+            headers=auth_credentials,
+        )
+        assert response.status_code == 200
+        created.append(response.json())
+
+    params = {"workspace_id": workspace_id, "priority": "high", "sort": "oldest"}
+    response = await client.get("/v1/tasks", params=params, headers=auth_credentials)
+    assert response.status_code == 200
+    assert [task["id"] for task in response.json()["items"]] == [
+        task["id"] for task in created if task["priority"] == "high"
+    ]
+
+    task_ids = []
+    params = {"workspace_id": workspace_id, "sort": "priority", "limit": 1}
+    while True:
+        response = await client.get("/v1/tasks", params=params, headers=auth_credentials)
+        assert response.status_code == 200
+
+        page = response.json()
+        task_ids.extend(task["id"] for task in page["items"])
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    rank = {"critical": 0, "high": 1, "low": 2}
+    expected = sorted(created, key=lambda task: (rank[task["priority"]], -task["id"]))
+    assert task_ids == [task["id"] for task in expected]
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_omits_description(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "projection"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    response = await client.post(
+        "/v1/tasks", params={"workspace_id": workspace_id}, json={"name": "task"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    task = response.json()
+
+    response = await client.put(
+        f"/v1/tasks/{task['id']}",
+        params={"workspace_id": workspace_id},
+        json={
+            "name": task["name"],
+            "description": "long description",
+            "status": task["status"],
+            "priority": task["priority"],
+            "author_id": task["author_id"],
+        },
+        headers=auth_credentials,
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/v1/tasks", params={"workspace_id": workspace_id}, headers=auth_credentials)
+    assert response.status_code == 200
+    [item] = response.json()["items"]
+    assert "description" not in item
+    assert item["author"]["id"] == task["author_id"]
+
+    response = await client.get(
+        f"/v1/tasks/{task['id']}", params={"workspace_id": workspace_id}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    assert response.json()["description"] == "long description"
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_normalized(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "normalized"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    for i in range(3):
+        response = await client.post(
+            "/v1/tasks", params={"workspace_id": workspace_id}, json={"name": f"task {i}"}, headers=auth_credentials
+        )
+        assert response.status_code == 200
+    author_id = response.json()["author_id"]
+
+    response = await client.get(
+        "/v1/tasks", params={"workspace_id": workspace_id, "normalized": True}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+
+    page = response.json()
+    assert len(page["items"]) == 3
+    assert all(task["author"] is None and task["author_id"] == author_id for task in page["items"])
+    assert [user["id"] for user in page["included"]["users"]] == [author_id]
+    assert page["included"]["projects"] == []
+
+
+@pytest.mark.asyncio
+async def test_export_tasks(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "export"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    created_ids = []
+    for i in range(3):
+        response = await client.post(
+            "/v1/tasks", params={"workspace_id": workspace_id}, json={"name": f"task {i}"}, headers=auth_credentials
+        )
+        assert response.status_code == 200
+        created_ids.append(response.json()["id"])
+
+    response = await client.get("/v1/tasks/export", params={"workspace_id": workspace_id}, headers=auth_credentials)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert [task["id"] for task in response.json()] == created_ids
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_not_modified(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "etag"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    response = await client.get("/v1/tasks", params={"workspace_id": workspace_id}, headers=auth_credentials)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await client.get(
+        "/v1/tasks", params={"workspace_id": workspace_id}, headers={**auth_credentials, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    response = await client.post(
+        "/v1/tasks", params={"workspace_id": workspace_id}, json={"name": "task"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+
+    response = await client.get(
+        "/v1/tasks", params={"workspace_id": workspace_id}, headers={**auth_credentials, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_get_task_summary(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "summary"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    task_ids = []
+    for priority in ["low", "high", "high"]:
+        response = await client.post(
+            "/v1/tasks",
+            params={"workspace_id": workspace_id},
+            json={"name": "task", "priority": priority},
+            headers=auth_credentials,
+        )
+        assert response.status_code == 200
+        task_ids.append(response.json()["id"])
+
+    response = await client.delete(
+        f"/v1/tasks/{task_ids[0]}", params={"workspace_id": workspace_id}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/v1/tasks/summary", params={"workspace_id": workspace_id}, headers=auth_credentials)
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["total"] == 2
+    assert summary["by_status"] == {"open": 2}
+    assert summary["by_priority"] == {"high": 2}
+
+
+@pytest.mark.asyncio
+async def test_search_tasks(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "search"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    task_ids = {}
+    for name in ["Fix login bug", "Write docs", "login login"]:
+        response = await client.post(
+            "/v1/tasks", params={"workspace_id": workspace_id}, json={"name": name}, headers=auth_credentials
+        )
+        assert response.status_code == 200
+        task_ids[name] = response.json()["id"]
+
+    response = await client.get(
+        "/v1/tasks/search", params={"workspace_id": workspace_id, "q": "login"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    assert [task["id"] for task in response.json()["items"]] == [task_ids["login login"], task_ids["Fix login bug"]]
+
+
+@pytest.mark.asyncio
+async def test_create_tasks_bulk(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "bulk"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    response = await client.post(
+        "/v1/tasks/bulk",
+        params={"workspace_id": workspace_id},
+        json=[{"name": f"task {i}"} for i in range(10)],
+        headers=auth_credentials,
+    )
+    assert response.status_code == 200
+    task_ids = response.json()
+    assert len(task_ids) == 10
+
+    response = await client.get(
+        "/v1/tasks", params={"workspace_id": workspace_id, "sort": "oldest"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    assert [task["id"] for task in response.json()["items"]] == task_ids
+
+
+@pytest.mark.asyncio
+async def test_create_tasks_bulk_with_project_and_performer(client: AsyncClient, auth_credentials: dict):
+    response = await client.get("/v1/users/current", headers=auth_credentials)
+    assert response.status_code == 200
+    user_id = response.json()["id"]
+
+    workspace_ids = []
+    for name in ("bulk target", "bulk foreign"):
+        response = await client.post("/v1/workspaces", json={"name": name}, headers=auth_credentials)
+        assert response.status_code == 200
+        workspace_ids.append(response.json()["id"])
+    workspace_id, foreign_workspace_id = workspace_ids
+
+    project_ids = []
+    for project_workspace_id in workspace_ids:
+        response = await client.post(
+            "/v1/projects",
+            params={"workspace_id": project_workspace_id},
+            json={"name": "project"},
+            headers=auth_credentials,
+        )
+        assert response.status_code == 200
+        project_ids.append(response.json()["id"])
+    project_id, foreign_project_id = project_ids
+
+    response = await client.post(
+        "/v1/tasks/bulk",
+        params={"workspace_id": workspace_id},
+        json=[{"name": "ok", "project_id": project_id}, {"name": "foreign", "project_id": foreign_project_id}],
+        headers=auth_credentials,
+    )
+    assert response.status_code == 404
+
+    response = await client.post(
+        "/v1/tasks/bulk",
+        params={"workspace_id": workspace_id},
+        json=[{"name": "ok"}, {"name": "stranger", "performer_id": str(uuid.uuid4())}],
+        headers=auth_credentials,
+    )
+    assert response.status_code == 404
+
+    response = await client.get("/v1/tasks", params={"workspace_id": workspace_id}, headers=auth_credentials)
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+
+    response = await client.post(
+        "/v1/tasks/bulk",
+        params={"workspace_id": workspace_id},
+        json=[{"name": "assigned", "project_id": project_id, "performer_id": user_id}, {"name": "loose"}],
+        headers=auth_credentials,
+    )
+    assert response.status_code == 200
+    assigned_id, loose_id = response.json()
+
+    response = await client.get(
+        "/v1/tasks", params={"workspace_id": workspace_id, "sort": "oldest"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    assert [(task["id"], task["project_id"], task["performer_id"]) for task in response.json()["items"]] == [
+        (assigned_id, project_id, user_id),
+        (loose_id, None, None),
+    ]
+
+    response = await client.get(
+        "/v1/tasks/summary", params={"workspace_id": workspace_id, "project_id": project_id}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_transition_tasks_bulk(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "transition"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    response = await client.post(
+        "/v1/tasks/bulk",
+        params={"workspace_id": workspace_id},
+        json=[{"name": f"task {i}"} for i in range(3)],
+        headers=auth_credentials,
+    )
+    assert response.status_code == 200
+    task_ids = response.json()
+
+    response = await client.patch(
+        "/v1/tasks/bulk",
+        params={"workspace_id": workspace_id},
+        json={"task_ids": task_ids[:2], "status": "done"},
+        headers=auth_credentials,
+    )
+    assert response.status_code == 200
+    assert sorted(response.json()) == task_ids[:2]
+
+    response = await client.get(
+        "/v1/tasks", params={"workspace_id": workspace_id, "status": "done"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    assert sorted(task["id"] for task in response.json()["items"]) == task_ids[:2]
+
+
+@pytest.mark.asyncio
+async def test_edit_task_in_foreign_project(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "edit"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+    response = await client.post("/v1/workspaces", json={"name": "foreign"}, headers=auth_credentials)
+    assert response.status_code == 200
+    foreign_workspace_id = response.json()["id"]
+
+    response = await client.post(
+        "/v1/projects",
+        params={"workspace_id": foreign_workspace_id},
+        json={"name": "foreign"},
+        headers=auth_credentials,
+    )
+    assert response.status_code == 200
+    foreign_project_id = response.json()["id"]
+
+    response = await client.post(
+        "/v1/tasks", params={"workspace_id": workspace_id}, json={"name": "task"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    task = response.json()
+
+    response = await client.put(
+        f"/v1/tasks/{task['id']}",
+        params={"workspace_id": workspace_id},
+        json={
+            "name": "renamed",
+            "status": task["status"],
+            "priority": task["priority"],
+            "author_id": task["author_id"],
+            "project_id": foreign_project_id,
+        },
+        headers=auth_credentials,
+    )
+    assert response.status_code == 404
+    assert response.json()["error"] == "ProjectNotFound"
+
+    response = await client.get(
+        f"/v1/tasks/{task['id']}", params={"workspace_id": workspace_id}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    assert response.json()["name"] == "task"
+
+
+@pytest.mark.asyncio
+async def test_patch_task(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "patch"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    response = await client.post(
+        "/v1/tasks", params={"workspace_id": workspace_id}, json={"name": "task"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    task_id = response.json()["id"]
+
+    response = await client.patch(
+        f"/v1/tasks/{task_id}",
+        params={"workspace_id": workspace_id},
+        json={"description": "details", "status": "done"},
+        headers=auth_credentials,
+    )
+    assert response.status_code == 200
+    task = response.json()
+    assert (task["name"], task["description"], task["status"]) == ("task", "details", "done")
+
+    response = await client.patch(
+        f"/v1/tasks/{task_id}", params={"workspace_id": workspace_id}, json={"status": "done"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    assert response.json()["updated_at"] == task["updated_at"]
+
+    response = await client.patch(
+        f"/v1/tasks/{task_id}", params={"workspace_id": workspace_id}, json={"status": None}, headers=auth_credentials
+    )
+    assert response.status_code == 422
+
+    response = await client.patch(
+        f"/v1/tasks/{task_id}",
+        params={"workspace_id": workspace_id},
+        json={"author_id": None},
+        headers=auth_credentials,
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_patch_task_if_match(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "if-match"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    response = await client.post(
+        "/v1/tasks", params={"workspace_id": workspace_id}, json={"name": "task"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    task_id = response.json()["id"]
+
+    response = await client.get(f"/v1/tasks/{task_id}", params={"workspace_id": workspace_id}, headers=auth_credentials)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = await client.patch(
+        f"/v1/tasks/{task_id}",
+        params={"workspace_id": workspace_id},
+        json={"name": "first"},
+        headers={**auth_credentials, "If-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    response = await client.patch(
+        f"/v1/tasks/{task_id}",
+        params={"workspace_id": workspace_id},
+        json={"name": "second"},
+        headers={**auth_credentials, "If-Match": etag},
+    )
+    assert response.status_code == 412
+
+    response = await client.patch(
+        f"/v1/tasks/{task_id}",
+        params={"workspace_id": workspace_id},
+        json={"name": "second"},
+        headers={**auth_credentials, "If-Match": '"\u00b2"'.encode("latin-1")},
+    )
+    assert response.status_code == 412
+
+    response = await client.get(f"/v1/tasks/{task_id}", params={"workspace_id": workspace_id}, headers=auth_credentials)
+    assert response.status_code == 200
+    response = await client.patch(
+        f"/v1/tasks/{task_id}",
+        params={"workspace_id": workspace_id},
+        json={"name": "second"},
+        headers={**auth_credentials, "If-Match": f'{etag}, W/"9", {response.headers["ETag"]}'},
+    )
+    assert response.status_code == 200
+    assert response.json()["name"] == "second"
+
+
+@pytest.mark.asyncio
+async def test_patch_task_members(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "task members"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    user_ids = []
+    for _ in range(3):
+        username = f"t{uuid.uuid4().hex[:8]}"
+        response = await client.post(
+            "/v1/users/create",
+            json={"username": username, "email": f"{username}@planify.com", "password": "Morpheus1234!"},
+        )
+        assert response.status_code == 200
+        user_ids.append(response.json()["id"])
+    member_id, inactive_id, stranger_id = user_ids
+    for user_id in (member_id, inactive_id):
+        response = await client.post(
+            f"/v1/workspaces/{workspace_id}/members",
+            json={"user_id": user_id, "role": "editor"},
+            headers=auth_credentials,
+        )
+        assert response.status_code == 200
+    response = await client.put(
+        f"/v1/workspaces/{workspace_id}/members",
+        json={"user_id": inactive_id, "role": "editor", "active": False},
+        headers=auth_credentials,
+    )
+    assert response.status_code == 200
+
+    response = await client.post(
+        "/v1/tasks", params={"workspace_id": workspace_id}, json={"name": "task"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    task = response.json()
+
+    async def patch(changes: dict):
+        return await client.patch(
+            f"/v1/tasks/{task['id']}", params={"workspace_id": workspace_id}, json=changes, headers=auth_credentials
+        )
+
+    # one active member next to an inactive or a foreign user fails the whole check
+    for changes in (
+        {"performer_id": inactive_id},
+        {"performer_id": stranger_id},
+        {"author_id": member_id, "performer_id": stranger_id},
+    ):
+        response = await patch(changes)
+        assert response.status_code == 404
+
+    response = await patch({"name": "renamed"})
+    assert response.status_code == 200
+    assert response.json()["version"] == task["version"] + 1
+
+    response = await patch({"author_id": member_id, "performer_id": member_id})
+    assert response.status_code == 200
+    assert (response.json()["author_id"], response.json()["performer_id"]) == (member_id, member_id)
+
+    response = await patch({"performer_id": None})
+    assert response.status_code == 200
+    assert response.json()["performer_id"] is None
+
+
+@pytest.mark.asyncio
+async def test_task_exists(client: AsyncClient, auth_credentials: dict, db_provider: DbProvider):
+    workspace_ids = []
+    for name in ("exists", "exists foreign"):
+        response = await client.post("/v1/workspaces", json={"name": name}, headers=auth_credentials)
+        assert response.status_code == 200
+        workspace_ids.append(response.json()["id"])
+    workspace_id, foreign_workspace_id = workspace_ids
+
+    response = await client.post(
+        "/v1/tasks", params={"workspace_id": workspace_id}, json={"name": "exists"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    task_id = response.json()["id"]
+
+    async with db_provider.dao() as dao:
+        assert await dao.task.is_task_exists(task_id, workspace_id) is True
+        assert await dao.task.is_task_exists(task_id, foreign_workspace_id) is False
+        assert await dao.task.is_task_exists(-1, workspace_id) is False
+
+        assert await dao.task.exists() is True
+        assert await dao.task.exists(Task.name == "exists", workspace_id=workspace_id) is True
+        assert await dao.task.exists(Task.name == "exists", workspace_id=foreign_workspace_id) is False
@@ -1,3 +1,5 @@
+import uuid
+
 import pytest
 from httpx import AsyncClient
 
@@ -24,3 +26,85 @@ async def test_get_current_user(client: AsyncClient, auth_credentials: dict):
         "first_name": current_user["first_name"],
         "last_name": current_user["last_name"],
     }
+
+
+async def _create_user(client: AsyncClient, username: str) -> dict:
+    response = await client.post(
+        "/v1/users/create",
+        json={"username": username, "email": f"{username}@planify.com", "password": "Morpheus1234!"},
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+async def _search_usernames(client: AsyncClient, auth_credentials: dict, **params) -> list[str]:
+    usernames, cursor = [], None
+    while True:
+        response = await client.get(
+            "/v1/users/search", params={**params, **({"cursor": cursor} if cursor else {})}, headers=auth_credentials
+        )
+        assert response.status_code == 200
+        page = response.json()
+        usernames.extend(user["username"] for user in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return usernames
+
+
+@pytest.mark.asyncio
+async def test_search_users(client: AsyncClient, auth_credentials: dict):
+    prefix = f"s{uuid.uuid4().hex[:6]}"
+    matching = [f"{prefix}_{i}" for i in range(5)]
+    for username in [*matching, f"{prefix}x9"]:
+        await _create_user(client, username)
+
+    response = await client.get("/v1/users/search", params={"username": prefix, "limit": 2}, headers=auth_credentials)
+    assert response.status_code == 200
+    page = response.json()
+    assert set(page) == {"items", "next_cursor"}
+    assert len(page["items"]) == 2
+    assert page["next_cursor"] is not None
+
+    usernames = await _search_usernames(client, auth_credentials, username=prefix, limit=2)
+    assert len(usernames) == len(set(usernames)) == 6
+
+    # the underscore is matched literally, not as a single-character wildcard
+    usernames = await _search_usernames(client, auth_credentials, username=f"{prefix}_", limit=2)
+    assert sorted(usernames) == matching
+
+
+@pytest.mark.asyncio
+async def test_search_users_not_in_workspace(client: AsyncClient, auth_credentials: dict):
+    prefix = f"s{uuid.uuid4().hex[:6]}"
+    users = [await _create_user(client, f"{prefix}_{i}") for i in range(3)]
+
+    response = await client.post("/v1/workspaces", json={"name": "search"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+    response = await client.post(
+        f"/v1/workspaces/{workspace_id}/members",
+        json={"user_id": users[0]["id"], "role": "viewer"},
+        headers=auth_credentials,
+    )
+    assert response.status_code == 200
+
+    usernames = await _search_usernames(
+        client, auth_credentials, username=prefix, not_in_workspace_id=workspace_id, limit=1
+    )
+    assert sorted(usernames) == [users[1]["username"], users[2]["username"]]
+
+    response = await client.post(
+        "/v1/auth/login",
+        json={"username": users[1]["username"], "password": "Morpheus1234!", "fingerprint": str(uuid.uuid4())},
+    )
+    assert response.status_code == 200
+    foreign_credentials = {"Authorization": f"Bearer {response.json()['access']['token']}"}
+    response = await client.post("/v1/workspaces", json={"name": "foreign"}, headers=foreign_credentials)
+    assert response.status_code == 200
+
+    response = await client.get(
+        "/v1/users/search",
+        params={"username": prefix, "not_in_workspace_id": response.json()["id"]},
+        headers=auth_credentials,
+    )
+    assert response.status_code == 404
@@ -0,0 +1,380 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from planify import DbProvider
+from planify.core.models import dto
+from planify.core.models.enums.task import TaskPriority, TaskStatus
+from planify.core.models.enums.workspace import WorkspaceMemberRole
+from planify.core.services import workspace_member
+from planify.core.utils.exceptions import NoWorkspaceMemberFound
+
+
+@pytest.mark.asyncio
+async def test_get_workspace_changes(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "changes"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    response = await client.get(f"/v1/workspaces/{workspace_id}/changes", headers=auth_credentials)
+    assert response.status_code == 200
+    assert response.json()["reset"] is True
+    cursor = response.json()["next_cursor"]
+
+    response = await client.post(
+        "/v1/tasks/bulk",
+        params={"workspace_id": workspace_id},
+        json=[{"name": "first"}, {"name": "second"}],
+        headers=auth_credentials,
+    )
+    assert response.status_code == 200
+    first_id, second_id = response.json()
+
+    response = await client.delete(
+        f"/v1/tasks/{second_id}", params={"workspace_id": workspace_id}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+
+    response = await client.get(
+        f"/v1/workspaces/{workspace_id}/changes", params={"since": cursor, "limit": 1}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    page = response.json()
+    assert page["reset"] is False
+    assert page["has_more"] is True
+    assert [(item["entity"], item["action"]) for item in page["items"]] == [("task", "upsert")]
+    assert [task["id"] for task in page["tasks"]] == [first_id]
+
+    response = await client.get(
+        f"/v1/workspaces/{workspace_id}/changes", params={"since": page["next_cursor"]}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    page = response.json()
+    assert page["has_more"] is False
+    assert [(item["entity_id"], item["action"]) for item in page["items"]] == [
+        (str(second_id), "upsert"),
+        (str(second_id), "delete"),
+    ]
+    assert page["tasks"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_workspace_changes_of_projects_and_members(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "changes"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    response = await client.get(f"/v1/workspaces/{workspace_id}/changes", headers=auth_credentials)
+    assert response.status_code == 200
+    cursor = response.json()["next_cursor"]
+
+    username = f"c{uuid.uuid4().hex[:8]}"
+    response = await client.post(
+        "/v1/users/create",
+        json={"username": username, "email": f"{username}@planify.com", "password": "Morpheus1234!"},
+    )
+    assert response.status_code == 200
+    user_id = response.json()["id"]
+    response = await client.post(
+        f"/v1/workspaces/{workspace_id}/members", json={"user_id": user_id, "role": "viewer"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+
+    response = await client.post(
+        "/v1/projects", params={"workspace_id": workspace_id}, json={"name": "project"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    project_id = response.json()["id"]
+
+    response = await client.get(
+        f"/v1/workspaces/{workspace_id}/changes", params={"since": cursor}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    page = response.json()
+    assert [(item["entity"], item["entity_id"], item["action"]) for item in page["items"]] == [
+        ("member", user_id, "upsert"),
+        ("project", str(project_id), "upsert"),
+    ]
+    assert [member["user"]["username"] for member in page["members"]] == [username]
+    assert [project["name"] for project in page["projects"]] == ["project"]
+    cursor = page["next_cursor"]
+
+    response = await client.delete(
+        f"/v1/projects/{project_id}", params={"workspace_id": workspace_id}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+
+    response = await client.get(
+        f"/v1/workspaces/{workspace_id}/changes", params={"since": cursor}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    page = response.json()
+    assert [(item["entity"], item["entity_id"], item["action"]) for item in page["items"]] == [
+        ("project", str(project_id), "delete")
+    ]
+    assert page["projects"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_workspace_changes_after_compaction(
+    client: AsyncClient, auth_credentials: dict, db_provider: DbProvider
+):
+    response = await client.post("/v1/workspaces", json={"name": "compaction"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    response = await client.get(f"/v1/workspaces/{workspace_id}/changes", headers=auth_credentials)
+    assert response.status_code == 200
+    cursor = response.json()["next_cursor"]
+
+    response = await client.post(
+        "/v1/tasks", params={"workspace_id": workspace_id}, json={"name": "task"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    task_id = response.json()["id"]
+    for name in ("first", "second"):
+        response = await client.patch(
+            f"/v1/tasks/{task_id}", params={"workspace_id": workspace_id}, json={"name": name}, headers=auth_credentials
+        )
+        assert response.status_code == 200
+
+    async def compact(retain_since: datetime) -> None:
+        async with db_provider.dao() as dao:
+            await dao.workspace_change.compact(after_workspace_id=workspace_id - 1, limit=1, retain_since=retain_since)
+            await dao.commit()
+
+    # within the retention only the latest change of the task is kept
+    await compact(datetime.now(timezone.utc) - timedelta(days=1))
+    response = await client.get(
+        f"/v1/workspaces/{workspace_id}/changes", params={"since": cursor}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    page = response.json()
+    assert page["reset"] is False
+    assert [(item["entity_id"], item["action"]) for item in page["items"]] == [(str(task_id), "upsert")]
+    assert [task["name"] for task in page["tasks"]] == ["second"]
+
+    # past the retention the log is dropped and the old cursor has to resync
+    await compact(datetime.now(timezone.utc) + timedelta(minutes=1))
+    response = await client.get(
+        f"/v1/workspaces/{workspace_id}/changes", params={"since": cursor}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    page = response.json()
+    assert page["reset"] is True
+    assert page["items"] == []
+
+    response = await client.get(
+        f"/v1/workspaces/{workspace_id}/changes", params={"since": page["next_cursor"]}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    assert response.json()["reset"] is False
+
+
+@pytest.mark.asyncio
+async def test_membership_cache_evicted_after_commit(
+    client: AsyncClient, auth_credentials: dict, db_provider: DbProvider
+):
+    response = await client.post("/v1/workspaces", json={"name": "membership cache"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    username = f"e{uuid.uuid4().hex[:8]}"
+    response = await client.post(
+        "/v1/users/create",
+        json={"username": username, "email": f"{username}@planify.com", "password": "Morpheus1234!"},
+    )
+    assert response.status_code == 200
+    user_id = uuid.UUID(response.json()["id"])
+
+    async def get_membership() -> dto.WorkspaceMembership | None:
+        async with db_provider.dao() as reader:
+            return await reader.workspace_member.get_membership(user_id, workspace_id)
+
+    assert await get_membership() is None
+
+    async with db_provider.dao() as dao:
+        await dao.workspace_member.create(
+            dto.WorkspaceMember(
+                user_id=user_id, workspace_id=workspace_id, role=WorkspaceMemberRole.VIEWER, active=True
+            )
+        )
+        # a reader between the write and the commit still sees no member and caches that again
+        assert await get_membership() is None
+        assert db_provider.cache.workspace_member.get((user_id, workspace_id), "missing") is None
+        await dao.commit()
+
+    assert await get_membership() == dto.WorkspaceMembership(role=WorkspaceMemberRole.VIEWER, active=True)
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_memoized_reads(client: AsyncClient, auth_credentials: dict, db_provider: DbProvider):
+    response = await client.post("/v1/workspaces", json={"name": "memo"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    username = f"w{uuid.uuid4().hex[:8]}"
+    response = await client.post(
+        "/v1/users/create",
+        json={"username": username, "email": f"{username}@planify.com", "password": "Morpheus1234!"},
+    )
+    assert response.status_code == 200
+    user_id = uuid.UUID(response.json()["id"])
+
+    # one holder shares its memo between the daos, as within a request
+    async with db_provider.dao() as dao:
+        members = await dao.workspace_member.get_members(workspace_id)
+        assert await dao.workspace_member.get_members(workspace_id) is members
+        assert await dao.workspace_member.is_member(user_id, workspace_id) is False
+
+        await dao.workspace_member.create(
+            dto.WorkspaceMember(
+                user_id=user_id, workspace_id=workspace_id, role=WorkspaceMemberRole.VIEWER, active=True
+            )
+        )
+        assert [member.user_id for member in await dao.workspace_member.get_members(workspace_id)] == [
+            user_id,
+            *(member.user_id for member in members),
+        ]
+        assert await dao.workspace_member.is_member(user_id, workspace_id) is True
+        assert (await dao.workspace_member.get_member(user_id, workspace_id)).role == WorkspaceMemberRole.VIEWER
+
+        # a write through another dao clears the shared memo as well
+        await dao.task.create(
+            dto.Task(
+                id=None,
+                name="memo",
+                priority=TaskPriority.LOW,
+                status=TaskStatus.OPEN,
+                workspace_id=workspace_id,
+                author_id=user_id,
+            )
+        )
+        member = await dao.workspace_member.get_member(user_id, workspace_id)
+        assert await dao.workspace_member.get_member(user_id, workspace_id) is member
+
+        await dao.workspace_member.update(
+            dto.WorkspaceMember(
+                user_id=user_id, workspace_id=workspace_id, role=WorkspaceMemberRole.EDITOR, active=True
+            )
+        )
+        assert (await dao.workspace_member.get_member(user_id, workspace_id)).role == WorkspaceMemberRole.EDITOR
+
+
+@pytest.mark.asyncio
+async def test_patch_workspace(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "patch"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace = response.json()
+
+    response = await client.patch(f"/v1/workspaces/{workspace['id']}", json={}, headers=auth_credentials)
+    assert response.status_code == 200
+    assert response.json() == workspace
+
+    response = await client.patch(
+        f"/v1/workspaces/{workspace['id']}", json={"name": "renamed"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    renamed = response.json()
+    assert (renamed["name"], renamed["created_at"]) == ("renamed", workspace["created_at"])
+
+    response = await client.patch(
+        f"/v1/workspaces/{workspace['id']}", json={"name": "renamed"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+    assert response.json()["updated_at"] == renamed["updated_at"]
+
+    response = await client.patch(f"/v1/workspaces/{workspace['id']}", json={"name": None}, headers=auth_credentials)
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_edit_workspace_member_if_match(client: AsyncClient, auth_credentials: dict):
+    response = await client.post("/v1/workspaces", json={"name": "member if-match"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    username = f"m{uuid.uuid4().hex[:8]}"
+    response = await client.post(
+        "/v1/users/create",
+        json={"username": username, "email": f"{username}@planify.com", "password": "Morpheus1234!"},
+    )
+    assert response.status_code == 200
+    user_id = response.json()["id"]
+    response = await client.post(
+        f"/v1/workspaces/{workspace_id}/members", json={"user_id": user_id, "role": "viewer"}, headers=auth_credentials
+    )
+    assert response.status_code == 200
+
+    response = await client.get(f"/v1/workspaces/{workspace_id}/members/{user_id}", headers=auth_credentials)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = await client.put(
+        f"/v1/workspaces/{workspace_id}/members",
+        json={"user_id": user_id, "role": "editor", "active": True},
+        headers={**auth_credentials, "If-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    response = await client.put(
+        f"/v1/workspaces/{workspace_id}/members",
+        json={"user_id": user_id, "role": "admin", "active": True},
+        headers={**auth_credentials, "If-Match": etag},
+    )
+    assert response.status_code == 412
+
+    response = await client.get(f"/v1/workspaces/{workspace_id}/members/{user_id}", headers=auth_credentials)
+    assert response.status_code == 200
+    assert response.json()["role"] == "editor"
+
+
+@pytest.mark.asyncio
+async def test_get_non_members(client: AsyncClient, auth_credentials: dict, db_provider: DbProvider):
+    response = await client.get("/v1/users/current", headers=auth_credentials)
+    assert response.status_code == 200
+    owner_id = uuid.UUID(response.json()["id"])
+    response = await client.post("/v1/workspaces", json={"name": "non-members"}, headers=auth_credentials)
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+
+    user_ids = []
+    for _ in range(4):
+        username = f"n{uuid.uuid4().hex[:8]}"
+        response = await client.post(
+            "/v1/users/create",
+            json={"username": username, "email": f"{username}@planify.com", "password": "Morpheus1234!"},
+        )
+        assert response.status_code == 200
+        user_ids.append(uuid.UUID(response.json()["id"]))
+    member_id, inactive_id, stranger_id, uncached_id = user_ids
+
+    async with db_provider.dao() as dao:
+        for user_id, active in ((member_id, True), (inactive_id, False)):
+            await dao.workspace_member.create(
+                dto.WorkspaceMember(
+                    user_id=user_id, workspace_id=workspace_id, role=WorkspaceMemberRole.VIEWER, active=active
+                )
+            )
+        await dao.commit()
+
+    async with db_provider.dao() as dao:
+        assert await dao.workspace_member.get_non_members([], workspace_id) == set()
+        assert await dao.workspace_member.get_non_members(
+            [owner_id, member_id, inactive_id, stranger_id, member_id], workspace_id
+        ) == {inactive_id, stranger_id}
+
+    # the answers are cached now, the new user is still read from the database
+    async with db_provider.dao() as dao:
+        assert await dao.workspace_member.get_non_members(
+            [member_id, inactive_id, stranger_id, uncached_id], workspace_id
+        ) == {inactive_id, stranger_id, uncached_id}
+        assert await dao.workspace_member.get_non_members([owner_id, member_id], workspace_id) == set()
+
+        await workspace_member.is_members([None, owner_id, member_id], workspace_id, dao.workspace_member)
+        await workspace_member.is_members([], workspace_id, dao.workspace_member)
+        with pytest.raises(NoWorkspaceMemberFound):
+            await workspace_member.is_members([member_id, inactive_id], workspace_id, dao.workspace_member)
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from planify.api.config import HashingConfig
+from planify.api.config.hashing import HashingExecutorType
+from planify.api.utils.hashing import HashingStats, PasswordHasher
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_type", [HashingExecutorType.THREAD, HashingExecutorType.PROCESS])
+async def test_hash_and_verify_concurrently(executor_type: HashingExecutorType):
+    hasher = PasswordHasher(HashingConfig(executor_type=executor_type, max_workers=2, max_in_flight=2))
+    passwords = [f"password-{i}" for i in range(6)]
+    try:
+        hashes = await asyncio.gather(*(hasher.hash(password) for password in passwords))
+        # the first two calls take the in-flight slots, the other four wait for one
+        assert hasher.stats.peak_waiting == 4
+
+        assert len(set(hashes)) == len(passwords)
+        assert all(
+            await asyncio.gather(*(hasher.verify(password, hashed) for password, hashed in zip(passwords, hashes)))
+        )
+        assert not any(
+            await asyncio.gather(
+                *(hasher.verify(password + "!", hashed) for password, hashed in zip(passwords, hashes))
+            )
+        )
+    finally:
+        hasher.shutdown()
+
+    stats = hasher.stats
+    assert stats.in_flight == 0
+    assert stats.waiting == 0
+    assert stats.completed == 3 * len(passwords)
+
+
+@pytest.mark.asyncio
+async def test_in_flight_is_bounded():
+    hasher = PasswordHasher(HashingConfig(executor_type=HashingExecutorType.THREAD, max_workers=1, max_in_flight=3))
+    in_flight = []
+
+    async def sample():
+        while True:
+            in_flight.append(hasher.stats.in_flight)
+            await asyncio.sleep(0)
+
+    sampler = asyncio.create_task(sample())
+    try:
+        await asyncio.gather(*(hasher.hash("password") for _ in range(8)))
+    finally:
+        sampler.cancel()
+        hasher.shutdown()
+
+    assert max(in_flight) == 3
+
+
+@pytest.mark.asyncio
+async def test_collect_stats_resets_peak_waiting():
+    hasher = PasswordHasher(HashingConfig(executor_type=HashingExecutorType.THREAD, max_workers=1, max_in_flight=1))
+    try:
+        await asyncio.gather(*(hasher.hash("password") for _ in range(3)))
+    finally:
+        hasher.shutdown()
+
+    stats = hasher.collect_stats()
+    assert stats.peak_waiting == 2
+    assert stats.completed == 3
+    assert hasher.collect_stats().peak_waiting == 0
+
+
+def test_hashing_stats_queue_depth():
+    stats = HashingStats(max_workers=2, max_in_flight=4, in_flight=4, waiting=3, peak_waiting=3, completed=10)
+    # two calls sit in the executor queue behind the busy workers
+    assert stats.queue_depth == 5
+
+    stats = HashingStats(max_workers=4, max_in_flight=8, in_flight=1, waiting=0, peak_waiting=2, completed=10)
+    assert stats.queue_depth == 0
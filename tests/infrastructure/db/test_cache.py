@@ -0,0 +1,28 @@
+import time
+import uuid
+
+from planify.core.models import dto
+from planify.core.models.enums.workspace import WorkspaceMemberRole
+from planify.infrastructure.db.cache import MembershipCache
+
+
+def test_non_members_expire_first():
+    cache = MembershipCache(max_size=10, ttl=60, non_member_ttl=0.05)
+    member, non_member = (uuid.uuid4(), 1), (uuid.uuid4(), 1)
+    membership = dto.WorkspaceMembership(role=WorkspaceMemberRole.VIEWER, active=True)
+    cache.set(member, membership)
+    cache.set(non_member, None)
+
+    assert cache.get(non_member, "missing") is None
+    time.sleep(0.1)
+    assert cache.get(non_member, "missing") == "missing"
+    assert cache.get(member) == membership
+
+
+def test_explicit_ttl_overrides_non_member_ttl():
+    cache = MembershipCache(max_size=10, ttl=60, non_member_ttl=0.05)
+    key = (uuid.uuid4(), 1)
+    cache.set(key, None, ttl=60)
+
+    time.sleep(0.1)
+    assert cache.get(key, "missing") is None